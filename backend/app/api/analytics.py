@@ -0,0 +1,115 @@
+"""
+분석 API
+프로젝트별 이벤트 추이, 전환 퍼널, UTM 분석 (집계 테이블 기반)
+"""
+
+from datetime import datetime, timedelta
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_current_user_readonly
+from app.core.database import get_read_db
+from app.models.project import Project
+from app.models.user import User
+from app.schemas.analytics import (
+    AnalyticsBucket,
+    AnalyticsFunnel,
+    AnalyticsResponse,
+    UTMBreakdownItem,
+)
+from app.services.analytics import query_event_series, query_lead_total, query_utm_breakdown
+
+router = APIRouter(prefix="/api/projects", tags=["분석"])
+
+
+def _rate(numerator: int, denominator: int) -> float:
+    return round(numerator / denominator, 4) if denominator else 0.0
+
+
+@router.get("/{project_id}/analytics", response_model=AnalyticsResponse)
+async def get_project_analytics(
+    project_id: str,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+    granularity: str = Query("day", pattern="^(hour|day)$"),
+    current_user: User = Depends(get_current_user_readonly),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """
+    프로젝트 분석 조회
+
+    - 소유자만 조회 가능
+    - 기본 기간: 최근 30일
+    - 원본 이벤트가 아닌 집계 테이블에서 응답
+    """
+    # 프로젝트 소유 확인
+    project_result = await db.execute(
+        select(Project.project_id)
+        .where(Project.project_id == project_id)
+        .where(Project.owner_id == current_user.user_id)
+        .where(Project.deleted_at.is_(None))
+    )
+    if project_result.scalar_one_or_none() is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="프로젝트를 찾을 수 없습니다.",
+        )
+
+    date_to = date_to or datetime.utcnow()
+    date_from = date_from or date_to - timedelta(days=30)
+
+    if date_from > date_to:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="시작일이 종료일보다 늦을 수 없습니다.",
+        )
+
+    # 이벤트 추이
+    rows = await query_event_series(db, project_id, granularity, date_from, date_to)
+
+    series: dict[datetime, dict[str, int]] = {}
+    totals: dict[str, int] = {}
+    for bucket_start, event_type, count in rows:
+        series.setdefault(bucket_start, {})[event_type] = count
+        totals[event_type] = totals.get(event_type, 0) + count
+
+    # 전환 퍼널
+    page_view = totals.get("page_view", 0)
+    form_impression = totals.get("form_impression", 0)
+    form_submit = totals.get("form_submit", 0)
+
+    # 리드 / UTM 분석
+    lead_count = await query_lead_total(db, project_id, date_from, date_to)
+    utm_rows = await query_utm_breakdown(db, project_id, date_from, date_to)
+
+    return AnalyticsResponse(
+        project_id=project_id,
+        granularity=granularity,
+        date_from=date_from,
+        date_to=date_to,
+        totals=totals,
+        series=[
+            AnalyticsBucket(bucket_start=bucket_start, counts=counts)
+            for bucket_start, counts in series.items()
+        ],
+        funnel=AnalyticsFunnel(
+            page_view=page_view,
+            form_impression=form_impression,
+            form_submit=form_submit,
+            impression_rate=_rate(form_impression, page_view),
+            submit_rate=_rate(form_submit, form_impression),
+        ),
+        lead_count=lead_count,
+        utm=[
+            UTMBreakdownItem(
+                utm_source=utm_source,
+                utm_medium=utm_medium,
+                utm_campaign=utm_campaign,
+                lead_count=count,
+            )
+            for utm_source, utm_medium, utm_campaign, count in utm_rows
+        ],
+    )
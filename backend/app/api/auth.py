@@ -4,31 +4,64 @@
 """
 
 from datetime import datetime
+from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_user
-from app.core.database import get_db
-from app.core.security import create_access_token, get_password_hash, verify_password
+from app.core.database import get_read_db
+from app.core.db_writer import db_writer
+from app.core.security import PasswordHasherBusyError, create_access_token, password_hasher
 from app.models.user import User
 from app.schemas.user import TokenResponse, UserCreate, UserLogin, UserResponse
+from app.services.user_cache import invalidate_user
 from app.services.webhook import send_discord_signup_notification
 
 router = APIRouter(prefix="/api/auth", tags=["인증"])
 
 
+def _hashing_busy() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="요청이 많습니다. 잠시 후 다시 시도해주세요.",
+        headers={"Retry-After": "1"},
+    )
+
+
+async def _hash_password(password: str) -> str:
+    """해싱 전용 스레드 풀에서 비밀번호 해시 생성"""
+    try:
+        return await password_hasher.hash(password)
+    except PasswordHasherBusyError:
+        raise _hashing_busy()
+
+
+async def _verify_password(password: str, password_hash: str) -> tuple[bool, Optional[str]]:
+    """해싱 전용 스레드 풀에서 비밀번호 검증 (cost 변경 시 새 해시 반환)"""
+    try:
+        return await password_hasher.verify_and_update(password, password_hash)
+    except PasswordHasherBusyError:
+        raise _hashing_busy()
+
+
+def token_claims(user: User) -> dict:
+    """액세스 토큰 클레임 (email/name 은 AUTH_TRUST_TOKEN_CLAIMS 조회 전용 인증에 사용)"""
+    return {"sub": user.user_id, "email": user.email, "name": user.name}
+
+
 @router.post("/register", response_model=TokenResponse, status_code=status.HTTP_201_CREATED)
 async def register(
     user_data: UserCreate,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     사용자 회원가입
 
     - 이메일 중복 확인
-    - 비밀번호 해싱
+    - 비밀번호 해싱 (전용 스레드 풀)
     - JWT 토큰 발급
     """
     # 이메일 중복 확인
@@ -44,13 +77,21 @@ async def register(
     # 사용자 생성
     user = User(
         email=user_data.email,
-        password_hash=get_password_hash(user_data.password),
+        password_hash=await _hash_password(user_data.password),
         name=user_data.name,
     )
 
-    db.add(user)
-    await db.commit()
-    await db.refresh(user)
+    async def write(session: AsyncSession) -> None:
+        session.add(user)
+
+    try:
+        await db_writer.run(write)
+    except IntegrityError:
+        # 동시 가입 요청으로 인한 이메일 중복
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="이미 가입된 이메일입니다.",
+        )
 
     # Discord 알림 전송 (백그라운드, 실패해도 가입은 완료)
     try:
@@ -62,7 +103,7 @@ async def register(
         pass  # 알림 실패해도 가입 프로세스에 영향 없음
 
     # JWT 토큰 생성
-    access_token = create_access_token(data={"sub": user.user_id})
+    access_token = create_access_token(data=token_claims(user))
 
     return TokenResponse(
         user_id=user.user_id,
@@ -75,30 +116,41 @@ async def register(
 @router.post("/login", response_model=TokenResponse)
 async def login(
     login_data: UserLogin,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     사용자 로그인
 
-    - 이메일/비밀번호 확인
+    - 이메일/비밀번호 확인 (전용 스레드 풀, cost 변경 시 재해싱)
     - JWT 토큰 발급
     """
     # 사용자 조회
     result = await db.execute(select(User).where(User.email == login_data.email))
     user = result.scalar_one_or_none()
 
-    if user is None or not verify_password(login_data.password, user.password_hash):
+    verified, new_hash = (False, None)
+    if user is not None:
+        verified, new_hash = await _verify_password(login_data.password, user.password_hash)
+
+    if not verified:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="이메일 또는 비밀번호가 올바르지 않습니다.",
         )
 
-    # 마지막 로그인 시간 업데이트
-    user.last_login_at = datetime.utcnow()
-    await db.commit()
+    # 마지막 로그인 시간 업데이트 (bcrypt cost 가 바뀐 해시는 재해싱하여 저장)
+    values = {"last_login_at": datetime.utcnow()}
+    if new_hash is not None:
+        values["password_hash"] = new_hash
+
+    async def write(session: AsyncSession) -> None:
+        await session.execute(update(User).where(User.user_id == user.user_id).values(**values))
+
+    await db_writer.run(write)
+    await invalidate_user(user.user_id)
 
     # JWT 토큰 생성
-    access_token = create_access_token(data={"sub": user.user_id})
+    access_token = create_access_token(data=token_claims(user))
 
     return TokenResponse(
         user_id=user.user_id,
@@ -8,7 +8,8 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, delete
 
-from app.core.database import get_db
+from app.core.database import get_read_db
+from app.core.db_writer import db_writer
 from app.models.user import User
 from app.models.project import Project
 from app.models.bookmark import Bookmark, BookmarkFolder
@@ -24,7 +25,7 @@ from app.schemas.bookmark import (
     BookmarkFolderListResponse,
     BookmarkCheckResponse,
 )
-from app.api.deps import get_current_user, get_current_user_optional
+from app.api.deps import get_current_user, get_current_user_readonly, get_current_user_optional
 
 router = APIRouter(prefix="/api/bookmarks", tags=["북마크"])
 
@@ -33,8 +34,8 @@ router = APIRouter(prefix="/api/bookmarks", tags=["북마크"])
 
 @router.get("/folders", response_model=BookmarkFolderListResponse)
 async def list_folders(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user_readonly),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """폴더 목록 조회"""
     # 폴더 조회 with 북마크 수
@@ -69,26 +70,27 @@ async def list_folders(
 async def create_folder(
     folder_data: BookmarkFolderCreate,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
 ):
     """폴더 생성"""
-    # 최대 order_index 조회
-    result = await db.execute(
-        select(func.max(BookmarkFolder.order_index))
-        .where(BookmarkFolder.user_id == current_user.user_id)
-    )
-    max_order = result.scalar() or 0
+    async def write(session: AsyncSession) -> BookmarkFolder:
+        # 최대 order_index 조회 (같은 writer 트랜잭션에서 조회해 순서 중복 방지)
+        result = await session.execute(
+            select(func.max(BookmarkFolder.order_index))
+            .where(BookmarkFolder.user_id == current_user.user_id)
+        )
+        max_order = result.scalar() or 0
 
-    folder = BookmarkFolder(
-        user_id=current_user.user_id,
-        name=folder_data.name,
-        description=folder_data.description,
-        order_index=max_order + 1,
-    )
+        folder = BookmarkFolder(
+            user_id=current_user.user_id,
+            name=folder_data.name,
+            description=folder_data.description,
+            order_index=max_order + 1,
+        )
+        session.add(folder)
+        return folder
 
-    db.add(folder)
-    await db.commit()
-    await db.refresh(folder)
+    # 기본값은 모두 Python 측이므로 refresh 하지 않음
+    folder = await db_writer.run(write)
 
     return BookmarkFolderResponse(
         folder_id=folder.folder_id,
@@ -105,36 +107,40 @@ async def update_folder(
     folder_id: str,
     folder_data: BookmarkFolderUpdate,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
 ):
     """폴더 수정"""
-    result = await db.execute(
-        select(BookmarkFolder)
-        .where(BookmarkFolder.folder_id == folder_id)
-        .where(BookmarkFolder.user_id == current_user.user_id)
-    )
-    folder = result.scalar_one_or_none()
+    update_data = folder_data.model_dump(exclude_unset=True)
 
-    if folder is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="폴더를 찾을 수 없습니다.",
+    async def write(session: AsyncSession):
+        # 폴더 조회 with 북마크 수 (수정은 북마크 수에 영향 없음)
+        result = await session.execute(
+            select(
+                BookmarkFolder,
+                func.count(Bookmark.bookmark_id).label("bookmark_count")
+            )
+            .outerjoin(Bookmark, BookmarkFolder.folder_id == Bookmark.folder_id)
+            .where(BookmarkFolder.folder_id == folder_id)
+            .where(BookmarkFolder.user_id == current_user.user_id)
+            .group_by(BookmarkFolder.folder_id)
         )
+        row = result.first()
+        if row is None:
+            return None
 
-    update_data = folder_data.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        if value is not None:
-            setattr(folder, field, value)
+        for field, value in update_data.items():
+            if value is not None:
+                setattr(row[0], field, value)
+        return row
 
-    await db.commit()
-    await db.refresh(folder)
+    # 응답 필드는 모두 메모리에 있으므로 refresh 하지 않음 (expire_on_commit=False)
+    row = await db_writer.run(write)
 
-    # 북마크 수 조회
-    count_result = await db.execute(
-        select(func.count(Bookmark.bookmark_id))
-        .where(Bookmark.folder_id == folder_id)
-    )
-    bookmark_count = count_result.scalar() or 0
+    if row is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="폴더를 찾을 수 없습니다.",
+        )
+    folder, bookmark_count = row
 
     return BookmarkFolderResponse(
         folder_id=folder.folder_id,
@@ -150,42 +156,53 @@ async def update_folder(
 async def delete_folder(
     folder_id: str,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
 ):
     """폴더 삭제 (북마크는 기본 폴더로 이동)"""
-    result = await db.execute(
-        select(BookmarkFolder)
-        .where(BookmarkFolder.folder_id == folder_id)
-        .where(BookmarkFolder.user_id == current_user.user_id)
-    )
-    folder = result.scalar_one_or_none()
+    async def write(session: AsyncSession) -> bool:
+        result = await session.execute(
+            select(BookmarkFolder)
+            .where(BookmarkFolder.folder_id == folder_id)
+            .where(BookmarkFolder.user_id == current_user.user_id)
+        )
+        folder = result.scalar_one_or_none()
+        if folder is None:
+            return False
+
+        # 해당 폴더의 북마크는 folder_id를 null로 설정 (기본 폴더로 이동)
+        await session.execute(
+            Bookmark.__table__.update()
+            .where(Bookmark.folder_id == folder_id)
+            .values(folder_id=None)
+        )
+
+        await session.delete(folder)
+        return True
 
-    if folder is None:
+    if not await db_writer.run(write):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="폴더를 찾을 수 없습니다.",
         )
 
-    # 해당 폴더의 북마크는 folder_id를 null로 설정 (기본 폴더로 이동)
-    await db.execute(
-        Bookmark.__table__.update()
-        .where(Bookmark.folder_id == folder_id)
-        .values(folder_id=None)
-    )
-
-    await db.delete(folder)
-    await db.commit()
-
     return {"success": True}
 
 
 # ============ 북마크 API ============
 
+async def _delete_bookmark(*conditions) -> bool:
+    """조건에 맞는 북마크 삭제 (단일 writer, 삭제 여부 반환)"""
+    async def write(session: AsyncSession) -> bool:
+        result = await session.execute(delete(Bookmark).where(*conditions))
+        return result.rowcount > 0
+
+    return await db_writer.run(write)
+
+
 @router.get("", response_model=BookmarkListResponse)
 async def list_bookmarks(
     folder_id: Optional[str] = None,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user_readonly),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """북마크 목록 조회"""
     query = (
@@ -229,7 +246,7 @@ async def list_bookmarks(
 async def create_bookmark(
     bookmark_data: BookmarkCreate,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """북마크 추가"""
     # 프로젝트 존재 확인
@@ -279,9 +296,11 @@ async def create_bookmark(
         memo=bookmark_data.memo,
     )
 
-    db.add(bookmark)
-    await db.commit()
-    await db.refresh(bookmark)
+    async def write(session: AsyncSession) -> None:
+        session.add(bookmark)
+
+    # 기본값은 모두 Python 측이므로 refresh 하지 않음
+    await db_writer.run(write)
 
     return BookmarkResponse(
         bookmark_id=bookmark.bookmark_id,
@@ -302,7 +321,7 @@ async def create_bookmark(
 async def check_bookmark(
     project_id: str,
     current_user: Optional[User] = Depends(get_current_user_optional),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """북마크 여부 확인"""
     if current_user is None:
@@ -330,7 +349,7 @@ async def update_bookmark(
     bookmark_id: str,
     bookmark_data: BookmarkUpdate,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """북마크 수정 (폴더 이동, 이름 변경, 메모 수정)"""
     result = await db.execute(
@@ -363,11 +382,22 @@ async def update_bookmark(
             )
 
     update_data = bookmark_data.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(bookmark, field, value)
 
-    await db.commit()
-    await db.refresh(bookmark)
+    async def write(session: AsyncSession) -> Optional[Bookmark]:
+        target = await session.get(Bookmark, bookmark.bookmark_id)
+        if target is None:
+            return None
+        for field, value in update_data.items():
+            setattr(target, field, value)
+        return target
+
+    bookmark = await db_writer.run(write)
+
+    if bookmark is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="북마크를 찾을 수 없습니다.",
+        )
 
     return BookmarkResponse(
         bookmark_id=bookmark.bookmark_id,
@@ -388,25 +418,18 @@ async def update_bookmark(
 async def delete_bookmark(
     bookmark_id: str,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
 ):
     """북마크 삭제"""
-    result = await db.execute(
-        select(Bookmark)
-        .where(Bookmark.bookmark_id == bookmark_id)
-        .where(Bookmark.user_id == current_user.user_id)
+    deleted = await _delete_bookmark(
+        Bookmark.bookmark_id == bookmark_id, Bookmark.user_id == current_user.user_id
     )
-    bookmark = result.scalar_one_or_none()
 
-    if bookmark is None:
+    if not deleted:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="북마크를 찾을 수 없습니다.",
         )
 
-    await db.delete(bookmark)
-    await db.commit()
-
     return {"success": True}
 
 
@@ -414,23 +437,16 @@ async def delete_bookmark(
 async def delete_bookmark_by_project(
     project_id: str,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
 ):
     """프로젝트 ID로 북마크 삭제"""
-    result = await db.execute(
-        select(Bookmark)
-        .where(Bookmark.user_id == current_user.user_id)
-        .where(Bookmark.project_id == project_id)
+    deleted = await _delete_bookmark(
+        Bookmark.user_id == current_user.user_id, Bookmark.project_id == project_id
     )
-    bookmark = result.scalar_one_or_none()
 
-    if bookmark is None:
+    if not deleted:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="북마크를 찾을 수 없습니다.",
         )
 
-    await db.delete(bookmark)
-    await db.commit()
-
     return {"success": True}
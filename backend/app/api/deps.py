@@ -3,27 +3,45 @@ API 의존성
 인증, 데이터베이스 세션 등 공통 의존성
 """
 
+import hmac
+import ipaddress
 from typing import Optional
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
 
-from app.core.database import get_db
+from app.core.config import settings
+from app.core.database import get_read_db
 from app.core.security import decode_access_token
 from app.models.user import User
+from app.services.user_cache import get_user
 
 # HTTP Bearer 인증 스키마
 security = HTTPBearer()
 
 
+def _token_payload(credentials: HTTPAuthorizationCredentials) -> dict:
+    """Bearer 토큰 검증 후 클레임 반환 (sub 필수)"""
+    payload = decode_access_token(credentials.credentials)
+    if payload is None or payload.get("sub") is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="유효하지 않은 토큰입니다.",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return payload
+
+
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> User:
     """
     현재 인증된 사용자 반환
 
+    사용자 정보는 짧은 TTL 캐시를 거쳐 조회한다. 반환된 User 는 세션에 속하지 않을 수 있으므로
+    수정이 필요하면 user_id 로 다시 조회해야 한다.
+
     Args:
         credentials: Bearer 토큰
         db: 데이터베이스 세션
@@ -34,27 +52,10 @@ async def get_current_user(
     Raises:
         HTTPException: 인증 실패 시
     """
-    token = credentials.credentials
-
-    payload = decode_access_token(token)
-    if payload is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="유효하지 않은 토큰입니다.",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-
-    user_id: str = payload.get("sub")
-    if user_id is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="유효하지 않은 토큰입니다.",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+    payload = _token_payload(credentials)
 
-    # 사용자 조회
-    result = await db.execute(select(User).where(User.user_id == user_id))
-    user = result.scalar_one_or_none()
+    # 사용자 조회 (캐시 → DB)
+    user = await get_user(db, payload["sub"])
 
     if user is None:
         raise HTTPException(
@@ -66,11 +67,29 @@ async def get_current_user(
     return user
 
 
+async def get_current_user_readonly(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_read_db),
+) -> User:
+    """
+    현재 인증된 사용자 반환 (조회 전용 API 용)
+
+    AUTH_TRUST_TOKEN_CLAIMS 가 켜져 있으면 서명된 토큰 클레임(sub, email, name)만으로
+    사용자를 구성한다 (DB/캐시 조회 없음). 클레임이 없는 이전 토큰은 get_current_user 와 동일.
+    """
+    payload = _token_payload(credentials)
+
+    if settings.AUTH_TRUST_TOKEN_CLAIMS and payload.get("email"):
+        return User(user_id=payload["sub"], email=payload["email"], name=payload.get("name"))
+
+    return await get_current_user(credentials, db)
+
+
 async def get_current_user_optional(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(
         HTTPBearer(auto_error=False)
     ),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> Optional[User]:
     """
     현재 인증된 사용자 반환 (선택적)
@@ -86,7 +105,27 @@ async def get_current_user_optional(
         return None
 
 
+async def require_monitoring_access(request: Request) -> None:
+    """
+    운영 통계(/metrics, /health/*) 접근 확인
 
-
-
-
+    - MONITORING_TOKEN 설정 시 Authorization: Bearer <토큰> 필수
+    - 미설정 시 프록시를 거치지 않은(X-Forwarded-For 없는) localhost 요청만 허용
+    """
+    if settings.MONITORING_TOKEN:
+        scheme, _, token = request.headers.get("authorization", "").partition(" ")
+        if scheme.lower() == "bearer" and hmac.compare_digest(
+            token.strip().encode("utf-8"), settings.MONITORING_TOKEN.encode("utf-8")
+        ):
+            return
+    elif request.client is not None and "x-forwarded-for" not in request.headers:
+        try:
+            if ipaddress.ip_address(request.client.host).is_loopback:
+                return
+        except ValueError:
+            pass
+
+    raise HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail="운영 통계에 접근할 권한이 없습니다.",
+    )
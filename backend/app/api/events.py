@@ -3,29 +3,59 @@
 사용자 행동 이벤트 로깅
 """
 
-from fastapi import APIRouter, Depends, Request
-from sqlalchemy.ext.asyncio import AsyncSession
+from collections import Counter
 
-from app.core.database import get_db
-from app.models.event_log import EventLog
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+
+from app.core.config import settings
+from app.core.rate_limit import rate_limit, check_project_budget
 from app.schemas.event import EventCreate, EventBatchCreate, EventResponse
+from app.services.event_buffer import event_buffer, make_event_row
+from app.services.ingest_profile import get_ingest_profile
+
+router = APIRouter(
+    prefix="/api/events",
+    tags=["이벤트"],
+    dependencies=[Depends(rate_limit("events", "RATE_LIMIT_EVENTS_PER_MINUTE"))],
+)
+
+
+async def _ensure_project(project_id: str) -> None:
+    """활성 프로젝트인지 확인 (수집 프로필 캐시, 없으면 404)"""
+    if await get_ingest_profile(project_id) is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="프로젝트를 찾을 수 없습니다.",
+        )
+
 
-router = APIRouter(prefix="/api/events", tags=["이벤트"])
+def _reject_if_full(accepted: bool) -> None:
+    """버퍼가 가득 찬 경우 429 반환"""
+    if not accepted:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="이벤트 요청이 많습니다. 잠시 후 다시 시도해주세요.",
+            headers={"Retry-After": "1"},
+        )
 
 
 @router.post("", response_model=EventResponse)
 async def create_event(
     event_data: EventCreate,
     request: Request,
-    db: AsyncSession = Depends(get_db),
 ):
     """
     이벤트 생성
 
     - 공개 API (인증 불필요)
     - 사용자 행동 추적용
+    - 버퍼에 적재 후 즉시 반환 (일괄 저장)
+    - 존재하지 않는 프로젝트면 404
     """
-    event = EventLog(
+    await _ensure_project(event_data.project_id)
+    await check_project_budget("events", event_data.project_id, settings.RATE_LIMIT_PROJECT_EVENTS_PER_MINUTE)
+
+    row = make_event_row(
         event_type=event_data.event_type,
         project_id=event_data.project_id,
         data=event_data.data,
@@ -33,8 +63,7 @@ async def create_event(
         ip_address=request.client.host if request.client else None,
     )
 
-    db.add(event)
-    await db.commit()
+    _reject_if_full(event_buffer.offer([row]))
 
     return EventResponse(success=True)
 
@@ -43,19 +72,26 @@ async def create_event(
 async def create_events_batch(
     batch_data: EventBatchCreate,
     request: Request,
-    db: AsyncSession = Depends(get_db),
 ):
     """
     이벤트 배치 생성
 
     - 공개 API (인증 불필요)
-    - 여러 이벤트 한 번에 저장
+    - 여러 이벤트 한 번에 적재
+    - 프로젝트별 제한은 이벤트 개수만큼 차감
+    - 존재하지 않는 프로젝트가 하나라도 있으면 전체 거부 (404)
     """
+    project_counts = Counter(event.project_id for event in batch_data.events)
+    for project_id in project_counts:
+        await _ensure_project(project_id)
+    for project_id, count in project_counts.items():
+        await check_project_budget("events", project_id, settings.RATE_LIMIT_PROJECT_EVENTS_PER_MINUTE, count)
+
     user_agent = request.headers.get("user-agent")
     ip_address = request.client.host if request.client else None
 
-    events = [
-        EventLog(
+    rows = [
+        make_event_row(
             event_type=event.event_type,
             project_id=event.project_id,
             data=event.data,
@@ -65,13 +101,6 @@ async def create_events_batch(
         for event in batch_data.events
     ]
 
-    db.add_all(events)
-    await db.commit()
+    _reject_if_full(event_buffer.offer(rows))
 
     return EventResponse(success=True)
-
-
-
-
-
-
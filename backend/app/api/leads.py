@@ -3,48 +3,66 @@
 리드 수집, 목록 조회, CSV 내보내기
 """
 
-import csv
-import io
-from datetime import datetime
+import base64
+from datetime import datetime, timedelta
 from typing import Optional
+from uuid import uuid4
 from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
 from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy import select, func, or_, and_
 
-from app.core.database import get_db
+from app.core.config import settings
+from app.core.database import get_read_db
+from app.core.db_writer import db_writer
+from app.core.rate_limit import rate_limit, check_project_budget
+from app.core.security import create_unlock_token, verify_unlock_token
 from app.models.user import User
 from app.models.project import Project
 from app.models.lead import Lead
-from app.schemas.lead import LeadCreate, LeadResponse, LeadListResponse, LeadCreateResponse
-from app.api.deps import get_current_user
-from app.services.webhook import send_webhook, send_discord_webhook
+from app.schemas.lead import (
+    LeadCreate,
+    LeadResponse,
+    LeadListResponse,
+    LeadCreateResponse,
+    LeadImportResponse,
+)
+from app.api.deps import get_current_user, get_current_user_readonly
+from app.services.webhook_outbox import enqueue_lead_webhooks, webhook_dispatcher
+from app.services.project_stats import record_lead, get_lead_count
+from app.services.analytics import rollup_leads
+from app.services.lead_export import stream_leads_csv, gzip_stream
+from app.services.lead_search import apply_lead_search
+from app.services.lead_import import import_leads, LeadImportFormatError
+from app.services.lead_ingest import upsert_lead
+from app.services.ingest_profile import get_ingest_profile
 
 router = APIRouter(prefix="/api", tags=["리드"])
 
 
-@router.post("/leads", response_model=LeadCreateResponse, status_code=status.HTTP_201_CREATED)
+@router.post(
+    "/leads",
+    response_model=LeadCreateResponse,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(rate_limit("leads", "RATE_LIMIT_LEADS_PER_MINUTE"))],
+)
 async def create_lead(
     lead_data: LeadCreate,
     request: Request,
-    db: AsyncSession = Depends(get_db),
 ):
     """
     리드 생성 (폼 제출)
 
     - 공개 API (인증 불필요)
-    - 프로젝트 유효성 확인
-    - 중복 이메일 처리 (중복 시 기존 리드 반환)
-    - Webhook 전송
+    - 프로젝트 유효성 확인 (수집 프로필 캐시, projects 테이블 조회 없음)
+    - 중복 이메일 처리 (INSERT ... ON CONFLICT 한 번으로 저장 또는 기존 리드 반환)
+    - Webhook 전송 건 기록 (백그라운드 전송)
+    - IP별/프로젝트별 분당 제출 수 제한 (초과 시 429)
+    - 언락 토큰 발급 (프론트엔드는 토큰의 프로젝트/만료로 언락 상태 확인)
+    - 같은 이메일로 받은 유효한 unlock_token 과 함께 제출하면 저장 없이 already_unlocked 응답 (DB 조회/쓰기 없음)
     """
-    # 프로젝트 조회
-    result = await db.execute(
-        select(Project)
-        .where(Project.project_id == lead_data.project_id)
-        .where(Project.deleted_at.is_(None))
-    )
-    project = result.scalar_one_or_none()
+    # 프로젝트 확인 (수집 프로필 캐시)
+    project = await get_ingest_profile(lead_data.project_id)
 
     if project is None:
         raise HTTPException(
@@ -52,112 +70,74 @@ async def create_lead(
             detail="프로젝트를 찾을 수 없습니다.",
         )
 
-    # 중복 검증 키 생성
     dedupe_key = Lead.generate_dedupe_key(lead_data.email, lead_data.project_id)
 
-    # 이미 존재하는 리드인지 확인
-    existing_result = await db.execute(
-        select(Lead).where(Lead.dedupe_key == dedupe_key)
-    )
-    existing_lead = existing_result.scalar_one_or_none()
-
-    if existing_lead:
-        # 이미 존재하는 리드 - 해제된 상태로 반환
-        return LeadCreateResponse(
-            lead_id=existing_lead.lead_id,
-            success=True,
-            unlocked=True,
-            already_unlocked=True,
-        )
-
-    # 리드 생성
-    lead = Lead(
-        project_id=lead_data.project_id,
-        email=lead_data.email,
-        name=lead_data.name,
-        company=lead_data.company,
-        role=lead_data.role,
-        consent_privacy=lead_data.consent_privacy,
-        consent_marketing=lead_data.consent_marketing,
-        source_utm=lead_data.utm_params.model_dump() if lead_data.utm_params else None,
-        form_location=lead_data.form_location,
-        user_agent=request.headers.get("user-agent"),
-        ip_address=request.client.host if request.client else None,
-        dedupe_key=dedupe_key,
-    )
-
-    try:
-        db.add(lead)
-        await db.commit()
-        await db.refresh(lead)
-    except IntegrityError:
-        # 동시 요청으로 인한 중복 시
-        await db.rollback()
-        existing_result = await db.execute(
-            select(Lead).where(Lead.dedupe_key == dedupe_key)
-        )
-        existing_lead = existing_result.scalar_one_or_none()
-        if existing_lead:
+    # 이미 언락한 같은 리드 (서명/프로젝트/만료/리드 태그를 메모리에서 확인)
+    # 다른 이메일이면 토큰과 무관하게 아래 저장 경로로 진행
+    if lead_data.unlock_token:
+        claims = verify_unlock_token(lead_data.unlock_token, project.project_id, dedupe_key)
+        if claims is not None:
             return LeadCreateResponse(
-                lead_id=existing_lead.lead_id,
+                lead_id=claims["lead_id"],
                 success=True,
                 unlocked=True,
                 already_unlocked=True,
+                unlock_token=lead_data.unlock_token,
+                unlock_expires_at=claims["expires_at"],
             )
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="리드 생성 중 오류가 발생했습니다.",
-        )
-
-    # Webhook 전송 (비동기, 실패해도 에러 반환 안함)
-    if project.webhook_url:
-        await send_webhook(
-            project.webhook_url,
-            {
-                "event": "lead_created",
-                "lead": {
-                    "lead_id": lead.lead_id,
-                    "email": lead.email,
-                    "name": lead.name,
-                    "company": lead.company,
-                    "role": lead.role,
-                    "consent_privacy": lead.consent_privacy,
-                    "consent_marketing": lead.consent_marketing,
-                    "source_utm": lead.source_utm,
-                    "created_at": lead.created_at.isoformat(),
-                },
-                "project_id": project.project_id,
-            },
-        )
-
-    # Slack Webhook 전송
-    if project.slack_webhook_url:
-        await send_webhook(
-            project.slack_webhook_url,
-            {
-                "text": f"🎉 새로운 리드가 수집되었습니다!\n\n*이메일*: {lead.email}\n*이름*: {lead.name or '-'}\n*회사*: {lead.company or '-'}\n*직무*: {lead.role or '-'}",
-            },
-        )
 
-    # Discord Webhook 전송
-    if project.discord_webhook_url:
-        await send_discord_webhook(
-            project.discord_webhook_url,
-            {
-                "email": lead.email,
-                "name": lead.name,
-                "company": lead.company,
-                "role": lead.role,
-                "created_at": lead.created_at.isoformat(),
-            },
-            project_name=project.name,
-        )
+    await check_project_budget("leads", lead_data.project_id, settings.RATE_LIMIT_PROJECT_LEADS_PER_MINUTE)
+
+    # 리드 행 (lead_id/created_at 을 미리 정해 INSERT 결과와 비교)
+    row = {
+        "lead_id": str(uuid4()),
+        "project_id": lead_data.project_id,
+        "email": lead_data.email,
+        "name": lead_data.name,
+        "company": lead_data.company,
+        "role": lead_data.role,
+        "consent_privacy": lead_data.consent_privacy,
+        "consent_marketing": lead_data.consent_marketing,
+        "source_utm": lead_data.utm_params.model_dump() if lead_data.utm_params else None,
+        "form_location": lead_data.form_location,
+        "user_agent": request.headers.get("user-agent"),
+        "ip_address": request.client.host if request.client else None,
+        "dedupe_key": dedupe_key,
+        "created_at": datetime.utcnow(),
+    }
+
+    async def write(session: AsyncSession) -> tuple[str, bool]:
+        # 저장 또는 기존 리드 조회 (1회 왕복)
+        lead_id, created = await upsert_lead(session, row)
+        if not created:
+            return lead_id, False
+
+        # 프로젝트 집계 카운터 (같은 트랜잭션)
+        await record_lead(session, row["project_id"], row["created_at"])
+        # 분석 집계 (같은 트랜잭션)
+        await rollup_leads(session, [row])
+        # Webhook 전송 건 기록 (같은 트랜잭션)
+        enqueue_lead_webhooks(session, project, Lead(**row))
+        return lead_id, True
+
+    # 단일 writer 를 통해 저장 (SQLite 에서는 다른 쓰기와 묶어 커밋)
+    lead_id, created = await db_writer.run(write, isolated=False)
+
+    if created:
+        # Webhook 은 아웃박스 워커가 전송 (요청 지연과 무관)
+        webhook_dispatcher.notify()
+
+    unlock_token, unlock_expires_at = create_unlock_token(
+        project.project_id, lead_id, dedupe_key, timedelta(days=project.unlock_duration)
+    )
 
     return LeadCreateResponse(
-        lead_id=lead.lead_id,
+        lead_id=lead_id,
         success=True,
         unlocked=True,
-        already_unlocked=False,
+        already_unlocked=not created,
+        unlock_token=unlock_token,
+        unlock_expires_at=unlock_expires_at,
     )
 
 
@@ -166,17 +146,21 @@ async def list_leads(
     project_id: str,
     page: int = Query(1, ge=1),
     limit: int = Query(50, ge=1, le=100),
+    cursor: Optional[str] = None,
     search: Optional[str] = None,
     date_from: Optional[datetime] = None,
     date_to: Optional[datetime] = None,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user_readonly),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     프로젝트의 리드 목록 조회
 
     - 소유자만 조회 가능
     - 검색/필터/페이지네이션 지원
+    - 검색은 전문 검색 인덱스 사용, 결과는 관련도 순
+    - cursor 를 주면 (created_at, lead_id) 기준 키셋 페이지네이션 (page 무시, 검색 시 미지원)
+    - 필터가 없으면 전체 개수는 집계 테이블에서 조회
     """
     # 프로젝트 소유 확인
     project_result = await db.execute(
@@ -196,14 +180,10 @@ async def list_leads(
     # 쿼리 구성
     query = select(Lead).where(Lead.project_id == project_id)
 
-    # 검색
+    # 검색 (관련도 순)
+    search_order = None
     if search:
-        search_pattern = f"%{search}%"
-        query = query.where(
-            (Lead.email.ilike(search_pattern))
-            | (Lead.name.ilike(search_pattern))
-            | (Lead.company.ilike(search_pattern))
-        )
+        query, search_order = apply_lead_search(query, db.bind.dialect.name, project_id, search)
 
     # 날짜 필터
     if date_from:
@@ -211,37 +191,77 @@ async def list_leads(
     if date_to:
         query = query.where(Lead.created_at <= date_to)
 
-    # 전체 개수
-    count_query = select(func.count()).select_from(query.subquery())
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
-
-    # 페이지네이션
-    offset = (page - 1) * limit
-    query = query.order_by(Lead.created_at.desc()).offset(offset).limit(limit)
+    # 전체 개수 (필터가 없으면 집계 테이블 사용)
+    if search or date_from or date_to:
+        count_query = select(func.count()).select_from(query.subquery())
+        total_result = await db.execute(count_query)
+        total = total_result.scalar() or 0
+    else:
+        total = await get_lead_count(db, project_id)
+
+    # 페이지네이션 (ix_leads_project_created 인덱스 순서, 검색 시에는 관련도 순 + page)
+    if search_order is not None:
+        query = query.order_by(*search_order).offset((page - 1) * limit)
+    elif cursor:
+        query = query.order_by(Lead.created_at.desc(), Lead.lead_id)
+        cursor_created_at, cursor_lead_id = _decode_cursor(cursor)
+        query = query.where(
+            or_(
+                Lead.created_at < cursor_created_at,
+                and_(Lead.created_at == cursor_created_at, Lead.lead_id > cursor_lead_id),
+            )
+        )
+    else:
+        query = query.order_by(Lead.created_at.desc(), Lead.lead_id).offset((page - 1) * limit)
 
-    result = await db.execute(query)
+    # 다음 페이지 존재 여부 확인용으로 1건 더 조회
+    result = await db.execute(query.limit(limit + 1))
     leads = result.scalars().all()
+    has_more = len(leads) > limit
+    leads = leads[:limit]
 
     return LeadListResponse(
         leads=[LeadResponse.model_validate(lead) for lead in leads],
         total=total,
         page=page,
         limit=limit,
+        next_cursor=_encode_cursor(leads[-1]) if has_more and search_order is None else None,
     )
 
 
+def _encode_cursor(lead: Lead) -> str:
+    """키셋 커서 생성 (created_at|lead_id 의 base64)"""
+    raw = f"{lead.created_at.isoformat()}|{lead.lead_id}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, str]:
+    """키셋 커서 해석"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+        created_at, lead_id = raw.split("|", 1)
+        return datetime.fromisoformat(created_at), lead_id
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="잘못된 커서입니다.",
+        )
+
+
 @router.get("/projects/{project_id}/leads/export")
 async def export_leads(
     project_id: str,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    request: Request,
+    current_user: User = Depends(get_current_user_readonly),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     리드 CSV 내보내기
 
     - 소유자만 다운로드 가능
     - UTF-8 BOM 포함 (한글 깨짐 방지)
+    - DB 커서에서 청크 단위로 읽어 바로 전송 (리드 수와 무관하게 메모리 일정)
+    - Accept-Encoding: gzip 요청 시 압축 전송
     """
     # 프로젝트 소유 확인
     project_result = await db.execute(
@@ -258,64 +278,63 @@ async def export_leads(
             detail="프로젝트를 찾을 수 없습니다.",
         )
 
-    # 리드 조회
-    result = await db.execute(
-        select(Lead)
-        .where(Lead.project_id == project_id)
-        .order_by(Lead.created_at.desc())
-    )
-    leads = result.scalars().all()
-
-    # CSV 생성
-    output = io.StringIO()
-    writer = csv.writer(output)
-
-    # 헤더
-    writer.writerow([
-        "일시",
-        "이메일",
-        "이름",
-        "회사명",
-        "직무",
-        "자유 텍스트",
-        "개인정보 동의",
-        "마케팅 동의",
-        "UTM Source",
-        "UTM Medium",
-        "UTM Campaign",
-        "폼 위치",
-    ])
-
-    # 데이터
-    for lead in leads:
-        utm = lead.source_utm or {}
-        writer.writerow([
-            lead.created_at.strftime("%Y-%m-%d %H:%M:%S"),
-            lead.email,
-            lead.name or "",
-            lead.company or "",
-            lead.role or "",
-            "",
-            "O" if lead.consent_privacy else "X",
-            "O" if lead.consent_marketing else "X",
-            utm.get("utm_source", ""),
-            utm.get("utm_medium", ""),
-            utm.get("utm_campaign", ""),
-            lead.form_location or "",
-        ])
-
-    # UTF-8 BOM 추가
-    csv_content = "\ufeff" + output.getvalue()
-
     # 파일명
     filename = f"leads_{project.public_slug}_{datetime.now().strftime('%Y%m%d')}.csv"
 
-    return StreamingResponse(
-        iter([csv_content]),
-        media_type="text/csv",
-        headers={
-            "Content-Disposition": f"attachment; filename={filename}",
-        },
+    headers = {
+        "Content-Disposition": f"attachment; filename={filename}",
+        "Vary": "Accept-Encoding",
+    }
+    body = stream_leads_csv(project_id)
+
+    if settings.LEAD_EXPORT_GZIP_ENABLED and "gzip" in request.headers.get("accept-encoding", ""):
+        headers["Content-Encoding"] = "gzip"
+        body = gzip_stream(body)
+
+    return StreamingResponse(body, media_type="text/csv", headers=headers)
+
+
+@router.post("/projects/{project_id}/leads/import", response_model=LeadImportResponse)
+async def import_project_leads(
+    project_id: str,
+    request: Request,
+    file_format: Optional[str] = Query(None, alias="format", pattern="^(csv|ndjson)$"),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """
+    리드 일괄 가져오기 (CSV/NDJSON 업로드)
+
+    - 소유자만 가능
+    - 요청 본문을 그대로 파일로 받음 (format 미지정 시 Content-Type 으로 판단, 기본 CSV)
+    - CSV 는 헤더 행 필수 (email/consent_privacy 또는 내보내기 CSV 의 한글 헤더)
+    - 개인정보 동의 값이 없는 행은 미동의로 저장
+    - 본문을 스트림으로 읽어 청크 단위로 저장 (파일 크기와 무관하게 메모리 일정)
+    - 이미 있는 이메일은 중복으로 건너뛰고, 오류 행은 줄 번호와 함께 보고
+    """
+    # 프로젝트 소유 확인
+    project_result = await db.execute(
+        select(Project.project_id)
+        .where(Project.project_id == project_id)
+        .where(Project.owner_id == current_user.user_id)
+        .where(Project.deleted_at.is_(None))
     )
+    if project_result.scalar_one_or_none() is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="프로젝트를 찾을 수 없습니다.",
+        )
+    # 가져오는 동안 읽기 트랜잭션을 유지하지 않음
+    await db.rollback()
 
+    if file_format is None:
+        content_type = request.headers.get("content-type", "")
+        file_format = "ndjson" if "ndjson" in content_type or "jsonl" in content_type else "csv"
 
+    try:
+        return await import_leads(project_id, request.stream(), file_format)
+    except LeadImportFormatError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
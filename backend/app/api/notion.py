@@ -1,10 +1,17 @@
 # Notion 페이지 데이터 프록시 API
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from pydantic import BaseModel
+import gzip
 import httpx
+import json
 import re
 from urllib.parse import urlparse, parse_qs
 
+from app.core.http import get_http_client
+from app.core.rate_limit import rate_limit
+from app.services.notion_cache import notion_page_cache
+from app.services.notion_mirrors import AttemptResult, notion_mirror_pool
+
 router = APIRouter(prefix="/api/notion", tags=["notion"])
 
 
@@ -73,120 +80,135 @@ def format_page_id(page_id: str) -> str:
     return page_id
 
 
-@router.post("/page")
-async def get_notion_page(request: NotionPageRequest):
+# 캐시 키로 사용할 수 있는 페이지 ID (파일명으로도 사용되므로 엄격히 검사)
+CACHEABLE_PAGE_ID = re.compile(r"^[a-f0-9]{8}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{12}$")
+
+NOT_FOUND_DETAIL = "Notion 페이지를 찾을 수 없습니다. (페이지 ID: {page_id})\n\n다음을 확인해주세요:\n1. Notion 페이지가 '웹에 게시' 상태인지 확인\n2. 페이지 URL이 올바른지 확인\n3. 데이터베이스 뷰가 아닌 실제 페이지 URL을 사용해주세요"
+
+
+async def _fetch_from_mirror(mirror_url: str) -> AttemptResult:
+    """Notion API 미러 1회 조회"""
+    try:
+        response = await get_http_client().get(mirror_url, extensions={"metrics_target": "notion"})
+
+        if response.status_code == 200:
+            # 200 으로 오는 HTML 오류 페이지 등은 캐시하지 않도록 recordMap 객체인지 확인
+            try:
+                record_map = json.loads(response.content)
+            except ValueError:
+                return "error", "Notion 서버 응답이 올바른 JSON 이 아닙니다."
+            if not isinstance(record_map, dict):
+                return "error", "Notion 서버 응답 형식이 올바르지 않습니다."
+            return "ok", response.content
+        elif response.status_code == 404:
+            return "not_found", None
+        elif response.status_code == 403:
+            return "error", "접근이 거부되었습니다 (403). 페이지가 공개되어 있는지 확인해주세요."
+        else:
+            return "error", f"오류 발생: {response.status_code}"
+    except httpx.TimeoutException:
+        return "error", "Notion 서버 응답 시간이 초과되었습니다."
+    except httpx.RequestError as e:
+        return "error", f"Notion 서버 연결 실패: {str(e)}"
+
+
+async def fetch_record_map(formatted_id: str, not_found_detail: str) -> bytes:
+    """
+    Notion API 미러에서 recordMap 원본(JSON bytes)을 가져옵니다.
+
+    미러 상태 점수 순으로 조회하며, 1순위 미러가 느리면 다음 미러에도
+    동시에 요청(hedged request)하여 먼저 성공한 응답을 사용합니다.
+
+    Raises:
+        HTTPException: 404 (페이지 없음) / 502 (모든 미러 실패)
+    """
+    kind, record_map, errors = await notion_mirror_pool.fetch(
+        lambda mirror: _fetch_from_mirror(mirror.format(page_id=formatted_id))
+    )
+
+    if kind == "ok":
+        return record_map
+
+    if kind == "not_found":
+        raise HTTPException(status_code=404, detail=not_found_detail)
+
+    # 모든 API 시도 실패
+    last_error = errors[-1] if errors else None
+    raise HTTPException(
+        status_code=502,
+        detail=f"Notion 페이지를 불러올 수 없습니다. {last_error} 페이지가 '웹에 게시' 상태인지 확인해주세요."
+    )
+
+
+async def notion_page_response(
+    formatted_id: str,
+    http_request: Request,
+    not_found_detail: str,
+) -> Response:
+    """
+    캐시를 거쳐 react-notion-x 형식 응답을 만듭니다.
+
+    응답 본문은 gzip 으로 캐시되어 있으므로, 클라이언트가 gzip 을 지원하면 그대로 전송합니다.
+    캐시 키와 본문의 page_id 는 소문자로 맞춥니다 (대소문자만 다른 요청이 다른 본문을 받지 않도록).
+    """
+    if CACHEABLE_PAGE_ID.match(formatted_id.lower()):
+        formatted_id = formatted_id.lower()
+
+    async def fetch() -> bytes:
+        record_map = await fetch_record_map(formatted_id, not_found_detail)
+        return (
+            b'{"success":true,"page_id":"' + formatted_id.encode("utf-8")
+            + b'","recordMap":' + record_map + b"}"
+        )
+
+    if not CACHEABLE_PAGE_ID.match(formatted_id):
+        return Response(content=await fetch(), media_type="application/json")
+
+    body = await notion_page_cache.get(formatted_id, fetch)
+
+    if "gzip" in http_request.headers.get("accept-encoding", ""):
+        return Response(
+            content=body,
+            media_type="application/json",
+            headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"},
+        )
+
+    return Response(
+        content=gzip.decompress(body),
+        media_type="application/json",
+        headers={"Vary": "Accept-Encoding"},
+    )
+
+
+@router.post("/page", dependencies=[Depends(rate_limit("notion-page", "RATE_LIMIT_NOTION_PAGE_PER_MINUTE"))])
+async def get_notion_page(request: NotionPageRequest, http_request: Request):
     """
     Notion URL로부터 페이지 데이터를 가져옵니다.
     react-notion-x가 사용할 수 있는 형식으로 반환합니다.
     """
     page_id = extract_page_id(request.url)
-    
+
     if not page_id:
         raise HTTPException(status_code=400, detail="유효한 Notion URL이 아닙니다.")
-    
+
     formatted_id = format_page_id(page_id)
-    
-    # 여러 Notion API 엔드포인트를 시도 (fallback)
-    api_endpoints = [
-        f"https://notion-api.splitbee.io/v1/page/{formatted_id}",
-        f"https://notion-api.vercel.app/v1/page/{formatted_id}",
-    ]
-    
-    last_error = None
-    
-    for notion_api_url in api_endpoints:
-        try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(notion_api_url)
-                
-                if response.status_code == 200:
-                    return {
-                        "success": True,
-                        "page_id": formatted_id,
-                        "recordMap": response.json(),
-                    }
-                elif response.status_code == 404:
-                    # 404는 계속 시도하지 않고 즉시 반환
-                    # 마지막 API인 경우에만 에러 반환
-                    if notion_api_url == api_endpoints[-1]:
-                        raise HTTPException(
-                            status_code=404,
-                            detail=f"Notion 페이지를 찾을 수 없습니다. (페이지 ID: {formatted_id})\n\n다음을 확인해주세요:\n1. Notion 페이지가 '웹에 게시' 상태인지 확인\n2. 페이지 URL이 올바른지 확인\n3. 데이터베이스 뷰가 아닌 실제 페이지 URL을 사용해주세요"
-                        )
-                    continue
-                elif response.status_code == 403:
-                    # 403은 다음 API를 시도
-                    last_error = f"접근이 거부되었습니다 (403). 페이지가 공개되어 있는지 확인해주세요."
-                    continue
-                else:
-                    # 다른 에러도 다음 API를 시도
-                    last_error = f"오류 발생: {response.status_code}"
-                    continue
-        except httpx.TimeoutException:
-            last_error = "Notion 서버 응답 시간이 초과되었습니다."
-            continue
-        except HTTPException:
-            # 404는 즉시 전파
-            raise
-        except httpx.RequestError as e:
-            last_error = f"Notion 서버 연결 실패: {str(e)}"
-            continue
-    
-    # 모든 API 시도 실패
-    raise HTTPException(
-        status_code=502,
-        detail=f"Notion 페이지를 불러올 수 없습니다. {last_error} 페이지가 '웹에 게시' 상태인지 확인해주세요."
+
+    return await notion_page_response(
+        formatted_id,
+        http_request,
+        NOT_FOUND_DETAIL.format(page_id=formatted_id),
     )
 
 
-@router.get("/page/{page_id}")
-async def get_notion_page_by_id(page_id: str):
+@router.get("/page/{page_id}", dependencies=[Depends(rate_limit("notion-page", "RATE_LIMIT_NOTION_PAGE_PER_MINUTE"))])
+async def get_notion_page_by_id(page_id: str, http_request: Request):
     """
     페이지 ID로 직접 Notion 페이지 데이터를 가져옵니다.
     """
     formatted_id = format_page_id(page_id)
-    
-    # 여러 Notion API 엔드포인트를 시도 (fallback)
-    api_endpoints = [
-        f"https://notion-api.splitbee.io/v1/page/{formatted_id}",
-        f"https://notion-api.vercel.app/v1/page/{formatted_id}",
-    ]
-    
-    last_error = None
-    
-    for notion_api_url in api_endpoints:
-        try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(notion_api_url)
-                
-                if response.status_code == 200:
-                    return {
-                        "success": True,
-                        "page_id": formatted_id,
-                        "recordMap": response.json(),
-                    }
-                elif response.status_code == 404:
-                    raise HTTPException(
-                        status_code=404,
-                        detail="Notion 페이지를 찾을 수 없습니다."
-                    )
-                elif response.status_code == 403:
-                    last_error = "접근이 거부되었습니다 (403)."
-                    continue
-                else:
-                    last_error = f"오류: {response.status_code}"
-                    continue
-        except httpx.TimeoutException:
-            last_error = "시간 초과"
-            continue
-        except HTTPException:
-            raise
-        except httpx.RequestError as e:
-            last_error = str(e)
-            continue
-    
-    raise HTTPException(
-        status_code=502,
-        detail=f"Notion 페이지를 불러올 수 없습니다. {last_error}"
-    )
 
+    return await notion_page_response(
+        formatted_id,
+        http_request,
+        "Notion 페이지를 찾을 수 없습니다.",
+    )
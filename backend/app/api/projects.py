@@ -3,16 +3,20 @@
 프로젝트 CRUD, 공개 프로젝트 조회
 """
 
+import re
 import secrets
 from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select, or_
 
-from app.core.database import get_db
+from app.core.database import get_read_db
+from app.core.db_writer import db_writer
+from app.core.rate_limit import rate_limit
 from app.models.user import User
 from app.models.project import Project
-from app.models.lead import Lead
+from app.models.project_stats import ProjectStats
 from app.schemas.project import (
     ProjectCreate,
     ProjectUpdate,
@@ -22,7 +26,10 @@ from app.schemas.project import (
     ProjectPublicResponse,
     URLCheckResponse,
 )
-from app.api.deps import get_current_user, get_current_user_optional
+from app.api.deps import get_current_user, get_current_user_readonly, get_current_user_optional
+from app.api.notion import extract_page_id
+from app.services import project_cache
+from app.services.ingest_profile import invalidate_ingest_profile
 
 router = APIRouter(prefix="/api/projects", tags=["프로젝트"])
 
@@ -34,8 +41,8 @@ def generate_slug(length: int = 8) -> str:
 
 @router.get("", response_model=ProjectListResponse)
 async def list_projects(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user_readonly),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     프로젝트 목록 조회
@@ -44,36 +51,29 @@ async def list_projects(
     - 삭제된 프로젝트 제외
     """
     try:
-        # 프로젝트 조회
+        # 프로젝트 + 집계 카운터 조회 (단일 쿼리)
         projects_query = (
-            select(Project)
+            select(Project, ProjectStats.lead_count, ProjectStats.last_lead_at)
+            .outerjoin(ProjectStats, Project.project_id == ProjectStats.project_id)
             .where(Project.owner_id == current_user.user_id)
             .where(Project.deleted_at.is_(None))
             .order_by(Project.created_at.desc())
         )
-        
+
         projects_result = await db.execute(projects_query)
-        project_list = projects_result.scalars().all()
-
-        # 각 프로젝트의 리드 수 조회
-        projects = []
-        for project in project_list:
-            # 리드 수 조회
-            lead_count_result = await db.execute(
-                select(func.count(Lead.lead_id)).where(Lead.project_id == project.project_id)
-            )
-            lead_count = lead_count_result.scalar() or 0
-            
-            projects.append(
-                ProjectListItem(
-                    project_id=project.project_id,
-                    name=project.name,
-                    notion_url=project.notion_url,
-                    public_slug=project.public_slug,
-                    created_at=project.created_at,
-                    lead_count=lead_count,
-                )
+
+        projects = [
+            ProjectListItem(
+                project_id=project.project_id,
+                name=project.name,
+                notion_url=project.notion_url,
+                public_slug=project.public_slug,
+                created_at=project.created_at,
+                lead_count=lead_count or 0,
+                last_lead_at=last_lead_at,
             )
+            for project, lead_count, last_lead_at in projects_result.all()
+        ]
 
         return ProjectListResponse(projects=projects)
     except Exception as e:
@@ -90,8 +90,8 @@ async def list_projects(
 @router.get("/{project_id}", response_model=ProjectResponse)
 async def get_project(
     project_id: str,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user_readonly),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     프로젝트 상세 조회
@@ -100,15 +100,11 @@ async def get_project(
     """
     # 프로젝트 조회
     query = (
-        select(
-            Project,
-            func.count(Lead.lead_id).label("lead_count"),
-        )
-        .outerjoin(Lead, Project.project_id == Lead.project_id)
+        select(Project, ProjectStats.lead_count)
+        .outerjoin(ProjectStats, Project.project_id == ProjectStats.project_id)
         .where(Project.project_id == project_id)
         .where(Project.owner_id == current_user.user_id)
         .where(Project.deleted_at.is_(None))
-        .group_by(Project.project_id)
     )
 
     result = await db.execute(query)
@@ -121,7 +117,7 @@ async def get_project(
         )
 
     project = row[0]
-    lead_count = row[1]
+    lead_count = row[1] or 0
 
     return ProjectResponse(
         project_id=project.project_id,
@@ -148,7 +144,7 @@ async def get_project(
 async def create_project(
     project_data: ProjectCreate,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     프로젝트 생성
@@ -188,7 +184,6 @@ async def create_project(
     project = Project(
         owner_id=current_user.user_id,
         name=project_data.name,
-        notion_url=project_data.notion_url,
         public_slug=public_slug,
         ux_config=to_dict(project_data.ux_config),
         blind_config=to_dict(project_data.blind_config),
@@ -202,6 +197,8 @@ async def create_project(
         og_image=project_data.og_image,
     )
 
+    set_notion_url(project, project_data.notion_url)
+
     # None인 설정은 기본값 사용
     if project.ux_config is None:
         project.ux_config = {
@@ -238,9 +235,14 @@ async def create_project(
             "button_label": "Unlock",
         }
 
-    db.add(project)
-    await db.commit()
-    await db.refresh(project)
+    async def write(session: AsyncSession) -> None:
+        session.add(project)
+
+    # 단일 writer 를 통해 저장 (기본값은 모두 Python 측이므로 refresh 하지 않음)
+    await db_writer.run(write)
+
+    # 생성 전 조회로 남은 negative 캐시 제거
+    await project_cache.invalidate_public_project(project.public_slug)
 
     return ProjectResponse(
         project_id=project.project_id,
@@ -268,7 +270,7 @@ async def update_project(
     project_id: str,
     project_data: ProjectUpdate,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     프로젝트 수정
@@ -276,14 +278,32 @@ async def update_project(
     - 소유자만 수정 가능
     - 부분 업데이트 지원
     """
-    # 프로젝트 조회
-    result = await db.execute(
-        select(Project)
-        .where(Project.project_id == project_id)
-        .where(Project.owner_id == current_user.user_id)
-        .where(Project.deleted_at.is_(None))
-    )
-    project = result.scalar_one_or_none()
+    update_data = project_data.model_dump(exclude_unset=True)
+
+    async def write(session: AsyncSession) -> Optional[Project]:
+        # 프로젝트 조회 (writer 트랜잭션 안에서 조회/수정)
+        result = await session.execute(
+            select(Project)
+            .where(Project.project_id == project_id)
+            .where(Project.owner_id == current_user.user_id)
+            .where(Project.deleted_at.is_(None))
+        )
+        project = result.scalar_one_or_none()
+        if project is None:
+            return None
+
+        # 업데이트
+        for field, value in update_data.items():
+            if value is not None:
+                if hasattr(value, "model_dump"):
+                    value = value.model_dump()
+                if field == "notion_url":
+                    set_notion_url(project, value)
+                    continue
+                setattr(project, field, value)
+        return project
+
+    project = await db_writer.run(write)
 
     if project is None:
         raise HTTPException(
@@ -291,21 +311,12 @@ async def update_project(
             detail="프로젝트를 찾을 수 없습니다.",
         )
 
-    # 업데이트
-    update_data = project_data.model_dump(exclude_unset=True)
-
-    for field, value in update_data.items():
-        if value is not None:
-            if hasattr(value, "model_dump"):
-                value = value.model_dump()
-            setattr(project, field, value)
-
-    await db.commit()
-    await db.refresh(project)
+    await project_cache.invalidate_public_project(project.public_slug)
+    await invalidate_ingest_profile(project.project_id)
 
-    # 리드 수 조회
+    # 리드 수 조회 (집계 카운터)
     lead_count_result = await db.execute(
-        select(func.count(Lead.lead_id)).where(Lead.project_id == project_id)
+        select(ProjectStats.lead_count).where(ProjectStats.project_id == project_id)
     )
     lead_count = lead_count_result.scalar() or 0
 
@@ -334,7 +345,6 @@ async def update_project(
 async def delete_project(
     project_id: str,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
 ):
     """
     프로젝트 삭제 (Soft delete)
@@ -343,14 +353,23 @@ async def delete_project(
     """
     from datetime import datetime
 
-    # 프로젝트 조회
-    result = await db.execute(
-        select(Project)
-        .where(Project.project_id == project_id)
-        .where(Project.owner_id == current_user.user_id)
-        .where(Project.deleted_at.is_(None))
-    )
-    project = result.scalar_one_or_none()
+    async def write(session: AsyncSession) -> Optional[Project]:
+        # 프로젝트 조회
+        result = await session.execute(
+            select(Project)
+            .where(Project.project_id == project_id)
+            .where(Project.owner_id == current_user.user_id)
+            .where(Project.deleted_at.is_(None))
+        )
+        project = result.scalar_one_or_none()
+        if project is None:
+            return None
+
+        # Soft delete
+        project.deleted_at = datetime.utcnow()
+        return project
+
+    project = await db_writer.run(write)
 
     if project is None:
         raise HTTPException(
@@ -358,9 +377,8 @@ async def delete_project(
             detail="프로젝트를 찾을 수 없습니다.",
         )
 
-    # Soft delete
-    project.deleted_at = datetime.utcnow()
-    await db.commit()
+    await project_cache.invalidate_public_project(project.public_slug)
+    await invalidate_ingest_profile(project.project_id)
 
     return {"success": True}
 
@@ -368,7 +386,7 @@ async def delete_project(
 @router.get("/slug/check/{slug}")
 async def check_slug_availability(
     slug: str,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     슬러그 중복 확인
@@ -380,7 +398,6 @@ async def check_slug_availability(
         return {"available": False, "message": "슬러그는 최소 2자 이상이어야 합니다."}
     
     # 슬러그 형식 검증 (영문, 숫자, 하이픈만 허용)
-    import re
     if not re.match(r'^[a-z0-9-]+$', slug):
         return {"available": False, "message": "영문, 숫자, 하이픈만 사용할 수 있습니다."}
     
@@ -421,6 +438,25 @@ def normalize_notion_url(url: str) -> str:
     return normalized
 
 
+def notion_url_keys(url: str) -> tuple[str, Optional[str]]:
+    """
+    notion_url 조회 키 생성
+
+    Returns:
+        (정규화 URL, 32자리 hex 페이지 ID 또는 None)
+    """
+    page_id = extract_page_id(url).lower()
+    if not re.match(r"^[a-f0-9]{32}$", page_id):
+        page_id = None
+    return normalize_notion_url(url), page_id
+
+
+def set_notion_url(project: Project, url: str) -> None:
+    """notion_url 과 조회 키를 함께 설정"""
+    project.notion_url = url
+    project.notion_url_normalized, project.notion_page_id = notion_url_keys(url)
+
+
 def mask_email(email: str) -> str:
     """
     이메일 마스킹 (j***@gmail.com 형태)
@@ -441,7 +477,7 @@ def mask_email(email: str) -> str:
 async def check_url_ownership(
     notion_url: str,
     current_user: Optional[User] = Depends(get_current_user_optional),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     Notion URL 소유권 확인
@@ -451,22 +487,22 @@ async def check_url_ownership(
     - 점유된 경우 소유자 힌트 제공
     - 로그인 상태에서 본인 URL인 경우 표시
     """
-    # URL 정규화 (쿼리 파라미터 제거)
-    normalized_url = normalize_notion_url(notion_url)
+    # URL 정규화 (쿼리 파라미터 제거) 및 페이지 ID 추출
+    normalized_url, page_id = notion_url_keys(notion_url)
+
+    # 해당 URL(또는 같은 Notion 페이지)을 사용하는 프로젝트 조회 (인덱스 조회)
+    url_match = Project.notion_url_normalized == normalized_url
+    if page_id:
+        url_match = or_(url_match, Project.notion_page_id == page_id)
 
-    # 해당 URL을 사용하는 프로젝트 조회
     result = await db.execute(
         select(Project)
+        .where(url_match)
         .where(Project.deleted_at.is_(None))
+        .order_by(Project.created_at)
+        .limit(1)
     )
-    projects = result.scalars().all()
-
-    # 정규화된 URL로 비교
-    matching_project = None
-    for project in projects:
-        if normalize_notion_url(project.notion_url) == normalized_url:
-            matching_project = project
-            break
+    matching_project = result.scalar_one_or_none()
 
     if matching_project is None:
         # URL이 점유되지 않음
@@ -497,44 +533,69 @@ async def check_url_ownership(
     )
 
 
-@public_router.get("/{slug}", response_model=ProjectPublicResponse)
+@public_router.get(
+    "/{slug}",
+    response_model=ProjectPublicResponse,
+    dependencies=[Depends(rate_limit("public-project", "RATE_LIMIT_PUBLIC_PROJECT_PER_MINUTE"))],
+)
 async def get_public_project(
     slug: str,
-    db: AsyncSession = Depends(get_db),
+    request: Request,
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     공개 프로젝트 조회 (공유 링크용)
 
     - 인증 불필요
     - 설정만 반환
+    - 슬러그별 캐시 + ETag (If-None-Match 일치 시 304)
     - 주의: 이 라우트는 /check-url 뒤에 위치해야 함 (FastAPI 라우트 순서)
     """
-    result = await db.execute(
-        select(Project)
-        .where(Project.public_slug == slug)
-        .where(Project.deleted_at.is_(None))
-    )
-    project = result.scalar_one_or_none()
+    cached = await project_cache.get_public_project(slug)
 
-    if project is None:
+    if cached == project_cache.NOT_FOUND:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="프로젝트를 찾을 수 없습니다.",
         )
 
-    return ProjectPublicResponse(
-        project_id=project.project_id,
-        name=project.name,
-        notion_url=project.notion_url,
-        ux_config=project.ux_config,
-        blind_config=project.blind_config,
-        form_config=project.form_config,
-        theme_config=project.theme_config or {"primary_color": "#FF5A1F"},
-        og_title=project.og_title,
-        og_description=project.og_description,
-        og_image=project.og_image,
-    )
+    if cached is None:
+        generation = await project_cache.current_generation()
+        result = await db.execute(
+            select(Project)
+            .where(Project.public_slug == slug)
+            .where(Project.deleted_at.is_(None))
+        )
+        project = result.scalar_one_or_none()
+
+        if project is None:
+            await project_cache.store_public_project_not_found(slug, generation)
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="프로젝트를 찾을 수 없습니다.",
+            )
 
+        body = ProjectPublicResponse(
+            project_id=project.project_id,
+            name=project.name,
+            notion_url=project.notion_url,
+            ux_config=project.ux_config,
+            blind_config=project.blind_config,
+            form_config=project.form_config,
+            theme_config=project.theme_config or {"primary_color": "#FF5A1F"},
+            og_title=project.og_title,
+            og_description=project.og_description,
+            og_image=project.og_image,
+        ).model_dump(mode="json")
+        etag = project_cache.build_etag(project)
+        await project_cache.store_public_project(slug, body, etag, generation)
+    else:
+        body, etag = cached
 
+    # 브라우저/CDN 재검증용 헤더
+    headers = {"ETag": etag, "Cache-Control": "public, no-cache"}
 
+    if project_cache.etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
 
+    return JSONResponse(content=body, headers=headers)
@@ -8,7 +8,7 @@ from pydantic import BaseModel, HttpUrl
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
-from app.core.database import get_db
+from app.core.database import get_read_db
 from app.models.user import User
 from app.models.project import Project
 from app.schemas.lead import LeadResponse
@@ -38,7 +38,7 @@ class WebhookTestResponse(BaseModel):
 async def test_webhook(
     request_data: WebhookTestRequest,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     Webhook 테스트 전송
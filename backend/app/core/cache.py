@@ -0,0 +1,328 @@
+"""
+캐시 백엔드
+프로세스 내 LRU 캐시 및 Redis 호환 공유 캐시
+"""
+
+import asyncio
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Protocol
+
+from .config import settings
+
+
+class CacheBackend(Protocol):
+    """캐시 백엔드 인터페이스 (값은 문자열로 직렬화해서 저장)"""
+
+    async def get(self, key: str) -> Optional[str]: ...
+
+    async def set(self, key: str, value: str, ttl: int) -> None: ...
+
+    async def delete(self, *keys: str) -> None: ...
+
+    async def close(self) -> None: ...
+
+
+class MemoryCache:
+    """
+    프로세스 내 캐시
+
+    - TTL 만료
+    - 최대 항목 수 초과 시 가장 오래 사용하지 않은 항목부터 제거 (LRU)
+    """
+
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max_entries
+        self._data: "OrderedDict[str, tuple[float, str]]" = OrderedDict()
+
+    async def get(self, key: str) -> Optional[str]:
+        item = self._data.get(key)
+        if item is None:
+            return None
+
+        expires_at, value = item
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+
+        self._data.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: str, ttl: int) -> None:
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_entries:
+            self._data.popitem(last=False)
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._data.pop(key, None)
+
+    async def close(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class RedisCache:
+    """
+    Redis 프로토콜 공유 캐시
+
+    get / set(ex=) / delete 를 지원하는 비동기 클라이언트면 무엇이든 사용 가능
+    (redis.asyncio.Redis, 테스트용 fake 등).
+    """
+
+    def __init__(self, client: Any, namespace: str):
+        self.client = client
+        self.prefix = f"formtion:{namespace}:"
+
+    async def get(self, key: str) -> Optional[str]:
+        value = await self.client.get(self.prefix + key)
+        if isinstance(value, bytes):
+            return value.decode("utf-8")
+        return value
+
+    async def set(self, key: str, value: str, ttl: int) -> None:
+        await self.client.set(self.prefix + key, value, ex=ttl)
+
+    async def delete(self, *keys: str) -> None:
+        if keys:
+            await self.client.delete(*(self.prefix + key for key in keys))
+
+    async def close(self) -> None:
+        close = getattr(self.client, "aclose", None) or getattr(self.client, "close", None)
+        if close is not None:
+            await close()
+
+
+class InvalidationBus:
+    """
+    워커 간 프로세스 내 캐시 무효화 (Redis pub/sub)
+
+    - 삭제한 키를 formtion:{namespace}:invalidate 채널로 발행
+    - 구독 작업이 다른 워커(자신 포함)의 프로세스 내 캐시에서 해당 키 삭제
+    - 구독이 끊겼다 다시 연결되면 놓친 메시지가 있을 수 있으므로 프로세스 내 캐시 전체 삭제
+    """
+
+    RECONNECT_DELAY_SECONDS = 1.0
+
+    def __init__(self, client: Any):
+        self.client = client
+        self._locals: dict[str, MemoryCache] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._subscribed = asyncio.Event()
+        self.stats = {"published": 0, "received": 0, "reconnects": 0, "errors": 0}
+
+    @staticmethod
+    def channel(namespace: str) -> str:
+        return f"formtion:{namespace}:invalidate"
+
+    def register(self, namespace: str, local: MemoryCache) -> None:
+        self._locals[self.channel(namespace)] = local
+
+    async def publish(self, namespace: str, keys: tuple) -> None:
+        await self.client.publish(self.channel(namespace), json.dumps(list(keys)))
+        self.stats["published"] += 1
+
+    async def start(self) -> None:
+        if self._task is None and self._locals:
+            self._task = asyncio.create_task(self._listen())
+
+    async def wait_subscribed(self) -> None:
+        await self._subscribed.wait()
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _listen(self) -> None:
+        connected_before = False
+        while True:
+            pubsub = self.client.pubsub()
+            try:
+                await pubsub.subscribe(*self._locals)
+                if connected_before:
+                    self.stats["reconnects"] += 1
+                    for local in self._locals.values():
+                        await local.close()
+                connected_before = True
+                self._subscribed.set()
+
+                while True:
+                    message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                    if message is not None and message["type"] == "message":
+                        await self._apply(message)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.stats["errors"] += 1
+                self._subscribed.clear()
+                print(f"캐시 무효화 구독 실패: {str(e)}")
+                await asyncio.sleep(self.RECONNECT_DELAY_SECONDS)
+            finally:
+                close = getattr(pubsub, "aclose", None) or getattr(pubsub, "close", None)
+                try:
+                    await close()
+                except Exception:
+                    pass
+
+    async def _apply(self, message: dict) -> None:
+        channel = message["channel"]
+        if isinstance(channel, bytes):
+            channel = channel.decode("utf-8")
+        local = self._locals.get(channel)
+        if local is None:
+            return
+        self.stats["received"] += 1
+        await local.delete(*json.loads(message["data"]))
+
+
+class TieredCache:
+    """
+    2단계 캐시 (프로세스 내 → 공유)
+
+    삭제 시 InvalidationBus 로 다른 워커의 프로세스 내 캐시도 바로 비운다.
+    프로세스 내 캐시는 짧은 TTL만 유지하여, 무효화 메시지를 놓치더라도
+    최대 local_ttl 초 안에 반영되도록 한다.
+    """
+
+    def __init__(
+        self,
+        local: MemoryCache,
+        shared: CacheBackend,
+        local_ttl: int,
+        namespace: str = "",
+        bus: Optional[InvalidationBus] = None,
+    ):
+        self.local = local
+        self.shared = shared
+        self.local_ttl = local_ttl
+        self.namespace = namespace
+        self.bus = bus
+        if bus is not None:
+            bus.register(namespace, local)
+
+    async def get(self, key: str) -> Optional[str]:
+        value = await self.local.get(key)
+        if value is not None:
+            return value
+
+        value = await self.shared.get(key)
+        if value is not None:
+            await self.local.set(key, value, self.local_ttl)
+        return value
+
+    async def set(self, key: str, value: str, ttl: int) -> None:
+        await self.shared.set(key, value, ttl)
+        await self.local.set(key, value, min(ttl, self.local_ttl))
+
+    async def delete(self, *keys: str) -> None:
+        await self.local.delete(*keys)
+        await self.shared.delete(*keys)
+        if self.bus is not None and keys:
+            await self.bus.publish(self.namespace, keys)
+
+    async def close(self) -> None:
+        await self.local.close()
+        await self.shared.close()
+
+
+# 생성된 캐시 목록 (종료 시 정리)
+_caches: list[CacheBackend] = []
+_redis_client: Any = None
+_invalidation_bus: Optional[InvalidationBus] = None
+
+
+def get_redis_client() -> Any:
+    """
+    공유 Redis 클라이언트 반환 (CACHE_REDIS_URL 미설정 시 None)
+
+    redis 패키지는 선택 의존성이므로 설정된 경우에만 import 한다.
+    """
+    global _redis_client
+
+    if not settings.CACHE_REDIS_URL:
+        return None
+
+    if _redis_client is None:
+        try:
+            from redis.asyncio import Redis
+        except ImportError as e:
+            raise RuntimeError(
+                "CACHE_REDIS_URL 을 사용하려면 redis 패키지가 필요합니다. (uv add redis)"
+            ) from e
+        _redis_client = Redis.from_url(settings.CACHE_REDIS_URL)
+
+    return _redis_client
+
+
+def create_cache(namespace: str, max_entries: int = 10000) -> CacheBackend:
+    """
+    네임스페이스별 캐시 생성
+
+    CACHE_REDIS_URL 이 설정되어 있으면 프로세스 내 + Redis 2단계 캐시,
+    아니면 프로세스 내 캐시만 사용한다.
+    """
+    local = MemoryCache(max_entries)
+    redis_client = get_redis_client()
+
+    if redis_client is None:
+        cache: CacheBackend = local
+    else:
+        cache = TieredCache(
+            local,
+            RedisCache(redis_client, namespace),
+            local_ttl=settings.CACHE_LOCAL_TTL_SECONDS,
+            namespace=namespace,
+            bus=get_invalidation_bus(),
+        )
+
+    _caches.append(cache)
+    return cache
+
+
+def get_invalidation_bus() -> Optional[InvalidationBus]:
+    """워커 간 캐시 무효화 버스 (CACHE_REDIS_URL 미설정 시 None)"""
+    global _invalidation_bus
+
+    redis_client = get_redis_client()
+    if redis_client is None:
+        return None
+
+    if _invalidation_bus is None:
+        _invalidation_bus = InvalidationBus(redis_client)
+    return _invalidation_bus
+
+
+async def start_cache_invalidation() -> None:
+    """무효화 구독 시작 (애플리케이션 시작 시)"""
+    if _invalidation_bus is not None:
+        await _invalidation_bus.start()
+
+
+async def close_caches() -> None:
+    """모든 캐시 정리 (애플리케이션 종료 시)"""
+    global _redis_client, _invalidation_bus
+
+    if _invalidation_bus is not None:
+        await _invalidation_bus.stop()
+        _invalidation_bus = None
+
+    for cache in _caches:
+        if isinstance(cache, TieredCache):
+            await cache.local.close()
+        else:
+            await cache.close()
+    _caches.clear()
+
+    if _redis_client is not None:
+        close = getattr(_redis_client, "aclose", None) or _redis_client.close
+        await close()
+        _redis_client = None
@@ -21,26 +21,141 @@ class Settings(BaseSettings):
     PORT: int = 8000
 
     # 데이터베이스 설정
-    DATABASE_URL: str = "sqlite+aiosqlite:///./formtion.db"
+    DATABASE_URL: str = "sqlite+aiosqlite:///./formtion.db"  # PostgreSQL: postgresql+asyncpg://user:pw@host/db
+
+    # 데이터베이스 커넥션 풀 설정 (PostgreSQL)
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT_SECONDS: int = 30
+    DB_POOL_RECYCLE_SECONDS: int = 1800  # 서버/프록시 idle timeout 보다 짧게
+    DB_POOL_PRE_PING: bool = True
+    DB_STATEMENT_CACHE_SIZE: int = 500  # asyncpg prepared statement 캐시 (pgbouncer transaction 모드면 0)
+
+    # SQLite 운영 설정
+    SQLITE_WAL_ENABLED: bool = True  # WAL 저널 + 읽기 전용 커넥션 풀 + 단일 writer
+    SQLITE_SYNCHRONOUS: str = "NORMAL"
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+    SQLITE_MMAP_SIZE: int = 256 * 1024 * 1024
+    SQLITE_CACHE_SIZE_KB: int = 64 * 1024  # 커넥션별 페이지 캐시
+    SQLITE_READ_POOL_SIZE: int = 8
+    SQLITE_WRITER_MAX_BATCH: int = 100  # 한 트랜잭션으로 묶어 커밋하는 최대 쓰기 작업 수
 
     # JWT 설정
     JWT_SECRET_KEY: str = "your-secret-key-change-in-production"
     JWT_ALGORITHM: str = "HS256"
     JWT_ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 7  # 7일
+    UNLOCK_TOKEN_SECRET: str = ""  # 리드 제출 언락 토큰 서명 키 (미설정 시 JWT_SECRET_KEY 에서 파생)
+
+    # 인증 사용자 캐시 설정
+    USER_CACHE_TTL_SECONDS: int = 60
+    USER_CACHE_MAX_ENTRIES: int = 10000
+    AUTH_TRUST_TOKEN_CLAIMS: bool = False  # 조회 전용 API 에서 토큰 클레임만으로 사용자 확인 (DB/캐시 조회 생략)
+
+    # 비밀번호 해싱 설정
+    BCRYPT_ROUNDS: int = 12  # 변경 시 기존 해시는 다음 로그인 때 재해싱
+    PASSWORD_HASH_WORKERS: int = 2  # 해싱 전용 스레드 수
+    PASSWORD_HASH_MAX_PENDING: int = 64  # 대기 포함 최대 작업 수 (초과 시 503)
 
     # CORS 설정
     CORS_ORIGINS: list[str] = ["http://localhost:3000", "http://localhost:3002", "http://localhost:5173"]
 
-    # Rate Limiting
-    RATE_LIMIT_PER_MINUTE: int = 60
+    # Rate Limiting (분당 허용 수, 0 이면 제한 없음 / CACHE_REDIS_URL 설정 시 워커 간 공유)
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_PER_MINUTE: int = 60  # 라우트별 값이 없을 때 기본값 (IP 기준)
+    RATE_LIMIT_LEADS_PER_MINUTE: int = 20  # 리드 제출 (IP 기준)
+    RATE_LIMIT_EVENTS_PER_MINUTE: int = 300  # 이벤트 수집 요청 (IP 기준)
+    RATE_LIMIT_NOTION_PAGE_PER_MINUTE: int = 60  # Notion 페이지 프록시 (IP 기준)
+    RATE_LIMIT_PUBLIC_PROJECT_PER_MINUTE: int = 120  # 공개 프로젝트 조회 (IP 기준)
+    RATE_LIMIT_PROJECT_LEADS_PER_MINUTE: int = 600  # 프로젝트별 리드 제출 (전체 방문자 합산)
+    RATE_LIMIT_PROJECT_EVENTS_PER_MINUTE: int = 20000  # 프로젝트별 이벤트 수 (전체 방문자 합산)
+
+    # 외부 HTTP 클라이언트 설정 (Webhook, Notion 프록시 공유 커넥션 풀)
+    HTTP2_ENABLED: bool = True
+    HTTP_MAX_CONNECTIONS: int = 100
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    HTTP_MAX_CONNECTIONS_PER_HOST: int = 10
+    HTTP_KEEPALIVE_EXPIRY_SECONDS: float = 30.0
+    HTTP_CONNECT_TIMEOUT_SECONDS: float = 5.0
+    HTTP_READ_TIMEOUT_SECONDS: float = 30.0
+    HTTP_POOL_TIMEOUT_SECONDS: float = 10.0
 
     # Webhook 설정
     WEBHOOK_MAX_RETRIES: int = 2
     WEBHOOK_TIMEOUT_SECONDS: int = 10
 
+    # Webhook 아웃박스 워커 설정
+    WEBHOOK_WORKER_CONCURRENCY: int = 4  # 동시 전송 워커 수
+    WEBHOOK_PER_HOST_CONCURRENCY: int = 2  # 대상 호스트별 동시 전송 수
+    WEBHOOK_OUTBOX_MAX_ATTEMPTS: int = 8  # 초과 시 dead 처리
+    WEBHOOK_OUTBOX_POLL_SECONDS: int = 5
+    WEBHOOK_OUTBOX_BATCH_SIZE: int = 50
+    WEBHOOK_OUTBOX_LEASE_SECONDS: int = 120  # processing 상태 임대 시간
+    WEBHOOK_BACKOFF_BASE_SECONDS: int = 5
+    WEBHOOK_BACKOFF_MAX_SECONDS: int = 3600
+
     # Discord 알림 설정
     DISCORD_SIGNUP_WEBHOOK_URL: str = "https://discord.com/api/webhooks/1466595976965001439/TeSP8g7VZaDtEbEk1kCzH7uCA9S2Z2KV74LeBPuzu2ktxRGipJyOMK4TSL_kj7l3lmoq"
 
+    # 이벤트 수집 버퍼 설정
+    EVENT_BUFFER_MAX_SIZE: int = 10000  # 메모리에 대기 가능한 최대 이벤트 수
+    EVENT_BUFFER_BATCH_SIZE: int = 500  # 이 개수 이상 쌓이면 즉시 flush
+    EVENT_BUFFER_FLUSH_INTERVAL_SECONDS: float = 1.0
+    EVENT_BUFFER_OVERFLOW_POLICY: str = "reject"  # reject(429) / drop
+    EVENT_BUFFER_MAX_RETRIES: int = 3  # 저장 실패한 배치 재시도 횟수 (초과 시 폐기)
+
+    # 이벤트 파티션 보관 기간 (월별 파티션, 기간이 지난 파티션은 세그먼트 파일로 내보낸 뒤 삭제)
+    EVENT_RETENTION_DAYS: int = 0  # 0 이면 삭제하지 않음
+    EVENT_ARCHIVE_DIR: str = "./archive/events"  # NDJSON.gz 세그먼트 저장 경로
+    EVENT_RETENTION_INTERVAL_SECONDS: int = 3600
+
+    # 리드 CSV 내보내기 설정
+    LEAD_EXPORT_CHUNK_SIZE: int = 1000  # DB 커서에서 한 번에 가져와 전송하는 행 수
+    LEAD_EXPORT_GZIP_ENABLED: bool = True  # Accept-Encoding: gzip 요청 시 압축 전송
+
+    # 리드 일괄 가져오기 설정
+    LEAD_IMPORT_CHUNK_SIZE: int = 1000  # 한 번의 중복 조회/다중 행 INSERT 로 처리하는 행 수 (최대 2000)
+    LEAD_IMPORT_MAX_ERRORS: int = 100  # 응답에 포함할 행 오류 최대 개수
+
+    # 캐시 설정
+    CACHE_REDIS_URL: str = ""  # 설정 시 워커 간 공유 캐시 사용 (예: redis://localhost:6379/0)
+    CACHE_LOCAL_TTL_SECONDS: int = 5  # 공유 캐시 사용 시 프로세스 내 캐시 유지 시간 (무효화 메시지를 놓친 경우의 상한)
+    PUBLIC_PROJECT_CACHE_TTL_SECONDS: int = 300
+    PUBLIC_PROJECT_CACHE_NEGATIVE_TTL_SECONDS: int = 30
+    PUBLIC_PROJECT_CACHE_MAX_ENTRIES: int = 10000
+    INGEST_PROFILE_CACHE_TTL_SECONDS: int = 300  # 리드/이벤트 수집용 프로젝트 정보 (수정/삭제 시 무효화)
+    INGEST_PROFILE_CACHE_NEGATIVE_TTL_SECONDS: int = 30  # 존재하지 않는 project_id
+    INGEST_PROFILE_CACHE_MAX_ENTRIES: int = 10000
+
+    # Notion API 미러 설정 ({page_id} 자리에 포맷된 페이지 ID)
+    NOTION_API_MIRRORS: list[str] = [
+        "https://notion-api.splitbee.io/v1/page/{page_id}",
+        "https://notion-api.vercel.app/v1/page/{page_id}",
+    ]
+    NOTION_HEDGE_ENABLED: bool = True  # 1순위 미러가 느리면 다음 미러에 동시 요청
+    NOTION_HEDGE_DEFAULT_DELAY_SECONDS: float = 1.0  # 지연 표본이 부족할 때
+    NOTION_HEDGE_MIN_DELAY_SECONDS: float = 0.2
+    NOTION_HEDGE_MAX_DELAY_SECONDS: float = 3.0
+    NOTION_MIRROR_EWMA_ALPHA: float = 0.2
+
+    # Notion 페이지 캐시 설정
+    NOTION_CACHE_DIR: str = "./.cache/notion"
+    NOTION_CACHE_SOFT_TTL_SECONDS: int = 60  # 이후 요청은 캐시 반환 + 백그라운드 갱신
+    NOTION_CACHE_HARD_TTL_SECONDS: int = 60 * 60 * 24  # 이후 요청은 업스트림 조회
+    NOTION_CACHE_MAX_ENTRIES: int = 500  # 메모리 보관 최대 페이지 수
+    NOTION_CACHE_DISK_MAX_BYTES: int = 512 * 1024 * 1024  # 디스크 캐시 최대 크기 (초과 시 오래된 파일부터 삭제)
+    NOTION_CACHE_DISK_MAX_FILES: int = 10000  # 디스크 캐시 최대 파일 수
+
+    # 성능 지표 설정
+    METRICS_ENABLED: bool = False  # /metrics (Prometheus) 및 요청/쿼리/외부 HTTP 지표 수집
+    SERVER_TIMING_ENABLED: bool = False  # 응답에 Server-Timing 헤더 (app/db/http 소요 시간, 쿼리 수, 모든 클라이언트에 노출)
+    MONITORING_TOKEN: str = ""  # /metrics, /health/* 통계 접근 토큰 (Bearer, 미설정 시 프록시를 거치지 않은 localhost 요청만 허용)
+
+    # 쿼리 프로파일링 (개발용, N+1/느린 쿼리 감지)
+    QUERY_PROFILING_ENABLED: bool = False
+    QUERY_PROFILING_REPEAT_THRESHOLD: int = 5  # 요청 하나에서 같은 형태 쿼리가 이 횟수를 넘으면 N+1 의심
+    QUERY_PROFILING_SLOW_QUERY_MS: int = 200  # 이 시간을 넘는 쿼리는 느린 쿼리로 출력
+    QUERY_PROFILING_RAISE: bool = False  # 출력 대신 예외 발생 (테스트/개발에서 회귀 차단)
+
     # 프론트엔드 URL
     FRONTEND_URL: str = "http://localhost:3000"
 
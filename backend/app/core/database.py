@@ -3,17 +3,140 @@
 SQLAlchemy 비동기 엔진 설정
 """
 
+import os
+
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import declarative_base
 from .config import settings
+from . import metrics, query_profiler
+
+
+def engine_options(database_url: str) -> dict:
+    """
+    방언별 엔진 옵션
+
+    - PostgreSQL(asyncpg): 커넥션 풀 크기/재활용/pre-ping, prepared statement 캐시
+    - SQLite: 파일 하나를 공유하므로 기본 풀 사용
+    """
+    options = {"echo": settings.DEBUG, "future": True}
+
+    if make_url(database_url).get_backend_name() == "postgresql":
+        options.update(
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+            pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+            pool_pre_ping=settings.DB_POOL_PRE_PING,
+            connect_args={
+                # asyncpg 자체 statement 캐시
+                "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+                "server_settings": {"application_name": settings.APP_NAME},
+            },
+        )
+
+    return options
+
+
+def engine_url(database_url: str):
+    """방언별 URL 보정 (SQLAlchemy asyncpg 어댑터의 prepared statement 캐시 크기)"""
+    url = make_url(database_url)
+    if url.get_backend_name() == "postgresql" and "prepared_statement_cache_size" not in url.query:
+        url = url.update_query_dict(
+            {"prepared_statement_cache_size": str(settings.DB_STATEMENT_CACHE_SIZE)}
+        )
+    return url
+
+
+def sqlite_production_mode(database_url: str) -> bool:
+    """SQLite 파일 DB 에서 WAL + 읽기 전용 풀 + 단일 writer 를 사용할지 여부"""
+    url = make_url(database_url)
+    return (
+        settings.SQLITE_WAL_ENABLED
+        and url.get_backend_name() == "sqlite"
+        and url.database not in (None, "", ":memory:")
+    )
+
+
+def sqlite_read_only_url(database_url: str) -> str:
+    """같은 SQLite 파일을 읽기 전용(mode=ro)으로 여는 URL"""
+    url = make_url(database_url)
+    path = os.path.abspath(url.database)
+    return f"{url.drivername}:///file:{path}?mode=ro&uri=true"
+
+
+def configure_sqlite(async_engine, read_only: bool = False) -> None:
+    """
+    SQLite 커넥션 설정 (연결 시 PRAGMA 적용)
+
+    쓰기 엔진은 드라이버의 암묵적 트랜잭션을 끄고 BEGIN 을 직접 발행한다.
+    (단일 writer 가 작업별 SAVEPOINT 를 사용할 수 있도록, 조회는 읽기 엔진 사용)
+    BEGIN IMMEDIATE 는 sqlite_begin_immediate 실행 옵션이 있는 커넥션(writer_session_maker)만 사용한다.
+    """
+    pragmas = [
+        f"PRAGMA busy_timeout = {settings.SQLITE_BUSY_TIMEOUT_MS}",
+        f"PRAGMA synchronous = {settings.SQLITE_SYNCHRONOUS}",
+        f"PRAGMA mmap_size = {settings.SQLITE_MMAP_SIZE}",
+        f"PRAGMA cache_size = -{settings.SQLITE_CACHE_SIZE_KB}",
+    ]
+    if read_only:
+        pragmas.append("PRAGMA query_only = ON")
+    else:
+        pragmas.insert(0, "PRAGMA journal_mode = WAL")
+
+    @event.listens_for(async_engine.sync_engine, "connect")
+    def on_connect(dbapi_connection, connection_record):
+        if not read_only:
+            dbapi_connection.isolation_level = None
+        cursor = dbapi_connection.cursor()
+        for pragma in pragmas:
+            cursor.execute(pragma)
+        cursor.close()
+
+    if not read_only:
+        @event.listens_for(async_engine.sync_engine, "begin")
+        def on_begin(conn):
+            # writer 트랜잭션: WAL 에서 읽기 트랜잭션을 쓰기로 올릴 때의 SQLITE_BUSY(스냅샷 만료)를
+            # 피하기 위해 시작 시점에 쓰기 잠금을 잡는다 (대기는 busy_timeout)
+            # 그 외 (커밋 후 refresh 등 조회): 쓰기 잠금 없이 시작
+            if conn.get_execution_options().get("sqlite_begin_immediate"):
+                conn.exec_driver_sql("BEGIN IMMEDIATE")
+            else:
+                conn.exec_driver_sql("BEGIN")
+
 
 # 비동기 엔진 생성
 engine = create_async_engine(
-    settings.DATABASE_URL,
-    echo=settings.DEBUG,
-    future=True,
+    engine_url(settings.DATABASE_URL),
+    **engine_options(settings.DATABASE_URL),
 )
 
+# 읽기 엔진 (SQLite 운영 모드에서는 읽기 전용 커넥션 풀, 그 외에는 같은 엔진)
+if sqlite_production_mode(settings.DATABASE_URL):
+    configure_sqlite(engine)
+    read_engine = create_async_engine(
+        sqlite_read_only_url(settings.DATABASE_URL),
+        echo=settings.DEBUG,
+        pool_size=settings.SQLITE_READ_POOL_SIZE,
+        max_overflow=0,
+    )
+    configure_sqlite(read_engine, read_only=True)
+else:
+    read_engine = engine
+
+# 쿼리 수/시간 지표
+if settings.METRICS_ENABLED:
+    metrics.instrument_engine(engine, "write" if read_engine is not engine else "main")
+    if read_engine is not engine:
+        metrics.instrument_engine(read_engine, "read")
+
+# 쿼리 프로파일러 (N+1/느린 쿼리 감지, 개발용)
+if settings.QUERY_PROFILING_ENABLED:
+    query_profiler.instrument_engine(engine)
+    if read_engine is not engine:
+        query_profiler.instrument_engine(read_engine)
+
 # 비동기 세션 팩토리
 async_session_maker = async_sessionmaker(
     engine,
@@ -23,10 +146,41 @@ async_session_maker = async_sessionmaker(
     autoflush=False,
 )
 
+# 쓰기 세션 팩토리 (단일 writer, 관리 스크립트 / SQLite 에서는 BEGIN IMMEDIATE 로 시작)
+writer_session_maker = async_sessionmaker(
+    engine.execution_options(sqlite_begin_immediate=True),
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autocommit=False,
+    autoflush=False,
+)
+
+# 읽기 전용 세션 팩토리 (조회 API, 내보내기)
+read_session_maker = async_sessionmaker(
+    read_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autocommit=False,
+    autoflush=False,
+)
+
 # 모델 베이스 클래스
 Base = declarative_base()
 
 
+def dialect_insert(dialect_name: str):
+    """
+    방언별 INSERT 구문 반환 (ON CONFLICT 지원)
+
+    SQLite(3.24+)와 PostgreSQL 모두 on_conflict_do_update/do_nothing 을 지원한다.
+    """
+    if dialect_name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    return insert
+
+
 async def get_db() -> AsyncSession:
     """
     데이터베이스 세션 의존성
@@ -41,6 +195,20 @@ async def get_db() -> AsyncSession:
             await session.close()
 
 
+async def get_read_db() -> AsyncSession:
+    """
+    읽기 전용 데이터베이스 세션 의존성 (조회 API 용)
+
+    Yields:
+        AsyncSession: 읽기 세션
+    """
+    async with read_session_maker() as session:
+        try:
+            yield session
+        finally:
+            await session.close()
+
+
 async def init_db(force_recreate: bool = False):
     """
     데이터베이스 테이블 초기화
@@ -49,7 +217,7 @@ async def init_db(force_recreate: bool = False):
         force_recreate: True면 기존 테이블을 삭제하고 재생성 (주의: 데이터 손실)
     """
     # 모든 모델을 import하여 메타데이터에 등록
-    from app.models import user, project, lead, event_log, bookmark  # noqa: F401
+    from app.models import user, project, lead, event_log, bookmark, project_stats, webhook_delivery, analytics  # noqa: F401
     
     async with engine.begin() as conn:
         if force_recreate:
@@ -58,6 +226,10 @@ async def init_db(force_recreate: bool = False):
             await conn.run_sync(Base.metadata.drop_all)
         await conn.run_sync(Base.metadata.create_all)
 
+        # 리드 검색 인덱스 (SQLite FTS5 / PostgreSQL pg_trgm)
+        from app.services.lead_search import ensure_search_index
+        await ensure_search_index(conn, force_recreate)
+
 
 
 
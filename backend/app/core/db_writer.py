@@ -0,0 +1,212 @@
+"""
+단일 DB writer
+SQLite 는 쓰기 트랜잭션이 파일 단위로 직렬화되므로, 쓰기 작업을 코루틴 하나에 모아
+한 트랜잭션으로 묶어 커밋 (group commit)
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Optional, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.core.database import sqlite_production_mode, writer_session_maker
+
+T = TypeVar("T")
+WriteJob = Callable[[AsyncSession], Awaitable[T]]
+
+
+# writer 코루틴 종료 신호 (큐 항목)
+_STOP = object()
+
+
+class _BatchAbortedError(Exception):
+    """SAVEPOINT 없이 실행한 작업 실패 (묶음 재실행 필요)"""
+
+
+class DatabaseWriter:
+    """
+    단일 writer
+
+    - run(job) 은 job(session) 을 writer 코루틴에 넘기고 커밋 후 결과를 돌려받음
+    - 대기 중인 작업을 최대 max_batch 개까지 한 트랜잭션으로 실행 (작업별 SAVEPOINT)
+    - 한 작업이 실패해도 해당 작업만 되돌리고 나머지는 커밋
+    - isolated=False 작업은 SAVEPOINT 없이 실행 (왕복 2회 절약). 실패 시 묶음 전체를
+      되돌리고 모든 작업을 SAVEPOINT 와 함께 다시 실행하므로, 다시 실행해도 결과가 같아야 함
+    - job 안에서 commit/rollback 하지 않아야 함
+    - 비활성화(PostgreSQL 등) 또는 시작 전/종료 후에는 세션을 열어 바로 실행
+    - 종료 시 진행 중인 묶음과 대기 중인 작업을 모두 처리한 뒤 writer 코루틴이 끝남
+    """
+
+    def __init__(self, session_maker: async_sessionmaker, enabled: bool, max_batch: int):
+        self.session_maker = session_maker
+        self.enabled = enabled
+        self.max_batch = max_batch
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self.stats = {
+            "jobs": 0,
+            "job_errors": 0,
+            "commits": 0,
+            "commit_errors": 0,
+            "max_batch_seen": 0,
+            "batch_retries": 0,
+        }
+
+    async def run(self, job: WriteJob, isolated: bool = True) -> T:
+        """
+        쓰기 작업 실행 (커밋까지 완료된 뒤 반환)
+
+        Args:
+            isolated: False 면 SAVEPOINT 없이 실행 (다시 실행해도 안전한 작업만)
+        """
+        if self._task is None:
+            async with self.session_maker() as session:
+                result = await job(session)
+                await session.commit()
+                return result
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((job, future, isolated))
+        return await future
+
+    async def start(self) -> None:
+        """writer 코루틴 시작"""
+        if not self.enabled or self._task is not None:
+            return
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._writer_loop())
+
+    async def stop(self) -> None:
+        """
+        대기 중인 작업을 모두 커밋한 뒤 중지
+
+        종료 신호를 큐에 넣고 writer 코루틴이 진행 중인 묶음과 남은 작업을 처리한 뒤
+        스스로 끝나기를 기다린다 (커밋 도중 취소하지 않음).
+        """
+        if self._task is None:
+            return
+        task = self._task
+        await self._queue.put(_STOP)
+        await task
+        self._task = None
+
+        # writer 종료와 중지 사이에 들어온 작업 (이후 작업은 run() 에서 바로 실행)
+        while not self._queue.empty():
+            await self._commit_jobs(self._drain())
+
+    def _drain(self) -> list:
+        jobs = []
+        while len(jobs) < self.max_batch and not self._queue.empty():
+            jobs.append(self._queue.get_nowait())
+        return jobs
+
+    async def _writer_loop(self) -> None:
+        stopping = False
+        while not (stopping and self._queue.empty()):
+            if stopping:
+                jobs = self._drain()
+            else:
+                jobs = [await self._queue.get()]
+                jobs.extend(self._drain())
+            if any(job is _STOP for job in jobs):
+                # 종료 신호 이후에 들어온 작업까지 모두 처리하고 종료
+                stopping = True
+                jobs = [job for job in jobs if job is not _STOP]
+            if jobs:
+                await self._commit_jobs(jobs)
+
+    async def _commit_jobs(self, jobs: list) -> None:
+        """묶음 커밋 (실행하지 못한 작업은 예외로 결과 설정)"""
+        try:
+            await self._commit_batch(jobs)
+        except asyncio.CancelledError:
+            # 이벤트 루프 종료 등으로 writer 가 취소된 경우
+            for _, future, _ in jobs:
+                if not future.done():
+                    future.set_exception(RuntimeError("DB writer 가 중지되어 쓰기 작업이 취소되었습니다"))
+            raise
+        except Exception as e:
+            print(f"DB writer 에러: {str(e)}")
+            for _, future, _ in jobs:
+                if not future.done():
+                    future.set_exception(e)
+
+    async def _run_jobs(
+        self,
+        session: AsyncSession,
+        jobs: list,
+        isolate_all: bool,
+        failed: set[int],
+    ) -> list:
+        """
+        묶음의 작업 실행
+
+        큐에 들어간 작업은 호출자가 취소되어도 실행한다 (결과만 버림).
+        실패한 작업의 순번은 failed 에 기록하고, 다시 실행할 때 건너뛴다.
+
+        Raises:
+            _BatchAbortedError: SAVEPOINT 없이 실행한 작업이 실패한 경우 (묶음 전체를 되돌려야 함)
+        """
+        results = []
+        for index, (job, future, isolated) in enumerate(jobs):
+            if index in failed:
+                continue
+            if not isolated and not isolate_all:
+                try:
+                    results.append((future, await job(session)))
+                except Exception as e:
+                    raise _BatchAbortedError() from e
+                continue
+            try:
+                async with session.begin_nested():
+                    results.append((future, await job(session)))
+            except Exception as e:
+                self.stats["job_errors"] += 1
+                failed.add(index)
+                if not future.done():
+                    future.set_exception(e)
+        return results
+
+    async def _commit_batch(self, jobs: list) -> None:
+        self.stats["max_batch_seen"] = max(self.stats["max_batch_seen"], len(jobs))
+        self.stats["jobs"] += len(jobs)
+
+        failed: set[int] = set()
+        async with self.session_maker() as session:
+            try:
+                results = await self._run_jobs(session, jobs, isolate_all=False, failed=failed)
+            except _BatchAbortedError:
+                # 묶음을 되돌리고 모든 작업을 SAVEPOINT 로 격리해 다시 실행
+                self.stats["batch_retries"] += 1
+                await session.rollback()
+                results = await self._run_jobs(session, jobs, isolate_all=True, failed=failed)
+
+            try:
+                await session.commit()
+                self.stats["commits"] += 1
+            except Exception as e:
+                self.stats["commit_errors"] += 1
+                for future, _ in results:
+                    if not future.done():
+                        future.set_exception(e)
+                return
+
+        for future, result in results:
+            if not future.done():
+                future.set_result(result)
+
+    def snapshot(self) -> dict:
+        """writer 통계"""
+        return {
+            **self.stats,
+            "enabled": self.enabled,
+            "pending": self._queue.qsize() if self._queue is not None else 0,
+        }
+
+
+db_writer = DatabaseWriter(
+    writer_session_maker,
+    enabled=sqlite_production_mode(settings.DATABASE_URL),
+    max_batch=settings.SQLITE_WRITER_MAX_BATCH,
+)
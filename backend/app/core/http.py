@@ -0,0 +1,204 @@
+"""
+외부 HTTP 클라이언트
+애플리케이션 전역에서 공유하는 커넥션 풀 (Webhook, Notion 프록시)
+"""
+
+import asyncio
+import time
+from typing import Optional
+
+import httpx
+
+from .config import settings
+from .metrics import CallbackMetric, record_outbound_http, register
+
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    """응답 본문 스트림이 닫힐 때 호스트 슬롯 반환 + 지연 시간 기록"""
+
+    def __init__(self, stream: httpx.AsyncByteStream, on_close):
+        self._stream = stream
+        self._on_close = on_close
+
+    async def __aiter__(self):
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            on_close, self._on_close = self._on_close, None
+            if on_close is not None:
+                on_close()
+
+
+class PooledTransport(httpx.AsyncHTTPTransport):
+    """
+    호스트별 동시 요청 제한 + 요청 수/지연 시간 집계 transport
+
+    httpx.Limits 는 풀 전체 기준이므로, 호스트별 제한은 세마포어로 건다.
+    슬롯은 응답 본문 스트림이 닫힐 때 반환한다 (본문을 읽는 동안에도 커넥션을 쓰고 있으므로).
+    """
+
+    def __init__(self, max_connections_per_host: int, **kwargs):
+        super().__init__(**kwargs)
+        self.max_connections_per_host = max_connections_per_host
+        self._host_limits: dict[str, asyncio.Semaphore] = {}
+        self.requests_total = 0
+        self.in_flight = 0
+        self.host_limit_waits_total = 0  # 호스트별 제한으로 대기한 요청 수
+        self.pool_timeouts_total = 0  # 풀 전체 커넥션 대기 시간 초과 수
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.netloc.decode("ascii")
+        limit = self._host_limits.setdefault(
+            host, asyncio.Semaphore(self.max_connections_per_host)
+        )
+
+        if limit.locked():
+            self.host_limit_waits_total += 1
+        await limit.acquire()
+
+        self.requests_total += 1
+        self.in_flight += 1
+        start = time.perf_counter()
+
+        def finish(status_code: int) -> None:
+            self.in_flight -= 1
+            limit.release()
+            # 호출자가 extensions={"metrics_target": ...} 로 용도 표시 (호스트별 라벨 증가 방지)
+            record_outbound_http(
+                request.extensions.get("metrics_target", "other"),
+                status_code,
+                time.perf_counter() - start,
+            )
+
+        try:
+            response = await super().handle_async_request(request)
+        except BaseException as e:
+            if isinstance(e, httpx.PoolTimeout):
+                self.pool_timeouts_total += 1
+            finish(0)
+            raise
+
+        response.stream = _ReleasingStream(
+            response.stream, lambda: finish(response.status_code)
+        )
+        return response
+
+    def connection_counts(self) -> tuple[int, int]:
+        """
+        httpcore 풀의 (전체 커넥션 수, 유휴 커넥션 수)
+
+        유휴 = keep-alive 로 열려 있지만 진행 중인 요청/스트림이 없는 커넥션
+        """
+        connections = list(getattr(self._pool, "connections", ()))
+        return len(connections), sum(1 for connection in connections if connection.is_idle())
+
+    def stats(self) -> dict:
+        """커넥션/요청/대기 집계 (응답 본문을 닫기 전까지 in_flight 로 셈)"""
+        connections, idle = self.connection_counts()
+        return {
+            "connections": connections,
+            "idle_connections": idle,
+            "active_connections": connections - idle,
+            "in_flight_requests": self.in_flight,
+            "requests_total": self.requests_total,
+            "host_limit_waits_total": self.host_limit_waits_total,
+            "pool_timeouts_total": self.pool_timeouts_total,
+            "hosts": len(self._host_limits),
+            "hosts_at_limit": sum(1 for limit in self._host_limits.values() if limit.locked()),
+        }
+
+
+_client: Optional[httpx.AsyncClient] = None
+_transport: Optional[PooledTransport] = None
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """공유 HTTP 클라이언트 생성"""
+    global _transport
+
+    limits = httpx.Limits(
+        max_connections=settings.HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY_SECONDS,
+    )
+    _transport = PooledTransport(
+        max_connections_per_host=settings.HTTP_MAX_CONNECTIONS_PER_HOST,
+        http2=settings.HTTP2_ENABLED,
+        limits=limits,
+    )
+    timeout = httpx.Timeout(
+        settings.HTTP_READ_TIMEOUT_SECONDS,
+        connect=settings.HTTP_CONNECT_TIMEOUT_SECONDS,
+        pool=settings.HTTP_POOL_TIMEOUT_SECONDS,
+    )
+
+    return httpx.AsyncClient(transport=_transport, timeout=timeout)
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    공유 HTTP 클라이언트 반환
+
+    main.lifespan 에서 생성되며, 스크립트 등 lifespan 밖에서 호출되면 지연 생성한다.
+    """
+    global _client
+
+    if _client is None or _client.is_closed:
+        _client = create_http_client()
+    return _client
+
+
+async def close_http_client() -> None:
+    """공유 HTTP 클라이언트 종료 (애플리케이션 종료 시)"""
+    global _client, _transport
+
+    if _client is not None:
+        await _client.aclose()
+    _client = None
+    _transport = None
+
+
+def get_http_pool_stats() -> dict:
+    """공유 HTTP 클라이언트 커넥션/요청/대기 집계"""
+    if _transport is None:
+        return {}
+    return _transport.stats()
+
+
+def _pool_gauges() -> dict:
+    stats = get_http_pool_stats()
+    return {
+        (state,): stats[key]
+        for state, key in (
+            ("idle", "idle_connections"),
+            ("active", "active_connections"),
+            ("in_flight_requests", "in_flight_requests"),
+            ("hosts_at_limit", "hosts_at_limit"),
+        )
+        if key in stats
+    }
+
+
+def _pool_counters() -> dict:
+    stats = get_http_pool_stats()
+    return {
+        (reason,): stats[key]
+        for reason, key in (("host_limit", "host_limit_waits_total"), ("pool_timeout", "pool_timeouts_total"))
+        if key in stats
+    }
+
+
+register(CallbackMetric(
+    "formtion_outbound_http_pool", "공유 HTTP 클라이언트 커넥션/요청 수", ("state",), _pool_gauges
+))
+register(CallbackMetric(
+    "formtion_outbound_http_pool_waits_total",
+    "공유 HTTP 클라이언트 대기 수 (호스트별 제한 / 풀 대기 시간 초과)",
+    ("reason",),
+    _pool_counters,
+    kind="counter",
+))
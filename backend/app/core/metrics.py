@@ -0,0 +1,273 @@
+"""
+성능 지표 수집
+요청 지연/동시 처리 수, DB 쿼리 수/시간, 외부 HTTP 지연을 모아 Prometheus 텍스트 형식으로 노출
+
+- 지표는 워커 프로세스별로 집계됨 (여러 워커 실행 시 Prometheus 가 워커별로 수집)
+- 요청별 DB/외부 HTTP 사용량은 contextvar 로 모아 Server-Timing 헤더에 기록
+"""
+
+import time
+from contextvars import ContextVar
+from typing import Iterable, Optional
+
+from sqlalchemy import event
+
+from app.core.config import settings
+
+# 요청 지연 버킷 (초)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# 요청당 쿼리 수 버킷
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+
+def _format_labels(names: tuple, values: tuple, extra: str = "") -> str:
+    pairs = [
+        '{}="{}"'.format(name, str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for name, value in zip(names, values)
+    ]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """누적 카운터"""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._values: dict[tuple, float] = {}
+
+    def inc(self, labels: tuple = (), amount: float = 1) -> None:
+        self._values[labels] = self._values.get(labels, 0) + amount
+
+    def samples(self) -> Iterable[str]:
+        for labels, value in self._values.items():
+            yield f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+
+
+class Gauge(Counter):
+    """현재 값"""
+
+    kind = "gauge"
+
+    def dec(self, labels: tuple = (), amount: float = 1) -> None:
+        self.inc(labels, -amount)
+
+
+class CallbackMetric:
+    """수집 시점에 값을 읽는 지표 (커넥션 풀 사용량 등, callback 은 {labels: 값} 반환)"""
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple, callback, kind: str = "gauge"):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.callback = callback
+        self.kind = kind
+
+    def samples(self) -> Iterable[str]:
+        for labels, value in self.callback().items():
+            yield f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+
+
+class Histogram:
+    """분포 (누적 버킷 + 합계 + 개수)"""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple = (), buckets: tuple = LATENCY_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.buckets = tuple(buckets) + (float("inf"),)
+        # labels -> [버킷별 개수..., 합계]
+        self._values: dict[tuple, list] = {}
+
+    def observe(self, value: float, labels: tuple = ()) -> None:
+        state = self._values.get(labels)
+        if state is None:
+            state = self._values[labels] = [0] * len(self.buckets) + [0.0]
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                state[index] += 1
+                break
+        state[-1] += value
+
+    def samples(self) -> Iterable[str]:
+        for labels, state in self._values.items():
+            cumulative = 0
+            for bound, count in zip(self.buckets, state):
+                cumulative += count
+                le = 'le="{}"'.format(_format_value(bound) if bound == float("inf") else bound)
+                yield f"{self.name}_bucket{_format_labels(self.labelnames, labels, le)} {cumulative}"
+            label_text = _format_labels(self.labelnames, labels)
+            yield f"{self.name}_sum{label_text} {_format_value(state[-1])}"
+            yield f"{self.name}_count{label_text} {cumulative}"
+
+
+http_requests_total = Counter(
+    "formtion_http_requests_total", "처리한 HTTP 요청 수", ("method", "route", "status")
+)
+http_request_duration = Histogram(
+    "formtion_http_request_duration_seconds", "HTTP 요청 처리 시간", ("method", "route")
+)
+http_requests_in_progress = Gauge(
+    "formtion_http_requests_in_progress", "처리 중인 HTTP 요청 수", ("method",)
+)
+http_request_db_queries = Histogram(
+    "formtion_http_request_db_queries", "HTTP 요청당 DB 쿼리 수", ("route",), QUERY_COUNT_BUCKETS
+)
+db_queries_total = Counter(
+    "formtion_db_queries_total", "실행한 DB 쿼리 수 (백그라운드 작업 포함)", ("engine",)
+)
+db_query_duration = Histogram(
+    "formtion_db_query_duration_seconds", "DB 쿼리 실행 시간", ("engine",)
+)
+outbound_http_duration = Histogram(
+    "formtion_outbound_http_duration_seconds", "외부 HTTP 요청 시간 (Webhook, Notion)", ("target", "status")
+)
+
+REGISTRY = [
+    http_requests_total,
+    http_request_duration,
+    http_requests_in_progress,
+    http_request_db_queries,
+    db_queries_total,
+    db_query_duration,
+    outbound_http_duration,
+]
+
+
+def register(metric) -> None:
+    """다른 모듈의 지표를 /metrics 에 추가"""
+    REGISTRY.append(metric)
+
+
+def render_metrics() -> str:
+    """Prometheus 텍스트 형식 (0.0.4)"""
+    lines = []
+    for metric in REGISTRY:
+        lines.append(f"# HELP {metric.name} {metric.documentation}")
+        lines.append(f"# TYPE {metric.name} {metric.kind}")
+        lines.extend(metric.samples())
+    return "\n".join(lines) + "\n"
+
+
+class RequestTimings:
+    """요청 하나의 DB/외부 HTTP 사용량"""
+
+    __slots__ = ("db_queries", "db_seconds", "http_calls", "http_seconds")
+
+    def __init__(self):
+        self.db_queries = 0
+        self.db_seconds = 0.0
+        self.http_calls = 0
+        self.http_seconds = 0.0
+
+
+_request_timings: ContextVar[Optional[RequestTimings]] = ContextVar("request_timings", default=None)
+
+
+def instrument_engine(engine, name: str) -> None:
+    """
+    엔진 쿼리 수/시간 집계 (database 모듈에서 엔진 생성 직후 호출)
+
+    단일 writer 등 백그라운드 작업의 쿼리는 전체 집계에만 포함되고 요청별 집계에는 들어가지 않는다.
+    """
+    labels = (name,)
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("metrics_query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["metrics_query_start"].pop()
+        db_queries_total.inc(labels)
+        db_query_duration.observe(elapsed, labels)
+
+        timings = _request_timings.get()
+        if timings is not None:
+            timings.db_queries += 1
+            timings.db_seconds += elapsed
+
+
+def record_outbound_http(target: str, status: int, elapsed: float) -> None:
+    """외부 HTTP 요청 1회 기록 (공유 HTTP transport 에서 호출)"""
+    outbound_http_duration.observe(elapsed, (target, str(status)))
+
+    timings = _request_timings.get()
+    if timings is not None:
+        timings.http_calls += 1
+        timings.http_seconds += elapsed
+
+
+def route_label(scope: dict) -> str:
+    """라우트 경로 템플릿 (경로 파라미터 값으로 라벨이 늘어나지 않도록)"""
+    route = scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
+
+
+def _server_timing(total: float, timings: RequestTimings) -> bytes:
+    parts = [f"app;dur={total * 1000:.1f}"]
+    if timings.db_queries:
+        parts.append(f'db;dur={timings.db_seconds * 1000:.1f};desc="{timings.db_queries} queries"')
+    if timings.http_calls:
+        parts.append(f'http;dur={timings.http_seconds * 1000:.1f};desc="{timings.http_calls} calls"')
+    return ", ".join(parts).encode("latin-1")
+
+
+class MetricsMiddleware:
+    """
+    요청 지표 수집 ASGI 미들웨어
+
+    - 라우트별 지연 히스토그램, 상태 코드별 요청 수, 처리 중 요청 수
+    - 요청별 DB 쿼리 수 (N+1 확인용)
+    - SERVER_TIMING_ENABLED 시 Server-Timing 헤더 (app / db / http 소요 시간)
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        timings = RequestTimings()
+        token = _request_timings.set(timings)
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if settings.SERVER_TIMING_ENABLED:
+                    headers = list(message.get("headers", []))
+                    headers.append((b"server-timing", _server_timing(time.perf_counter() - start, timings)))
+                    message = {**message, "headers": headers}
+            await send(message)
+
+        http_requests_in_progress.inc((method,))
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            http_requests_in_progress.dec((method,))
+            _request_timings.reset(token)
+
+            route = route_label(scope)
+            http_requests_total.inc((method, route, str(status_code)))
+            http_request_duration.observe(time.perf_counter() - start, (method, route))
+            http_request_db_queries.observe(timings.db_queries, (route,))
@@ -0,0 +1,160 @@
+"""
+쿼리 프로파일러 (개발/프로파일링 모드)
+요청별로 실행된 SQL 을 형태(fingerprint)별로 세어 N+1 패턴과 느린 쿼리를 찾아냄
+
+- QUERY_PROFILING_ENABLED 설정 시에만 엔진에 연결 (운영 기본값은 비활성)
+- 같은 형태의 쿼리가 요청 하나에서 QUERY_PROFILING_REPEAT_THRESHOLD 회를 넘거나
+  쿼리 하나가 QUERY_PROFILING_SLOW_QUERY_MS 를 넘으면 라우트와 호출 위치를 출력
+- QUERY_PROFILING_RAISE 설정 시 출력 대신 QueryProfilingError 발생 (테스트/개발에서 회귀 차단)
+"""
+
+import os
+import re
+import time
+import traceback
+from contextvars import ContextVar
+from typing import Optional
+
+import greenlet
+from sqlalchemy import event
+
+from app.core.config import settings
+from app.core.metrics import route_label
+
+# 호출 위치 출력 시 남길 app 패키지 프레임 수
+STACK_DEPTH = 6
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CORE_DIR = os.path.join(APP_DIR, "core")
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_POSITIONAL_PARAM = re.compile(r"\$\d+|%\(\w+\)s|%s|:\w+")
+_PARAM_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+# 트랜잭션 제어 구문 (BEGIN IMMEDIATE, 작업별 SAVEPOINT 등은 요청당 반복되어도 N+1 이 아님)
+_TRANSACTION_CONTROL = re.compile(
+    r"^\s*(BEGIN|COMMIT|END|ROLLBACK|SAVEPOINT|RELEASE)\b", re.IGNORECASE
+)
+
+
+class QueryProfilingError(RuntimeError):
+    """프로파일링 임계값 초과 (QUERY_PROFILING_RAISE 설정 시)"""
+
+
+def fingerprint(statement: str) -> str:
+    """
+    쿼리 형태 (리터럴/바인드 파라미터/IN 목록 길이 차이를 무시)
+
+    예: SELECT ... WHERE id IN (?, ?, ?) AND name = 'a' → SELECT ... WHERE id IN (?) AND name = ?
+    """
+    statement = _STRING_LITERAL.sub("?", statement)
+    statement = _POSITIONAL_PARAM.sub("?", statement)
+    statement = _NUMBER_LITERAL.sub("?", statement)
+    statement = _PARAM_LIST.sub("(?)", statement)
+    return _WHITESPACE.sub(" ", statement).strip()
+
+
+def _app_stack() -> list[str]:
+    """
+    현재 쿼리를 실행한 app 코드 위치 (가까운 순)
+
+    SQLAlchemy 비동기 API 는 동기 코드를 별도 greenlet 에서 실행하므로,
+    부모 greenlet(요청 코루틴) 프레임에서 호출 스택을 읽는다.
+    """
+    parent = greenlet.getcurrent().parent
+    frames = traceback.extract_stack(parent.gr_frame if parent is not None else None)
+
+    lines = []
+    for frame in reversed(frames):
+        if frame.filename.startswith(APP_DIR) and not frame.filename.startswith(CORE_DIR):
+            lines.append(f"{os.path.relpath(frame.filename, os.path.dirname(APP_DIR))}:{frame.lineno} in {frame.name}")
+            if len(lines) >= STACK_DEPTH:
+                break
+    return lines
+
+
+class RequestQueryProfile:
+    """요청 하나에서 실행된 쿼리 집계"""
+
+    def __init__(self, scope: dict):
+        self.scope = scope
+        self.total = 0
+        self.counts: dict[str, int] = {}
+        # 임계값을 넘은 쿼리 형태 → 넘는 시점의 호출 위치
+        self.repeated: dict[str, list[str]] = {}
+
+    @property
+    def route(self) -> str:
+        return f"{self.scope['method']} {route_label(self.scope)}"
+
+
+_profile: ContextVar[Optional[RequestQueryProfile]] = ContextVar("query_profile", default=None)
+
+
+def _report(title: str, statement: str, stack: list[str]) -> None:
+    lines = [f"⚠️  {title}", f"    {statement[:500]}"]
+    lines.extend(f"    ← {line}" for line in stack)
+    print("\n".join(lines))
+
+
+def instrument_engine(engine) -> None:
+    """엔진에 프로파일러 연결 (database 모듈에서 엔진 생성 직후 호출)"""
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("profiler_query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed_ms = (time.perf_counter() - conn.info["profiler_query_start"].pop()) * 1000
+        profile = _profile.get()
+        if profile is None:
+            # 요청 밖 (단일 writer, 백그라운드 작업)
+            return
+        if _TRANSACTION_CONTROL.match(statement):
+            return
+
+        profile.total += 1
+        shape = fingerprint(statement)
+        count = profile.counts.get(shape, 0) + 1
+        profile.counts[shape] = count
+
+        if elapsed_ms > settings.QUERY_PROFILING_SLOW_QUERY_MS:
+            title = f"느린 쿼리 {elapsed_ms:.0f}ms: {profile.route}"
+            if settings.QUERY_PROFILING_RAISE:
+                raise QueryProfilingError(f"{title}\n{shape}")
+            _report(title, shape, _app_stack())
+
+        if count == settings.QUERY_PROFILING_REPEAT_THRESHOLD + 1:
+            if settings.QUERY_PROFILING_RAISE:
+                raise QueryProfilingError(
+                    f"N+1 의심: {profile.route} 에서 같은 쿼리 {count}회 이상\n{shape}"
+                )
+            profile.repeated[shape] = _app_stack()
+
+
+class QueryProfilerMiddleware:
+    """요청별 쿼리 집계 ASGI 미들웨어 (응답 후 N+1 의심 쿼리 출력)"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        profile = RequestQueryProfile(scope)
+        token = _profile.set(profile)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _profile.reset(token)
+            for shape, stack in profile.repeated.items():
+                _report(
+                    f"N+1 의심: {profile.route} 에서 같은 쿼리 {profile.counts[shape]}회 "
+                    f"(요청 전체 쿼리 {profile.total}회)",
+                    shape,
+                    stack,
+                )
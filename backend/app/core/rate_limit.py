@@ -0,0 +1,200 @@
+"""
+요청 속도 제한
+슬라이딩 윈도우 카운터 (현재/직전 윈도우 카운터 2개, 요청당 O(1))
+
+- CACHE_REDIS_URL 이 설정되어 있으면 Redis 에 카운터를 두어 워커/호스트 간 제한 공유
+- 미설정 시 프로세스 내 카운터 사용
+- 라우트별(IP 기준) 제한은 의존성, 프로젝트별 제한은 핸들러에서 check_project_budget 호출
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+from fastapi import HTTPException, Request, status
+
+from app.core.cache import get_redis_client
+from app.core.config import settings
+
+
+class MemoryRateLimitStore:
+    """
+    프로세스 내 윈도우 카운터
+
+    - 최근 사용 순서(LRU)로 유지하여 사용 중인 카운터는 제거하지 않음
+    - 요청마다 가장 오래 사용하지 않은 쪽에서 만료 키를 최대 prune_batch 개 정리 (O(1))
+    - 최대 키 수 초과 시 가장 오래 사용하지 않은 키부터 제거
+    """
+
+    def __init__(self, max_keys: int = 100000, prune_batch: int = 4):
+        self.max_keys = max_keys
+        self.prune_batch = prune_batch
+        self._counters: "OrderedDict[str, tuple[float, int]]" = OrderedDict()
+
+    async def incr(self, key: str, cost: int, ttl: int) -> int:
+        now = time.monotonic()
+        expires_at, count = self._counters.get(key, (0.0, 0))
+        if expires_at <= now:
+            count = 0
+            expires_at = now + ttl
+        count += cost
+        self._counters[key] = (expires_at, count)
+        self._counters.move_to_end(key)
+        self._evict(now)
+        return count
+
+    async def get(self, key: str) -> int:
+        item = self._counters.get(key)
+        if item is None or item[0] <= time.monotonic():
+            return 0
+        self._counters.move_to_end(key)
+        return item[1]
+
+    def _evict(self, now: float) -> None:
+        for _ in range(self.prune_batch):
+            if not self._counters:
+                break
+            key, (expires_at, _) = next(iter(self._counters.items()))
+            if expires_at > now:
+                break
+            del self._counters[key]
+        while len(self._counters) > self.max_keys:
+            self._counters.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._counters)
+
+
+class RedisRateLimitStore:
+    """
+    Redis 프로토콜 윈도우 카운터
+
+    pipeline(transaction=True) / incrby / expire / get 을 지원하는 비동기 클라이언트면
+    무엇이든 사용 가능 (redis.asyncio.Redis, 테스트용 fake 등).
+    """
+
+    def __init__(self, client: Any):
+        self.client = client
+        self.prefix = "formtion:ratelimit:"
+
+    async def incr(self, key: str, cost: int, ttl: int) -> int:
+        # INCRBY 와 EXPIRE 를 MULTI/EXEC 로 함께 실행 (중간에 프로세스가 죽어도 만료 없는 키가 남지 않음)
+        # 키 이름에 윈도우 번호가 있으므로 만료를 매번 갱신해도 집계에는 영향 없음
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.incrby(self.prefix + key, cost)
+            pipe.expire(self.prefix + key, ttl)
+            count, _ = await pipe.execute()
+        return int(count)
+
+    async def get(self, key: str) -> int:
+        value = await self.client.get(self.prefix + key)
+        return int(value) if value is not None else 0
+
+
+class RateLimiter:
+    """
+    슬라이딩 윈도우 카운터
+
+    추정 요청 수 = 직전 윈도우 수 × (직전 윈도우가 겹치는 비율) + 현재 윈도우 수
+    """
+
+    def __init__(self, store: Any, window_seconds: int = 60):
+        self.store = store
+        self.window_seconds = window_seconds
+        self.stats = {"allowed": 0, "limited": 0, "errors": 0}
+
+    async def hit(self, key: str, limit: int, cost: int = 1) -> Optional[int]:
+        """
+        요청 기록 후 제한 여부 확인
+
+        Returns:
+            제한되면 재시도까지 대기 시간(초), 허용되면 None
+        """
+        now = time.time()
+        window = int(now // self.window_seconds)
+        elapsed = now - window * self.window_seconds
+
+        try:
+            current, previous = await asyncio.gather(
+                self.store.incr(f"{key}:{window}", cost, self.window_seconds * 2),
+                self.store.get(f"{key}:{window - 1}"),
+            )
+        except Exception as e:
+            # 저장소 장애 시 요청은 허용 (fail open)
+            print(f"Rate limit 저장소 에러: {str(e)}")
+            self.stats["errors"] += 1
+            return None
+
+        estimated = previous * (1 - elapsed / self.window_seconds) + current
+        if estimated <= limit:
+            self.stats["allowed"] += 1
+            return None
+
+        self.stats["limited"] += 1
+        return max(int(self.window_seconds - elapsed), 1)
+
+    def snapshot(self) -> dict:
+        return {**self.stats, "backend": type(self.store).__name__}
+
+
+_rate_limiter: Optional[RateLimiter] = None
+
+
+def get_rate_limiter() -> RateLimiter:
+    """공유 rate limiter (CACHE_REDIS_URL 설정 시 Redis 저장소)"""
+    global _rate_limiter
+
+    if _rate_limiter is None:
+        redis_client = get_redis_client()
+        store = RedisRateLimitStore(redis_client) if redis_client is not None else MemoryRateLimitStore()
+        _rate_limiter = RateLimiter(store)
+
+    return _rate_limiter
+
+
+def _too_many_requests(retry_after: int) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail="요청이 너무 많습니다. 잠시 후 다시 시도해주세요.",
+        headers={"Retry-After": str(retry_after)},
+    )
+
+
+def rate_limit(scope: str, limit_setting: str = "RATE_LIMIT_PER_MINUTE"):
+    """
+    라우트별 IP 기준 분당 제한 의존성
+
+    Args:
+        scope: 카운터 구분 이름 (예: "leads")
+        limit_setting: 분당 허용 수를 담은 Settings 필드 이름 (0 이하면 제한 없음)
+
+    사용법:
+        @router.post("", dependencies=[Depends(rate_limit("leads", "RATE_LIMIT_LEADS_PER_MINUTE"))])
+    """
+    async def dependency(request: Request) -> None:
+        limit = getattr(settings, limit_setting)
+        if not settings.RATE_LIMIT_ENABLED or limit <= 0:
+            return
+
+        client_ip = request.client.host if request.client else "unknown"
+        retry_after = await get_rate_limiter().hit(f"{scope}:ip:{client_ip}", limit)
+        if retry_after is not None:
+            raise _too_many_requests(retry_after)
+
+    return dependency
+
+
+async def check_project_budget(scope: str, project_id: str, limit: int, cost: int = 1) -> None:
+    """
+    프로젝트별 분당 제한 (모든 방문자 합산)
+
+    Raises:
+        HTTPException: 429 (제한 초과 시)
+    """
+    if not settings.RATE_LIMIT_ENABLED or limit <= 0:
+        return
+
+    retry_after = await get_rate_limiter().hit(f"{scope}:project:{project_id}", limit, cost)
+    if retry_after is not None:
+        raise _too_many_requests(retry_after)
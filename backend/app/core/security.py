@@ -3,14 +3,28 @@
 JWT 토큰 생성/검증, 비밀번호 해싱
 """
 
+import asyncio
+import base64
+import hashlib
+import hmac
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Tuple
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from .config import settings
 
 # 비밀번호 해싱 컨텍스트 (bcrypt 사용)
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# 설정된 cost 와 다른 해시는 needs_update 대상 (로그인 시 재해싱)
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__default_rounds=settings.BCRYPT_ROUNDS,
+    bcrypt__min_rounds=settings.BCRYPT_ROUNDS,
+    bcrypt__max_rounds=settings.BCRYPT_ROUNDS,
+)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -23,6 +37,137 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+class PasswordHasherBusyError(Exception):
+    """해싱 대기열이 가득 참"""
+
+
+class PasswordHasher:
+    """
+    비밀번호 해싱/검증 전용 스레드 풀
+
+    - bcrypt 는 수백 ms 동안 CPU 를 쓰므로 이벤트 루프 밖(스레드)에서 실행
+    - 동시 작업 수는 workers, 대기 포함 최대 작업 수는 max_pending 으로 제한
+    - max_pending 초과 시 PasswordHasherBusyError (호출자가 503 반환)
+    - pending 은 작업이 끝나거나 시작 전에 취소될 때 줄어듦 (요청이 취소되어도 실행 중인 작업은 계속 셈)
+    - 카운터/통계는 이벤트 루프와 해싱 스레드가 함께 갱신하므로 잠금으로 보호
+    """
+
+    def __init__(self, workers: int, max_pending: int):
+        self.workers = workers
+        self.max_pending = max_pending
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self.pending = 0
+        self.running = 0
+        self.stats = {
+            "completed": 0,
+            "cancelled": 0,
+            "rejected": 0,
+            "rehashed": 0,
+            "max_pending_seen": 0,
+            "total_wait_seconds": 0.0,
+            "total_run_seconds": 0.0,
+        }
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="password-hasher"
+            )
+        return self._executor
+
+    async def _run(self, func, *args):
+        with self._lock:
+            if self.pending >= self.max_pending:
+                self.stats["rejected"] += 1
+                raise PasswordHasherBusyError()
+            self.pending += 1
+            self.stats["max_pending_seen"] = max(self.stats["max_pending_seen"], self.pending)
+        submitted_at = time.monotonic()
+
+        def timed():
+            started_at = time.monotonic()
+            with self._lock:
+                self.running += 1
+            try:
+                return func(*args)
+            finally:
+                finished_at = time.monotonic()
+                with self._lock:
+                    self.running -= 1
+                    self.stats["completed"] += 1
+                    self.stats["total_wait_seconds"] += started_at - submitted_at
+                    self.stats["total_run_seconds"] += finished_at - started_at
+
+        def done(future: Future) -> None:
+            # 실행이 끝났거나 시작 전에 취소됨 (요청 취소 시점이 아님)
+            with self._lock:
+                self.pending -= 1
+                if future.cancelled():
+                    self.stats["cancelled"] += 1
+
+        try:
+            future = self._get_executor().submit(timed)
+        except BaseException:
+            with self._lock:
+                self.pending -= 1
+            raise
+        future.add_done_callback(done)
+        return await asyncio.wrap_future(future)
+
+    async def hash(self, password: str) -> str:
+        """비밀번호 해시 생성"""
+        return await self._run(pwd_context.hash, password)
+
+    async def verify_and_update(
+        self, password: str, hashed_password: str
+    ) -> Tuple[bool, Optional[str]]:
+        """
+        비밀번호 검증 + 재해싱
+
+        Returns:
+            (일치 여부, 새 해시) - cost 가 바뀐 해시면 새 해시, 아니면 None
+        """
+        verified, new_hash = await self._run(
+            pwd_context.verify_and_update, password, hashed_password
+        )
+        if new_hash is not None:
+            with self._lock:
+                self.stats["rehashed"] += 1
+        return verified, new_hash
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def snapshot(self) -> dict:
+        """해싱 풀 통계 (대기열 깊이, 평균 대기/실행 시간)"""
+        with self._lock:
+            pending, running, stats = self.pending, self.running, dict(self.stats)
+        completed = stats["completed"] or 1
+        return {
+            "workers": self.workers,
+            "max_pending": self.max_pending,
+            "pending": pending,
+            "running": running,
+            "queued": max(pending - running, 0),
+            "completed": stats["completed"],
+            "cancelled": stats["cancelled"],
+            "rejected": stats["rejected"],
+            "rehashed": stats["rehashed"],
+            "max_pending_seen": stats["max_pending_seen"],
+            "avg_wait_ms": round(stats["total_wait_seconds"] / completed * 1000, 2),
+            "avg_run_ms": round(stats["total_run_seconds"] / completed * 1000, 2),
+        }
+
+
+password_hasher = PasswordHasher(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+)
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """
     JWT 액세스 토큰 생성
@@ -70,7 +215,74 @@ def decode_access_token(token: str) -> Optional[dict]:
         return None
 
 
+def _unlock_token_key() -> bytes:
+    """언락 토큰 서명 키 (UNLOCK_TOKEN_SECRET 미설정 시 JWT 키에서 파생)"""
+    if settings.UNLOCK_TOKEN_SECRET:
+        return settings.UNLOCK_TOKEN_SECRET.encode("utf-8")
+    return hmac.new(settings.JWT_SECRET_KEY.encode("utf-8"), b"formtion-unlock-token", hashlib.sha256).digest()
+
+
+def _b64encode(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
 
 
+def _b64decode(text: str) -> bytes:
+    return base64.urlsafe_b64decode(text + "=" * (-len(text) % 4))
 
 
+def _unlock_lead_tag(dedupe_key: bytes) -> str:
+    """토큰에 넣는 리드 식별 태그 (dedupe_key 의 keyed 해시, 이메일 추측 확인 방지)"""
+    return _b64encode(hmac.new(_unlock_token_key(), b"lead." + dedupe_key, hashlib.sha256).digest()[:12])
+
+
+def create_unlock_token(
+    project_id: str, lead_id: str, dedupe_key: bytes, expires_delta: timedelta
+) -> Tuple[str, datetime]:
+    """
+    언락 토큰 생성 (HMAC-SHA256 서명, DB 저장 없음)
+
+    형식: base64url("project_id.lead_id.만료 unix 초.리드 태그") + "." + base64url(서명)
+
+    Args:
+        project_id: 언락한 프로젝트
+        lead_id: 제출한 리드
+        dedupe_key: 제출한 리드의 중복 검증 키 (Lead.generate_dedupe_key)
+        expires_delta: 유효 기간
+
+    Returns:
+        (토큰 문자열, 만료 시각 UTC)
+    """
+    expires_ts = int(time.time() + expires_delta.total_seconds())
+    payload = f"{project_id}.{lead_id}.{expires_ts}.{_unlock_lead_tag(dedupe_key)}".encode("ascii")
+    signature = hmac.new(_unlock_token_key(), payload, hashlib.sha256).digest()
+    return f"{_b64encode(payload)}.{_b64encode(signature)}", datetime.utcfromtimestamp(expires_ts)
+
+
+def verify_unlock_token(token: str, project_id: str, dedupe_key: bytes) -> Optional[dict]:
+    """
+    언락 토큰 검증 (메모리에서만 처리)
+
+    토큰을 받은 리드와 같은 이메일로 제출한 경우에만 유효하다.
+    (같은 브라우저에서 다른 사람이 제출하면 None → 일반 저장 경로)
+
+    Returns:
+        {"lead_id", "expires_at"} 또는 None (형식 오류/서명 불일치/다른 프로젝트/만료/다른 리드)
+    """
+    try:
+        encoded_payload, encoded_signature = token.split(".")
+        payload = _b64decode(encoded_payload)
+        signature = _b64decode(encoded_signature)
+        token_project_id, lead_id, expires, lead_tag = payload.decode("ascii").split(".")
+        expires_ts = int(expires)
+    except (ValueError, UnicodeDecodeError):
+        return None
+
+    expected = hmac.new(_unlock_token_key(), payload, hashlib.sha256).digest()
+    if not hmac.compare_digest(signature, expected):
+        return None
+    if token_project_id != project_id or expires_ts <= time.time():
+        return None
+    if not hmac.compare_digest(lead_tag, _unlock_lead_tag(dedupe_key)):
+        return None
+
+    return {"lead_id": lead_id, "expires_at": datetime.utcfromtimestamp(expires_ts)}
@@ -4,15 +4,26 @@ FastAPI 앱 설정 및 라우터 등록
 """
 
 from contextlib import asynccontextmanager
-from fastapi import FastAPI, Request, status
+from fastapi import Depends, FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from slowapi import Limiter, _rate_limit_exceeded_handler
-from slowapi.util import get_remote_address
-from slowapi.errors import RateLimitExceeded
+from fastapi.responses import JSONResponse, PlainTextResponse
 
 from app.core.config import settings
 from app.core.database import init_db
+from app.core.db_writer import db_writer
+from app.core.security import password_hasher
+from app.core.cache import close_caches, start_cache_invalidation
+from app.core.rate_limit import get_rate_limiter
+from app.core.metrics import MetricsMiddleware, render_metrics
+from app.core.query_profiler import QueryProfilerMiddleware
+from app.core.http import get_http_client, close_http_client, get_http_pool_stats
+from app.services.webhook_outbox import webhook_dispatcher
+from app.services.event_buffer import event_buffer
+from app.services.event_partitions import event_partitions
+from app.services.notion_cache import notion_page_cache
+from app.services.ingest_profile import ingest_profile_cache
+from app.services.notion_mirrors import notion_mirror_pool
+from app.api.deps import require_monitoring_access
 from app.api.auth import router as auth_router
 from app.api.projects import router as projects_router, public_router as public_projects_router
 from app.api.leads import router as leads_router
@@ -20,10 +31,7 @@ from app.api.events import router as events_router
 from app.api.webhooks import router as webhooks_router
 from app.api.notion import router as notion_router
 from app.api.bookmarks import router as bookmarks_router
-
-
-# Rate Limiter 설정
-limiter = Limiter(key_func=get_remote_address)
+from app.api.analytics import router as analytics_router
 
 
 @asynccontextmanager
@@ -31,10 +39,23 @@ async def lifespan(app: FastAPI):
     """애플리케이션 라이프사이클 관리"""
     # 시작 시
     await init_db()
+    await db_writer.start()  # SQLite 단일 writer (그룹 커밋)
+    await start_cache_invalidation()  # 워커 간 프로세스 내 캐시 무효화 구독 (CACHE_REDIS_URL 설정 시)
+    get_http_client()  # 공유 HTTP 커넥션 풀 생성
+    await webhook_dispatcher.start()
+    await event_partitions.start()  # 이번 달/다음 달 파티션 생성 + 보관 기간 작업
+    await event_buffer.start()
     print(f"🚀 {settings.APP_NAME} v{settings.APP_VERSION} 시작")
     print(f"📡 API 문서: http://{settings.HOST}:{settings.PORT}/docs")
     yield
     # 종료 시
+    await event_buffer.stop()  # 남은 이벤트 기록
+    await event_partitions.stop()
+    await webhook_dispatcher.stop()
+    await db_writer.stop()  # 남은 쓰기 작업 커밋
+    await close_http_client()
+    await close_caches()
+    password_hasher.shutdown()
     print(f"👋 {settings.APP_NAME} 종료")
 
 
@@ -46,10 +67,6 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
-# Rate Limiter 등록
-app.state.limiter = limiter
-app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
-
 # CORS 미들웨어
 app.add_middleware(
     CORSMiddleware,
@@ -60,6 +77,15 @@ app.add_middleware(
 )
 
 
+# 쿼리 프로파일러 (개발용)
+if settings.QUERY_PROFILING_ENABLED:
+    app.add_middleware(QueryProfilerMiddleware)
+
+# 성능 지표 미들웨어 (가장 바깥에서 전체 처리 시간 측정)
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
+
 # 전역 예외 핸들러
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
@@ -79,6 +105,7 @@ app.include_router(events_router)
 app.include_router(webhooks_router)
 app.include_router(notion_router)
 app.include_router(bookmarks_router)
+app.include_router(analytics_router)
 
 
 # 헬스 체크
@@ -88,6 +115,66 @@ async def health_check():
     return {"status": "healthy", "app": settings.APP_NAME, "version": settings.APP_VERSION}
 
 
+@app.get("/health/http-pool", dependencies=[Depends(require_monitoring_access)])
+async def http_pool_stats():
+    """공유 HTTP 커넥션 풀 사용량 (풀 크기 조정용)"""
+    return get_http_pool_stats()
+
+
+@app.get("/health/event-buffer", dependencies=[Depends(require_monitoring_access)])
+async def event_buffer_stats():
+    """이벤트 수집 버퍼 통계 (적재/거부/폐기/기록)"""
+    return event_buffer.snapshot()
+
+
+@app.get("/health/event-partitions", dependencies=[Depends(require_monitoring_access)])
+async def event_partition_stats():
+    """이벤트 파티션/보관 기간 작업 통계"""
+    return event_partitions.snapshot()
+
+
+@app.get("/health/db-writer", dependencies=[Depends(require_monitoring_access)])
+async def db_writer_stats():
+    """단일 DB writer 통계 (작업/커밋 수, 최대 묶음 크기)"""
+    return db_writer.snapshot()
+
+
+@app.get("/health/password-hasher", dependencies=[Depends(require_monitoring_access)])
+async def password_hasher_stats():
+    """비밀번호 해싱 풀 통계 (대기열 깊이, 평균 대기/실행 시간)"""
+    return password_hasher.snapshot()
+
+
+@app.get("/health/rate-limit", dependencies=[Depends(require_monitoring_access)])
+async def rate_limit_stats():
+    """Rate limit 통계 (허용/제한/저장소 에러)"""
+    return get_rate_limiter().snapshot()
+
+
+@app.get("/health/notion-cache", dependencies=[Depends(require_monitoring_access)])
+async def notion_cache_stats():
+    """Notion 페이지 캐시 통계 (hit/miss/stale)"""
+    return notion_page_cache.snapshot()
+
+
+@app.get("/health/notion-mirrors", dependencies=[Depends(require_monitoring_access)])
+async def notion_mirror_stats():
+    """Notion API 미러 상태 (점수 순)"""
+    return notion_mirror_pool.snapshot()
+
+
+@app.get("/health/ingest-profile", dependencies=[Depends(require_monitoring_access)])
+async def ingest_profile_stats():
+    """수집 프로필 캐시 통계 (hit/negative hit/조회 수)"""
+    return ingest_profile_cache.snapshot()
+
+
+@app.get("/metrics", include_in_schema=False, dependencies=[Depends(require_monitoring_access)])
+async def metrics():
+    """Prometheus 지표 (요청 지연/처리 중 요청, DB 쿼리, 외부 HTTP 지연)"""
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
+
+
 # 루트
 @app.get("/")
 async def root():
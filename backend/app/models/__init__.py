@@ -4,8 +4,11 @@ from .project import Project
 from .lead import Lead
 from .event_log import EventLog
 from .bookmark import BookmarkFolder, Bookmark
+from .project_stats import ProjectStats
+from .webhook_delivery import WebhookDelivery
+from .analytics import EventRollup, LeadUtmRollup
 
-__all__ = ["User", "Project", "Lead", "EventLog", "BookmarkFolder", "Bookmark"]
+__all__ = ["User", "Project", "Lead", "EventLog", "BookmarkFolder", "Bookmark", "ProjectStats", "WebhookDelivery", "EventRollup", "LeadUtmRollup"]
 
 
 
@@ -0,0 +1,41 @@
+"""
+분석 집계 모델
+프로젝트별 이벤트/리드 시간 버킷 집계 (수집 시 증분 반영)
+"""
+
+from sqlalchemy import Column, DateTime, Integer, String
+
+from app.core.database import Base
+
+
+class EventRollup(Base):
+    """이벤트 집계 테이블 (프로젝트 × 단위(hour/day) × 버킷 × 이벤트 타입)"""
+
+    __tablename__ = "event_rollups"
+
+    project_id = Column(String(36), primary_key=True)
+    granularity = Column(String(10), primary_key=True)  # hour, day
+    bucket_start = Column(DateTime, primary_key=True)
+    event_type = Column(String(50), primary_key=True)
+
+    count = Column(Integer, default=0, nullable=False)
+
+    def __repr__(self):
+        return f"<EventRollup(project_id={self.project_id}, {self.granularity} {self.bucket_start}, {self.event_type}={self.count})>"
+
+
+class LeadUtmRollup(Base):
+    """리드 UTM 집계 테이블 (프로젝트 × 일 × utm_source/medium/campaign)"""
+
+    __tablename__ = "lead_utm_rollups"
+
+    project_id = Column(String(36), primary_key=True)
+    bucket_start = Column(DateTime, primary_key=True)
+    utm_source = Column(String(100), primary_key=True, default="")
+    utm_medium = Column(String(100), primary_key=True, default="")
+    utm_campaign = Column(String(100), primary_key=True, default="")
+
+    lead_count = Column(Integer, default=0, nullable=False)
+
+    def __repr__(self):
+        return f"<LeadUtmRollup(project_id={self.project_id}, {self.bucket_start}, {self.utm_source}={self.lead_count})>"
@@ -1,6 +1,9 @@
 """
 EventLog 모델
-사용자 행동 이벤트 로그
+사용자 행동 이벤트 로그 (파티션 도입 전 테이블)
+
+새 이벤트는 월별 파티션에 저장된다 (app/services/event_partitions.py).
+이 테이블은 기존 데이터 조회/보관 용도로만 남겨둔다.
 """
 
 from datetime import datetime
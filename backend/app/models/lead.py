@@ -3,8 +3,9 @@ Lead 모델
 수집된 리드 정보
 """
 
+import hashlib
 from datetime import datetime
-from sqlalchemy import Column, String, DateTime, ForeignKey, JSON, Boolean
+from sqlalchemy import Column, String, DateTime, ForeignKey, JSON, Boolean, Index, LargeBinary
 from sqlalchemy.orm import relationship
 from uuid import uuid4
 
@@ -55,12 +56,17 @@ class Lead(Base):
     ip_address = Column(String(45), nullable=True)  # IPv6 지원
     form_location = Column(String(20), nullable=True)  # top, bottom, modal, cta, inline
 
-    # 중복 검증 키
-    dedupe_key = Column(String(300), unique=True, nullable=False, index=True)
+    # 중복 검증 키 ("정규화 이메일_project_id" 의 SHA-256 앞 16바이트, 고정 길이)
+    dedupe_key = Column(LargeBinary(16), unique=True, nullable=False, index=True)
 
     # 타임스탬프
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
 
+    __table_args__ = (
+        # 목록 키셋 페이지네이션 (created_at DESC, lead_id)
+        Index("ix_leads_project_created", "project_id", created_at.desc(), "lead_id"),
+    )
+
     # 관계
     project = relationship("Project", back_populates="leads")
 
@@ -68,9 +74,19 @@ class Lead(Base):
         return f"<Lead(lead_id={self.lead_id}, email={self.email})>"
 
     @staticmethod
-    def generate_dedupe_key(email: str, project_id: str) -> str:
+    def generate_dedupe_key(email: str, project_id: str) -> bytes:
         """중복 검증 키 생성"""
-        return f"{email.lower().strip()}_{project_id}"
+        return dedupe_digest(f"{email.lower().strip()}_{project_id}")
+
+
+def dedupe_digest(raw_key: str) -> bytes:
+    """
+    중복 검증 키 digest (128비트)
+
+    이전 문자열 키("정규화 이메일_project_id")를 그대로 해시하므로
+    기존 행은 저장된 키만으로 변환할 수 있다 (migrations.py 010).
+    """
+    return hashlib.sha256(raw_key.encode("utf-8")).digest()[:16]
 
 
 
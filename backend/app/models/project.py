@@ -25,6 +25,9 @@ class Project(Base):
     # 프로젝트 정보
     name = Column(String(100), nullable=False, default="Untitled Project")
     notion_url = Column(String(500), nullable=False)
+    # URL 점유 확인용 조회 키 (notion_url 저장 시 함께 갱신)
+    notion_url_normalized = Column(String(500), nullable=True, index=True)
+    notion_page_id = Column(String(32), nullable=True, index=True)
     public_slug = Column(String(50), unique=True, nullable=False, index=True)
 
     # 설정 (JSON)
@@ -0,0 +1,47 @@
+"""
+ProjectStats 모델
+프로젝트별 집계 카운터 (리드 수, 이벤트 수)
+"""
+
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Integer, String
+
+from app.core.database import Base
+
+
+class ProjectStats(Base):
+    """프로젝트 집계 테이블
+
+    리드/이벤트 생성 시 같은 트랜잭션에서 갱신되며,
+    프로젝트 목록/상세 조회 시 COUNT 쿼리 대신 사용된다.
+    """
+
+    __tablename__ = "project_stats"
+
+    # Primary Key (프로젝트와 1:1)
+    # event_logs 와 마찬가지로 FK 없이 둔다 (이벤트 수집 경로에서 프로젝트 검증을 하지 않음)
+    project_id = Column(String(36), primary_key=True)
+
+    # 리드 집계
+    lead_count = Column(Integer, default=0, nullable=False)
+    last_lead_at = Column(DateTime, nullable=True)
+
+    # 이벤트 집계
+    event_count = Column(Integer, default=0, nullable=False)
+    page_view_count = Column(Integer, default=0, nullable=False)
+    form_submit_count = Column(Integer, default=0, nullable=False)
+    last_event_at = Column(DateTime, nullable=True)
+
+    # 보관 기간이 지나 세그먼트로 내보내고 삭제한 이벤트 (재계산 시 남은 원본 수에 더함)
+    archived_event_count = Column(Integer, default=0, server_default="0", nullable=False)
+    archived_page_view_count = Column(Integer, default=0, server_default="0", nullable=False)
+    archived_form_submit_count = Column(Integer, default=0, server_default="0", nullable=False)
+
+    # 타임스탬프
+    updated_at = Column(
+        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+    )
+
+    def __repr__(self):
+        return f"<ProjectStats(project_id={self.project_id}, lead_count={self.lead_count})>"
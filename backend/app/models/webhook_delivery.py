@@ -0,0 +1,50 @@
+"""
+WebhookDelivery 모델
+Webhook 전송 아웃박스 (리드 생성과 같은 트랜잭션에서 기록)
+"""
+
+from datetime import datetime
+from uuid import uuid4
+
+from sqlalchemy import JSON, Column, DateTime, Index, Integer, String
+
+from app.core.database import Base
+
+
+class WebhookDelivery(Base):
+    """Webhook 전송 아웃박스 테이블"""
+
+    __tablename__ = "webhook_deliveries"
+
+    # Primary Key
+    delivery_id = Column(String(36), primary_key=True, default=lambda: str(uuid4()))
+
+    # 출처
+    project_id = Column(String(36), nullable=False, index=True)
+    lead_id = Column(String(36), nullable=True)
+
+    # 전송 대상
+    kind = Column(String(20), nullable=False)  # general, slack, discord
+    url = Column(String(500), nullable=False)
+    payload = Column(JSON, nullable=False)
+
+    # 상태: pending(대기) → processing(전송 중) → delivered(성공) / dead(재시도 초과)
+    status = Column(String(20), nullable=False, default="pending")
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    locked_until = Column(DateTime, nullable=True)  # processing 임대 만료 (재시작 시 재수거)
+
+    # 마지막 결과
+    last_status_code = Column(Integer, nullable=True)
+    last_error = Column(String(500), nullable=True)
+
+    # 타임스탬프
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    delivered_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        Index("ix_webhook_deliveries_status_next_attempt", "status", "next_attempt_at"),
+    )
+
+    def __repr__(self):
+        return f"<WebhookDelivery(delivery_id={self.delivery_id}, kind={self.kind}, status={self.status})>"
@@ -0,0 +1,49 @@
+"""
+Analytics 스키마
+프로젝트 분석 조회 응답 모델
+"""
+
+from datetime import datetime
+from typing import Dict, List
+
+from pydantic import BaseModel
+
+
+class AnalyticsBucket(BaseModel):
+    """시간 버킷별 이벤트 수"""
+
+    bucket_start: datetime
+    counts: Dict[str, int]
+
+
+class AnalyticsFunnel(BaseModel):
+    """전환 퍼널 (page_view → form_impression → form_submit)"""
+
+    page_view: int = 0
+    form_impression: int = 0
+    form_submit: int = 0
+    impression_rate: float = 0.0  # form_impression / page_view
+    submit_rate: float = 0.0  # form_submit / form_impression
+
+
+class UTMBreakdownItem(BaseModel):
+    """UTM 조합별 리드 수"""
+
+    utm_source: str = ""
+    utm_medium: str = ""
+    utm_campaign: str = ""
+    lead_count: int = 0
+
+
+class AnalyticsResponse(BaseModel):
+    """프로젝트 분석 응답"""
+
+    project_id: str
+    granularity: str
+    date_from: datetime
+    date_to: datetime
+    totals: Dict[str, int]
+    series: List[AnalyticsBucket]
+    funnel: AnalyticsFunnel
+    lead_count: int = 0
+    utm: List[UTMBreakdownItem]
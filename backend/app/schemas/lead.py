@@ -30,6 +30,7 @@ class LeadCreate(BaseModel):
     consent_marketing: bool = False
     utm_params: Optional[UTMParams] = None
     form_location: Optional[str] = Field(None, pattern="^(top|bottom|modal|cta|inline)$")
+    unlock_token: Optional[str] = Field(None, max_length=512)  # 이전 제출에서 받은 언락 토큰 (같은 이메일이고 유효하면 저장 없이 응답)
 
 
 class LeadResponse(BaseModel):
@@ -57,6 +58,7 @@ class LeadListResponse(BaseModel):
     total: int
     page: int
     limit: int
+    next_cursor: Optional[str] = None  # 다음 페이지 키셋 커서 (없으면 마지막 페이지)
 
 
 class LeadCreateResponse(BaseModel):
@@ -66,9 +68,40 @@ class LeadCreateResponse(BaseModel):
     success: bool = True
     unlocked: bool = True
     already_unlocked: bool = False
+    unlock_token: Optional[str] = None  # 언락 상태 서명 토큰 (다음 제출 시 unlock_token 으로 전달)
+    unlock_expires_at: Optional[datetime] = None
 
 
+class LeadImportRow(BaseModel):
+    """리드 일괄 가져오기 행 (CSV/NDJSON 한 줄)"""
 
+    email: EmailStr
+    name: Optional[str] = Field(None, max_length=100)
+    company: Optional[str] = Field(None, max_length=100)
+    role: Optional[str] = Field(None, max_length=50)
+    consent_privacy: bool = False  # 값이 없으면 동의하지 않은 것으로 저장
+    consent_marketing: bool = False
+    utm_source: Optional[str] = None
+    utm_medium: Optional[str] = None
+    utm_campaign: Optional[str] = None
+    utm_term: Optional[str] = None
+    utm_content: Optional[str] = None
+    form_location: Optional[str] = Field(None, pattern="^(top|bottom|modal|cta|inline)$")
+
+
+class LeadImportError(BaseModel):
+    """리드 가져오기 행 오류"""
+
+    line: int  # 파일 내 줄 번호 (1부터)
+    error: str
 
 
+class LeadImportResponse(BaseModel):
+    """리드 일괄 가져오기 결과"""
 
+    total_rows: int
+    imported: int
+    duplicates: int  # 이미 존재하거나 파일 안에서 중복된 이메일
+    failed: int
+    errors: List[LeadImportError]
+    errors_truncated: bool = False  # 오류가 LEAD_IMPORT_MAX_ERRORS 를 넘어 일부만 포함됨
@@ -217,6 +217,7 @@ class ProjectListItem(BaseModel):
     public_slug: str
     created_at: datetime
     lead_count: int = 0
+    last_lead_at: Optional[datetime] = None
 
     class Config:
         from_attributes = True
@@ -0,0 +1,187 @@
+"""
+분석 집계 서비스
+이벤트/리드 수집 시 시간 버킷 집계를 증분 반영하고, 기간 조회를 집계에서 응답
+"""
+
+from collections import Counter
+from datetime import datetime
+from typing import Iterable, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import dialect_insert
+from app.models.analytics import EventRollup, LeadUtmRollup
+
+GRANULARITIES = ("hour", "day")
+
+
+def truncate(ts: datetime, granularity: str) -> datetime:
+    """시각을 버킷 시작 시각으로 내림"""
+    if granularity == "hour":
+        return ts.replace(minute=0, second=0, microsecond=0)
+    return ts.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+async def rollup_events(db: AsyncSession, rows: Iterable[dict]) -> None:
+    """
+    이벤트 집계 반영 (hour, day)
+
+    커밋하지 않으므로 이벤트 INSERT와 같은 트랜잭션에서 호출해야 한다.
+
+    Args:
+        rows: event_type, project_id, timestamp 를 가진 이벤트 행
+    """
+    counts: Counter = Counter()
+    for row in rows:
+        for granularity in GRANULARITIES:
+            counts[(
+                row["project_id"],
+                granularity,
+                truncate(row["timestamp"], granularity),
+                row["event_type"],
+            )] += 1
+
+    if not counts:
+        return
+
+    values = [
+        {
+            "project_id": project_id,
+            "granularity": granularity,
+            "bucket_start": bucket_start,
+            "event_type": event_type,
+            "count": count,
+        }
+        for (project_id, granularity, bucket_start, event_type), count in counts.items()
+    ]
+
+    stmt = dialect_insert(db.bind.dialect.name)(EventRollup)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[
+            EventRollup.project_id,
+            EventRollup.granularity,
+            EventRollup.bucket_start,
+            EventRollup.event_type,
+        ],
+        set_={"count": EventRollup.count + stmt.excluded["count"]},
+    )
+    await db.execute(stmt, values)
+
+
+def _utm_value(utm: Optional[dict], key: str) -> str:
+    return ((utm or {}).get(key) or "")[:100]
+
+
+async def rollup_leads(db: AsyncSession, leads: Iterable[dict]) -> None:
+    """
+    리드 UTM 집계 반영 (day)
+
+    커밋하지 않으므로 리드 INSERT와 같은 트랜잭션에서 호출해야 한다.
+
+    Args:
+        leads: project_id, source_utm, created_at 을 가진 리드 데이터
+    """
+    counts: Counter = Counter()
+    for lead in leads:
+        utm = lead.get("source_utm")
+        counts[(
+            lead["project_id"],
+            truncate(lead["created_at"], "day"),
+            _utm_value(utm, "utm_source"),
+            _utm_value(utm, "utm_medium"),
+            _utm_value(utm, "utm_campaign"),
+        )] += 1
+
+    if not counts:
+        return
+
+    values = [
+        {
+            "project_id": project_id,
+            "bucket_start": bucket_start,
+            "utm_source": utm_source,
+            "utm_medium": utm_medium,
+            "utm_campaign": utm_campaign,
+            "lead_count": count,
+        }
+        for (project_id, bucket_start, utm_source, utm_medium, utm_campaign), count in counts.items()
+    ]
+
+    stmt = dialect_insert(db.bind.dialect.name)(LeadUtmRollup)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[
+            LeadUtmRollup.project_id,
+            LeadUtmRollup.bucket_start,
+            LeadUtmRollup.utm_source,
+            LeadUtmRollup.utm_medium,
+            LeadUtmRollup.utm_campaign,
+        ],
+        set_={"lead_count": LeadUtmRollup.lead_count + stmt.excluded.lead_count},
+    )
+    await db.execute(stmt, values)
+
+
+async def query_event_series(
+    db: AsyncSession,
+    project_id: str,
+    granularity: str,
+    date_from: datetime,
+    date_to: datetime,
+) -> list[tuple[datetime, str, int]]:
+    """기간 내 (버킷, 이벤트 타입, 수) 목록"""
+    result = await db.execute(
+        select(EventRollup.bucket_start, EventRollup.event_type, EventRollup.count)
+        .where(EventRollup.project_id == project_id)
+        .where(EventRollup.granularity == granularity)
+        .where(EventRollup.bucket_start >= truncate(date_from, granularity))
+        .where(EventRollup.bucket_start <= date_to)
+        .order_by(EventRollup.bucket_start)
+    )
+    return result.all()
+
+
+async def query_utm_breakdown(
+    db: AsyncSession,
+    project_id: str,
+    date_from: datetime,
+    date_to: datetime,
+    limit: int = 50,
+) -> list[tuple[str, str, str, int]]:
+    """기간 내 UTM 조합별 리드 수 (많은 순)"""
+    lead_count = func.sum(LeadUtmRollup.lead_count).label("lead_count")
+    result = await db.execute(
+        select(
+            LeadUtmRollup.utm_source,
+            LeadUtmRollup.utm_medium,
+            LeadUtmRollup.utm_campaign,
+            lead_count,
+        )
+        .where(LeadUtmRollup.project_id == project_id)
+        .where(LeadUtmRollup.bucket_start >= truncate(date_from, "day"))
+        .where(LeadUtmRollup.bucket_start <= date_to)
+        .group_by(
+            LeadUtmRollup.utm_source,
+            LeadUtmRollup.utm_medium,
+            LeadUtmRollup.utm_campaign,
+        )
+        .order_by(lead_count.desc())
+        .limit(limit)
+    )
+    return result.all()
+
+
+async def query_lead_total(
+    db: AsyncSession,
+    project_id: str,
+    date_from: datetime,
+    date_to: datetime,
+) -> int:
+    """기간 내 리드 수"""
+    result = await db.execute(
+        select(func.sum(LeadUtmRollup.lead_count))
+        .where(LeadUtmRollup.project_id == project_id)
+        .where(LeadUtmRollup.bucket_start >= truncate(date_from, "day"))
+        .where(LeadUtmRollup.bucket_start <= date_to)
+    )
+    return result.scalar() or 0
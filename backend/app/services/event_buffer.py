@@ -0,0 +1,193 @@
+"""
+이벤트 수집 버퍼
+이벤트를 메모리에 모았다가 일정 개수/주기마다 일괄 INSERT
+"""
+
+import asyncio
+from datetime import datetime
+from typing import Optional
+from uuid import uuid4
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.db_writer import db_writer
+from app.services.analytics import rollup_events
+from app.services.event_partitions import event_partitions, period_of
+from app.services.project_stats import record_events
+
+
+def make_event_row(
+    event_type: str,
+    project_id: str,
+    data: Optional[dict],
+    user_agent: Optional[str],
+    ip_address: Optional[str],
+) -> dict:
+    """이벤트 INSERT 용 행 생성 (수신 시각 기준 timestamp, 파티션도 이 시각으로 결정)"""
+    return {
+        "event_id": str(uuid4()),
+        "event_type": event_type,
+        "project_id": project_id,
+        "data": data,
+        "user_agent": user_agent,
+        "ip_address": ip_address,
+        "timestamp": datetime.utcnow(),
+    }
+
+
+class EventBuffer:
+    """
+    이벤트 수집 버퍼
+
+    - offer() 는 메모리에 적재만 하고 즉시 반환
+    - batch_size 이상 쌓이거나 flush_interval 이 지나면 백그라운드에서 일괄 INSERT
+    - 버퍼가 가득 차면 overflow_policy 에 따라 거부(reject → 429) 또는 폐기(drop)
+    - 저장 실패 시 배치를 버퍼 앞에 되돌리고 다음 flush 에서 재시도 (max_retries 초과 시 폐기)
+    - 종료 시 진행 중인 flush 를 마치고 남은 이벤트를 모두 기록
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        batch_size: int,
+        flush_interval: float,
+        overflow_policy: str,
+        max_retries: int,
+    ):
+        self.max_size = max_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.overflow_policy = overflow_policy
+        self.max_retries = max_retries
+        self._pending: list[dict] = []
+        self._wakeup: Optional[asyncio.Event] = None
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = False
+        # 맨 앞 배치의 연속 저장 실패 횟수
+        self._failures = 0
+        self.stats = {
+            "accepted": 0,
+            "rejected": 0,
+            "dropped": 0,
+            "written": 0,
+            "flushes": 0,
+            "flush_errors": 0,
+            "retried": 0,
+            "lost": 0,
+        }
+
+    def offer(self, rows: list[dict]) -> bool:
+        """
+        이벤트 적재
+
+        Returns:
+            False 면 버퍼가 가득 차서 거부됨 (호출자가 429 반환)
+        """
+        if len(self._pending) + len(rows) > self.max_size:
+            if self.overflow_policy == "drop":
+                self.stats["dropped"] += len(rows)
+                return True
+            self.stats["rejected"] += len(rows)
+            return False
+
+        self._pending.extend(rows)
+        self.stats["accepted"] += len(rows)
+
+        if len(self._pending) >= self.batch_size and self._wakeup is not None:
+            self._wakeup.set()
+        return True
+
+    async def start(self) -> None:
+        """주기적 flush 시작"""
+        if self._task is not None:
+            return
+        self._stopping = False
+        self._wakeup = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._task = asyncio.create_task(self._flush_loop())
+
+    async def stop(self) -> None:
+        """
+        flush 중지 후 남은 이벤트 기록
+
+        flush 루프를 취소하지 않고 종료 신호를 보낸 뒤, 진행 중인 flush 가 끝나기를 기다린다.
+        저장이 계속 실패하면 재시도 횟수를 모두 쓴 배치는 lost 로 집계하고 폐기한다.
+        """
+        if self._task is not None:
+            self._stopping = True
+            self._wakeup.set()
+            await self._task
+            self._task = None
+        while self._pending:
+            await self.flush()
+
+    async def _flush_loop(self) -> None:
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+    async def flush(self) -> None:
+        """대기 중인 이벤트를 batch_size 단위로 기록 (실패 시 버퍼 앞에 되돌리고 중단)"""
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+
+        async with self._flush_lock:
+            while self._pending:
+                rows = self._pending[:self.batch_size]
+                del self._pending[:self.batch_size]
+
+                try:
+                    await self._write(rows)
+                except Exception as e:
+                    print(f"이벤트 일괄 저장 에러: {str(e)}")
+                    self.stats["flush_errors"] += 1
+                    self._failures += 1
+                    if self._failures > self.max_retries:
+                        self.stats["lost"] += len(rows)
+                        self._failures = 0
+                    else:
+                        # 순서 유지를 위해 버퍼 앞에 되돌림 (다음 flush 에서 재시도)
+                        self._pending[:0] = rows
+                        self.stats["retried"] += len(rows)
+                    return
+                finally:
+                    self.stats["flushes"] += 1
+
+                self._failures = 0
+                self.stats["written"] += len(rows)
+
+    async def _write(self, rows: list[dict]) -> None:
+        """한 트랜잭션으로 이벤트 INSERT (월별 파티션) + 집계 카운터/분석 집계 반영"""
+        event_types_by_project: dict[str, list[str]] = {}
+        for row in rows:
+            event_types_by_project.setdefault(row["project_id"], []).append(row["event_type"])
+
+        # 새 달의 첫 이벤트면 파티션 생성 (프로세스별 월 1회)
+        await event_partitions.ensure_partitions({period_of(row["timestamp"]) for row in rows})
+
+        async def write(session: AsyncSession) -> None:
+            await event_partitions.insert_rows(session, rows)
+            for project_id, event_types in event_types_by_project.items():
+                await record_events(session, project_id, event_types)
+            await rollup_events(session, rows)
+
+        await db_writer.run(write)
+
+    def snapshot(self) -> dict:
+        """버퍼 통계"""
+        return {**self.stats, "pending": len(self._pending)}
+
+
+event_buffer = EventBuffer(
+    max_size=settings.EVENT_BUFFER_MAX_SIZE,
+    batch_size=settings.EVENT_BUFFER_BATCH_SIZE,
+    flush_interval=settings.EVENT_BUFFER_FLUSH_INTERVAL_SECONDS,
+    overflow_policy=settings.EVENT_BUFFER_OVERFLOW_POLICY,
+    max_retries=settings.EVENT_BUFFER_MAX_RETRIES,
+)
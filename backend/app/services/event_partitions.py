@@ -0,0 +1,492 @@
+"""
+이벤트 파티션 서비스
+이벤트 로그를 월 단위 파티션에 저장하고, 보관 기간이 지난 파티션은 NDJSON.gz 세그먼트로 내보낸 뒤 통째로 삭제
+
+- PostgreSQL: event_logs_partitioned (timestamp RANGE 네이티브 파티션) 에 INSERT, 월별 파티션 event_logs_YYYYMM
+- SQLite: 월별 테이블 event_logs_YYYYMM 에 직접 INSERT, 조회 시 기간에 겹치는 테이블만 UNION ALL
+- 파티션 인덱스는 (project_id, timestamp) 하나만 유지 (INSERT 비용 감소)
+- 파티션 도입 전 event_logs 테이블은 조회에 포함하고, 전체가 보관 기간을 지나면 한 번에 내보내고 비움
+- 대량 DELETE 대신 파티션 DROP (인덱스 갱신/WAL 기록 없이 정리)
+- 여러 워커가 동시에 보관 작업을 실행해도 테이블별 잠금으로 한 워커만 내보내고 삭제
+"""
+
+import asyncio
+import fcntl
+import gzip
+import hashlib
+import json
+import os
+import re
+import uuid
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import (
+    JSON,
+    BigInteger,
+    Column,
+    DateTime,
+    Index,
+    Integer,
+    MetaData,
+    PrimaryKeyConstraint,
+    String,
+    Table,
+    func,
+    select,
+    text,
+    union_all,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import engine, read_session_maker
+from app.core.db_writer import db_writer
+from app.models.event_log import EventLog
+
+PARENT_TABLE = "event_logs_partitioned"
+
+# 파티션 테이블 이름 (event_logs_YYYYMM)
+_PARTITION_NAME = re.compile(r"^event_logs_(\d{6})$")
+
+# 세그먼트 내보내기 배치 크기 (id 기준 키셋)
+EXPORT_BATCH_SIZE = 5000
+
+# 파티션 테이블은 Base.metadata 와 분리 (init_db 의 create_all 대상 아님)
+_metadata = MetaData()
+
+
+def _columns() -> list[Column]:
+    return [
+        Column("event_id", String(36), nullable=False),
+        Column("event_type", String(50), nullable=False),
+        Column("project_id", String(36), nullable=False),
+        Column("data", JSON, nullable=True),
+        Column("user_agent", String(500), nullable=True),
+        Column("ip_address", String(45), nullable=True),
+        Column("timestamp", DateTime, nullable=False),
+    ]
+
+
+# PostgreSQL 파티션 부모 테이블 (기본 키에 파티션 키 포함 필요)
+parent_table = Table(
+    PARENT_TABLE,
+    _metadata,
+    Column("id", BigInteger, autoincrement=True, nullable=False),
+    *_columns(),
+    PrimaryKeyConstraint("id", "timestamp"),
+    Index(f"ix_{PARENT_TABLE}_project_timestamp", "project_id", "timestamp"),
+    postgresql_partition_by="RANGE (timestamp)",
+)
+
+_partition_tables: dict[str, Table] = {}
+
+
+def period_of(timestamp: datetime) -> str:
+    """이벤트 시각 → 파티션 기간 (YYYYMM)"""
+    return timestamp.strftime("%Y%m")
+
+
+def period_bounds(period: str) -> tuple[datetime, datetime]:
+    """파티션 기간의 [시작, 끝) 시각"""
+    start = datetime.strptime(period, "%Y%m")
+    end = datetime(start.year + start.month // 12, start.month % 12 + 1, 1)
+    return start, end
+
+
+def partition_name(period: str) -> str:
+    return f"event_logs_{period}"
+
+
+def partition_table(period: str) -> Table:
+    """SQLite 월별 파티션 테이블"""
+    table = _partition_tables.get(period)
+    if table is None:
+        name = partition_name(period)
+        table = Table(
+            name,
+            _metadata,
+            Column("id", Integer, primary_key=True, autoincrement=True),
+            *_columns(),
+            Index(f"ix_{name}_project_timestamp", "project_id", "timestamp"),
+        )
+        _partition_tables[period] = table
+    return table
+
+
+def _is_postgres() -> bool:
+    return engine.dialect.name == "postgresql"
+
+
+async def list_partitions(session: AsyncSession) -> list[str]:
+    """존재하는 파티션 기간 목록 (오래된 순)"""
+    if _is_postgres():
+        result = await session.execute(text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE parent.relname = :parent"
+        ), {"parent": PARENT_TABLE})
+    else:
+        result = await session.execute(text(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name LIKE 'event_logs_%'"
+        ))
+
+    periods = []
+    for name in result.scalars():
+        match = _PARTITION_NAME.match(name)
+        if match:
+            periods.append(match.group(1))
+    return sorted(periods)
+
+
+async def event_source(
+    session: AsyncSession,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+):
+    """
+    이벤트 조회 대상 (파티션 + 파티션 도입 전 event_logs, [date_from, date_to) 범위)
+
+    SQLite 는 범위에 겹치는 월 테이블만, PostgreSQL 은 부모 테이블 조건으로 파티션 프루닝.
+
+    Returns:
+        event_type / project_id / timestamp 컬럼을 가진 서브쿼리
+    """
+    def ranged(table):
+        query = select(table.c.event_type, table.c.project_id, table.c.timestamp)
+        if date_from is not None:
+            query = query.where(table.c.timestamp >= date_from)
+        if date_to is not None:
+            query = query.where(table.c.timestamp < date_to)
+        return query
+
+    queries = [ranged(EventLog.__table__)]
+
+    if _is_postgres():
+        if await event_partitions.parent_exists(session):
+            queries.append(ranged(parent_table))
+    else:
+        for period in await list_partitions(session):
+            start, end = period_bounds(period)
+            if (date_to is None or start < date_to) and (date_from is None or end > date_from):
+                queries.append(ranged(partition_table(period)))
+
+    return union_all(*queries).subquery("events")
+
+
+class EventPartitions:
+    """
+    파티션 관리
+
+    - 쓰기 전에 해당 월 파티션을 만들어 둠 (프로세스별로 만든 기간을 기억, DDL 은 월 1회)
+    - 보관 기간(EVENT_RETENTION_DAYS)이 지난 파티션을 세그먼트 파일로 내보내고 삭제
+    """
+
+    def __init__(self):
+        self._known: set[str] = set()
+        self._parent_ready = False
+        self._task: Optional[asyncio.Task] = None
+        self.stats = {
+            "partitions_ensured": 0,
+            "partitions_archived": 0,
+            "rows_archived": 0,
+            "archive_errors": 0,
+            "last_archive_at": None,
+        }
+
+    # ---- 쓰기 ----
+
+    async def insert_rows(self, session: AsyncSession, rows: list[dict]) -> None:
+        """
+        이벤트 INSERT (ensure_partitions 이후, 커밋하지 않음)
+
+        PostgreSQL 은 부모 테이블에 넣으면 파티션으로 라우팅되고, SQLite 는 월별 테이블에 나눠 넣는다.
+        """
+        if _is_postgres():
+            await session.execute(parent_table.insert(), rows)
+            return
+
+        rows_by_period: dict[str, list[dict]] = {}
+        for row in rows:
+            rows_by_period.setdefault(period_of(row["timestamp"]), []).append(row)
+        for period, period_rows in rows_by_period.items():
+            # executemany (다중 행 INSERT)
+            await session.execute(partition_table(period).insert(), period_rows)
+
+    async def ensure_partitions(self, periods: set[str]) -> None:
+        """파티션이 없으면 생성 (별도 쓰기 작업으로 커밋)"""
+        missing = periods - self._known
+        if not missing:
+            return
+
+        def create_tables(sync_session) -> None:
+            for period in sorted(missing):
+                partition_table(period).create(sync_session.connection(), checkfirst=True)
+
+        async def create(session: AsyncSession) -> None:
+            if _is_postgres():
+                await self._create_postgres_partitions(session, missing)
+            else:
+                await session.run_sync(create_tables)
+
+        await db_writer.run(create)
+        self._known |= missing
+        self.stats["partitions_ensured"] += len(missing)
+
+    async def ensure_current_partitions(self, now: Optional[datetime] = None) -> None:
+        """이번 달/다음 달 파티션 미리 생성 (월 경계 첫 쓰기에서 DDL 경합 방지)"""
+        now = now or datetime.utcnow()
+        _, next_start = period_bounds(period_of(now))
+        await self.ensure_partitions({period_of(now), period_of(next_start)})
+
+    async def parent_exists(self, session: AsyncSession) -> bool:
+        """PostgreSQL 파티션 부모 테이블 존재 여부"""
+        if not self._parent_ready:
+            result = await session.execute(text("SELECT to_regclass(:name)"), {"name": PARENT_TABLE})
+            self._parent_ready = result.scalar() is not None
+        return self._parent_ready
+
+    async def _create_postgres_partitions(self, session: AsyncSession, periods: set[str]) -> None:
+        await session.run_sync(
+            lambda sync_session: parent_table.create(sync_session.connection(), checkfirst=True)
+        )
+        self._parent_ready = True
+        for period in sorted(periods):
+            start, end = period_bounds(period)
+            await session.execute(text(
+                f"CREATE TABLE IF NOT EXISTS {partition_name(period)} PARTITION OF {PARENT_TABLE} "
+                f"FOR VALUES FROM ('{start.isoformat(sep=' ')}') TO ('{end.isoformat(sep=' ')}')"
+            ))
+
+    # ---- 보관 기간 / 세그먼트 ----
+
+    async def archive_expired(self, now: Optional[datetime] = None) -> list[str]:
+        """
+        보관 기간이 지난 파티션을 세그먼트 파일로 내보내고 삭제
+
+        Returns:
+            생성한 세그먼트 파일 경로 목록
+        """
+        if settings.EVENT_RETENTION_DAYS <= 0:
+            return []
+
+        cutoff = (now or datetime.utcnow()) - timedelta(days=settings.EVENT_RETENTION_DAYS)
+        os.makedirs(settings.EVENT_ARCHIVE_DIR, exist_ok=True)
+
+        async with read_session_maker() as session:
+            periods = await list_partitions(session)
+            legacy_max = (await session.execute(select(func.max(EventLog.timestamp)))).scalar()
+
+        segments = []
+        for period in periods:
+            _, end = period_bounds(period)
+            if end > cutoff:
+                break
+            name = partition_name(period)
+            source = _partition_source(period) if _is_postgres() else partition_table(period)
+            path = os.path.join(settings.EVENT_ARCHIVE_DIR, f"{name}.ndjson.gz")
+            archived = await self._archive_table(
+                name, source, path, f"DROP TABLE {name}", period=period
+            )
+            if archived:
+                self._known.discard(period)
+                _partition_tables.pop(period, None)
+                segments.append(path)
+
+        # 파티션 도입 전 테이블 (전체가 보관 기간을 지난 경우에만)
+        if legacy_max is not None and legacy_max < cutoff:
+            path = os.path.join(
+                settings.EVENT_ARCHIVE_DIR,
+                f"event_logs_legacy_until_{legacy_max.strftime('%Y%m%d%H%M%S')}.ndjson.gz",
+            )
+            # 조건 없는 DELETE 는 SQLite 에서 truncate 최적화로 처리
+            statement = "TRUNCATE TABLE event_logs" if _is_postgres() else "DELETE FROM event_logs"
+            if await self._archive_table("event_logs", EventLog.__table__, path, statement):
+                segments.append(path)
+
+        return segments
+
+    async def _archive_table(
+        self,
+        name: str,
+        source: Table,
+        path: str,
+        drop_statement: str,
+        period: Optional[str] = None,
+    ) -> bool:
+        """
+        테이블 하나를 세그먼트로 내보낸 뒤 삭제 (테이블별 잠금, 다른 워커가 진행 중이면 건너뜀)
+
+        내보낸 행 수와 삭제 직전 행 수가 다르면 삭제하지 않음 (다음 실행에서 다시 내보냄).
+
+        Returns:
+            보관 완료 여부
+        """
+        async with _archive_lock(name) as acquired:
+            if not acquired:
+                return False
+
+            # 잠금 대기 사이 다른 워커가 이미 보관을 끝냈을 수 있음
+            async with read_session_maker() as session:
+                if period is not None and period not in await list_partitions(session):
+                    return False
+                if period is None and (await session.execute(
+                    select(func.count()).select_from(source)
+                )).scalar() == 0:
+                    return False
+
+            rows = await self._export(source, path)
+
+            async def drop(session: AsyncSession) -> Optional[int]:
+                # project_stats 가 이 모듈을 import 하므로 지역 import
+                from app.services.project_stats import record_archived_events
+
+                if _is_postgres():
+                    await session.execute(text(f"LOCK TABLE {name} IN ACCESS EXCLUSIVE MODE"))
+                count = (await session.execute(select(func.count()).select_from(source))).scalar()
+                if count != rows:
+                    return count
+                # 재계산(reconcile)에서 삭제된 이벤트 수가 빠지지 않도록 누적
+                await record_archived_events(session, source)
+                await session.execute(text(drop_statement))
+                return None
+
+            mismatch = await db_writer.run(drop)
+
+        if mismatch is not None:
+            print(f"이벤트 세그먼트 행 수 불일치: {path} (내보냄 {rows}건, 테이블 {mismatch}건) - 삭제 보류")
+            self.stats["archive_errors"] += 1
+            return False
+
+        self._archived(path, rows)
+        return True
+
+    def _archived(self, path: str, rows: int) -> None:
+        print(f"📦 이벤트 세그먼트 보관: {path} ({rows}건)")
+        self.stats["partitions_archived"] += 1
+        self.stats["rows_archived"] += rows
+        self.stats["last_archive_at"] = datetime.utcnow().isoformat()
+
+    async def _export(self, table, path: str) -> int:
+        """
+        테이블 전체를 NDJSON.gz 로 내보내기 (id 키셋 배치, 임시 파일에 쓴 뒤 이름 변경)
+
+        Returns:
+            내보낸 행 수
+        """
+        # 워커/호출별 고유 임시 파일 (동시 내보내기가 같은 파일에 섞여 쓰지 않도록)
+        tmp_path = f"{path}.{os.getpid()}.{uuid.uuid4().hex}.tmp"
+        handle = await asyncio.to_thread(gzip.open, tmp_path, "wb", 6)
+        rows = 0
+        last_id = None
+
+        try:
+            while True:
+                query = select(table).order_by(table.c.id).limit(EXPORT_BATCH_SIZE)
+                if last_id is not None:
+                    query = query.where(table.c.id > last_id)
+                async with read_session_maker() as session:
+                    batch = (await session.execute(query)).mappings().all()
+                if not batch:
+                    break
+
+                lines = "".join(
+                    json.dumps(
+                        {**row, "timestamp": row["timestamp"].isoformat()},
+                        ensure_ascii=False,
+                        default=str,
+                    ) + "\n"
+                    for row in batch
+                )
+                await asyncio.to_thread(handle.write, lines.encode("utf-8"))
+                rows += len(batch)
+                last_id = batch[-1]["id"]
+        except BaseException:
+            await asyncio.to_thread(handle.close)
+            os.remove(tmp_path)
+            raise
+
+        await asyncio.to_thread(handle.close)
+        os.replace(tmp_path, path)
+        return rows
+
+    # ---- 백그라운드 작업 ----
+
+    async def start(self) -> None:
+        """파티션 미리 생성 + 보관 기간 작업 시작"""
+        await self.ensure_current_partitions()
+        if self._task is None:
+            self._task = asyncio.create_task(self._retention_loop())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _retention_loop(self) -> None:
+        while True:
+            try:
+                await self.ensure_current_partitions()
+                await self.archive_expired()
+            except Exception as e:
+                print(f"이벤트 파티션 정리 에러: {str(e)}")
+                self.stats["archive_errors"] += 1
+            await asyncio.sleep(settings.EVENT_RETENTION_INTERVAL_SECONDS)
+
+    def snapshot(self) -> dict:
+        """파티션 통계"""
+        return {
+            **self.stats,
+            "known_partitions": sorted(self._known),
+            "retention_days": settings.EVENT_RETENTION_DAYS,
+        }
+
+
+@asynccontextmanager
+async def _archive_lock(name: str):
+    """
+    테이블별 보관 작업 잠금 (여러 워커 중 하나만 진행, 획득 여부를 돌려줌)
+
+    - PostgreSQL: 세션 advisory lock (여러 호스트에서도 동작)
+    - SQLite: EVENT_ARCHIVE_DIR 의 잠금 파일 flock (프로세스 종료 시 자동 해제)
+    """
+    if _is_postgres():
+        key = int.from_bytes(hashlib.sha256(name.encode()).digest()[:8], "big", signed=True)
+        async with engine.connect() as conn:
+            acquired = (await conn.execute(
+                text("SELECT pg_try_advisory_lock(:key)"), {"key": key}
+            )).scalar()
+            try:
+                yield acquired
+            finally:
+                if acquired:
+                    await conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": key})
+        return
+
+    handle = open(os.path.join(settings.EVENT_ARCHIVE_DIR, f".{name}.lock"), "a")
+    try:
+        try:
+            fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            acquired = True
+        except BlockingIOError:
+            acquired = False
+        yield acquired
+    finally:
+        # close 시 flock 해제
+        handle.close()
+
+
+def _partition_source(period: str) -> Table:
+    """PostgreSQL 파티션을 직접 읽는 테이블 (내보내기용)"""
+    return Table(
+        partition_name(period),
+        MetaData(),
+        Column("id", BigInteger),
+        *_columns(),
+    )
+
+
+event_partitions = EventPartitions()
@@ -0,0 +1,203 @@
+"""
+수집 프로필 캐시 서비스
+project_id 별 리드/이벤트 수집에 필요한 최소 정보 (활성 여부, Webhook 대상, 이름, 언락 유지 기간, 버전) read-through 캐시
+
+- 수집 경로는 projects 테이블(대용량 JSON 설정 컬럼 포함)을 조회하지 않고 이 캐시로 검증
+- 프로젝트 수정/삭제 시 무효화 (CACHE_REDIS_URL 설정 시 다른 워커는 CACHE_LOCAL_TTL_SECONDS 안에 반영)
+- 존재하지 않는 project_id 는 별도 negative 캐시에 짧게 보관 (잘못된 트래픽이 정상 항목을 밀어내지 않도록)
+- UUID 형식이 아닌 project_id 는 캐시/DB 조회 없이 거부
+"""
+
+import asyncio
+import json
+import re
+from typing import Optional
+
+from sqlalchemy import select
+
+from app.core.cache import create_cache
+from app.core.config import settings
+from app.core.database import read_session_maker
+from app.models.project import Project
+
+# project_id 형식 (str(uuid4()))
+_PROJECT_ID_PATTERN = re.compile(r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$")
+
+# 존재하지 않는 프로젝트 (negative cache 값)
+NOT_FOUND = "__not_found__"
+
+# form_config.unlock_duration 미설정 시 (프론트엔드 기본값과 동일)
+DEFAULT_UNLOCK_DURATION_DAYS = 30
+
+CACHED_FIELDS = ("project_id", "name", "webhook_url", "slack_webhook_url", "discord_webhook_url")
+
+
+class IngestProfile:
+    """수집 경로용 프로젝트 정보 (조회 전용)"""
+
+    __slots__ = (
+        "project_id",
+        "name",
+        "active",
+        "webhook_url",
+        "slack_webhook_url",
+        "discord_webhook_url",
+        "unlock_duration",
+        "version",
+    )
+
+    def __init__(
+        self,
+        project_id: str,
+        name: str,
+        active: bool,
+        webhook_url: Optional[str] = None,
+        slack_webhook_url: Optional[str] = None,
+        discord_webhook_url: Optional[str] = None,
+        unlock_duration: int = DEFAULT_UNLOCK_DURATION_DAYS,
+        version: str = "",
+    ):
+        self.project_id = project_id
+        self.name = name
+        self.active = active
+        self.webhook_url = webhook_url
+        self.slack_webhook_url = slack_webhook_url
+        self.discord_webhook_url = discord_webhook_url
+        # 언락 유지 기간 (일, form_config.unlock_duration)
+        self.unlock_duration = unlock_duration
+        # 프로젝트 수정 시각 (캐시 항목 비교용)
+        self.version = version
+
+    def to_json(self) -> str:
+        return json.dumps({field: getattr(self, field) for field in self.__slots__}, ensure_ascii=False)
+
+    @classmethod
+    def from_json(cls, cached: str) -> "IngestProfile":
+        return cls(**json.loads(cached))
+
+
+class IngestProfileCache:
+    """
+    수집 프로필 캐시
+
+    - 같은 프로젝트의 동시 캐시 미스는 한 번의 조회로 합침 (single-flight)
+    - 조회 중 무효화되면 조회 결과를 캐시에 저장하지 않음
+    """
+
+    def __init__(self):
+        self.profiles = create_cache("ingest_profile", max_entries=settings.INGEST_PROFILE_CACHE_MAX_ENTRIES)
+        self.missing = create_cache("ingest_profile_missing", max_entries=settings.INGEST_PROFILE_CACHE_MAX_ENTRIES)
+        self._inflight: dict[str, asyncio.Task] = {}
+        # 무효화 횟수 (조회 시작 이후 무효화 여부 확인용)
+        self._invalidations = 0
+        self.stats = {
+            "hits": 0,
+            "negative_hits": 0,
+            "malformed": 0,
+            "loads": 0,
+            "coalesced": 0,
+            "invalidations": 0,
+        }
+
+    async def get(self, project_id: str) -> Optional[IngestProfile]:
+        """
+        활성 프로젝트의 수집 프로필 조회 (캐시 → DB)
+
+        Returns:
+            프로필 / 존재하지 않거나 삭제된 프로젝트면 None
+        """
+        if not _PROJECT_ID_PATTERN.match(project_id):
+            self.stats["malformed"] += 1
+            return None
+
+        cached = await self.profiles.get(project_id)
+        if cached is not None:
+            self.stats["hits"] += 1
+            profile = IngestProfile.from_json(cached)
+        elif await self.missing.get(project_id) is not None:
+            self.stats["negative_hits"] += 1
+            return None
+        else:
+            profile = await self._load_once(project_id)
+
+        return profile if profile is not None and profile.active else None
+
+    async def invalidate(self, project_id: str) -> None:
+        """프로젝트 수정/삭제 시 캐시 무효화"""
+        self._invalidations += 1
+        self.stats["invalidations"] += 1
+        self._inflight.pop(project_id, None)
+        await self.profiles.delete(project_id)
+        await self.missing.delete(project_id)
+
+    def snapshot(self) -> dict:
+        """캐시 통계"""
+        return {**self.stats, "inflight": len(self._inflight)}
+
+    async def _load_once(self, project_id: str) -> Optional[IngestProfile]:
+        task = self._inflight.get(project_id)
+        if task is not None:
+            self.stats["coalesced"] += 1
+        else:
+            task = asyncio.create_task(self._load(project_id))
+            self._inflight[project_id] = task
+            task.add_done_callback(lambda t: self._on_load_done(project_id, t))
+
+        # 요청이 취소되어도 다른 대기자를 위해 조회는 계속 진행
+        return await asyncio.shield(task)
+
+    def _on_load_done(self, project_id: str, task: asyncio.Task) -> None:
+        # 무효화 이후 시작된 새 조회는 남겨둠
+        if self._inflight.get(project_id) is task:
+            del self._inflight[project_id]
+
+    async def _load(self, project_id: str) -> Optional[IngestProfile]:
+        self.stats["loads"] += 1
+        invalidations = self._invalidations
+
+        async with read_session_maker() as session:
+            result = await session.execute(
+                select(
+                    Project.project_id,
+                    Project.name,
+                    Project.webhook_url,
+                    Project.slack_webhook_url,
+                    Project.discord_webhook_url,
+                    Project.form_config,
+                    Project.updated_at,
+                    Project.deleted_at,
+                ).where(Project.project_id == project_id)
+            )
+            row = result.one_or_none()
+
+        profile = None
+        if row is not None:
+            profile = IngestProfile(
+                **{field: getattr(row, field) for field in CACHED_FIELDS},
+                active=row.deleted_at is None,
+                unlock_duration=(row.form_config or {}).get("unlock_duration") or DEFAULT_UNLOCK_DURATION_DAYS,
+                version=row.updated_at.isoformat() if row.updated_at else "",
+            )
+
+        if invalidations != self._invalidations:
+            # 조회 중 프로젝트가 수정됨 (다음 요청에서 다시 조회)
+            return profile
+
+        if profile is None:
+            await self.missing.set(project_id, NOT_FOUND, settings.INGEST_PROFILE_CACHE_NEGATIVE_TTL_SECONDS)
+        else:
+            await self.profiles.set(project_id, profile.to_json(), settings.INGEST_PROFILE_CACHE_TTL_SECONDS)
+        return profile
+
+
+ingest_profile_cache = IngestProfileCache()
+
+
+async def get_ingest_profile(project_id: str) -> Optional[IngestProfile]:
+    """활성 프로젝트의 수집 프로필 (없거나 삭제된 프로젝트면 None)"""
+    return await ingest_profile_cache.get(project_id)
+
+
+async def invalidate_ingest_profile(project_id: str) -> None:
+    """프로젝트 수정/삭제 시 캐시 무효화"""
+    await ingest_profile_cache.invalidate(project_id)
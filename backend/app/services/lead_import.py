@@ -0,0 +1,315 @@
+"""
+리드 일괄 가져오기 서비스
+업로드 본문(CSV/NDJSON)을 스트림으로 읽어 청크 단위로 검증/중복 제거/다중 행 INSERT (파일 크기와 무관하게 메모리 일정)
+"""
+
+import codecs
+import csv
+import json
+from datetime import datetime
+from typing import AsyncIterator, Optional
+from uuid import uuid4
+
+from pydantic import ValidationError
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import dialect_insert
+from app.core.db_writer import db_writer
+from app.models.lead import Lead
+from app.schemas.lead import LeadImportError, LeadImportResponse, LeadImportRow
+from app.services.analytics import rollup_leads
+from app.services.project_stats import record_lead
+
+# 한 줄(레코드) 최대 길이 (줄바꿈 없는 대용량 본문 방지)
+MAX_RECORD_LENGTH = 64 * 1024
+
+# 청크 최대 행 수 (중복 조회 IN 목록 크기 / 쓰기 트랜잭션 길이 제한)
+MAX_CHUNK_SIZE = 2000
+
+# CSV 헤더 → 필드 (내보내기 CSV 의 한글 헤더도 그대로 가져올 수 있음)
+CSV_COLUMN_ALIASES = {
+    "email": "email",
+    "이메일": "email",
+    "name": "name",
+    "이름": "name",
+    "company": "company",
+    "회사명": "company",
+    "role": "role",
+    "직무": "role",
+    "consent_privacy": "consent_privacy",
+    "개인정보 동의": "consent_privacy",
+    "consent_marketing": "consent_marketing",
+    "마케팅 동의": "consent_marketing",
+    "utm_source": "utm_source",
+    "utm source": "utm_source",
+    "utm_medium": "utm_medium",
+    "utm medium": "utm_medium",
+    "utm_campaign": "utm_campaign",
+    "utm campaign": "utm_campaign",
+    "utm_term": "utm_term",
+    "utm_content": "utm_content",
+    "form_location": "form_location",
+    "폼 위치": "form_location",
+}
+
+# CSV 동의 값 (내보내기 CSV 는 O/X)
+TRUE_VALUES = {"o", "y", "yes", "true", "1"}
+FALSE_VALUES = {"x", "n", "no", "false", "0"}
+
+UTM_FIELDS = ["utm_source", "utm_medium", "utm_campaign", "utm_term", "utm_content"]
+
+
+class LeadImportFormatError(Exception):
+    """파일 형식 오류 (가져오기 중단)"""
+
+
+async def _iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """바이트 스트림을 줄 단위 문자열로 (UTF-8, BOM 제거)"""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    carry = ""
+
+    try:
+        async for chunk in chunks:
+            carry += decoder.decode(chunk)
+            *lines, carry = carry.split("\n")
+            for line in lines:
+                yield line + "\n"
+            if len(carry) > MAX_RECORD_LENGTH:
+                raise LeadImportFormatError("한 줄의 길이가 너무 깁니다.")
+        carry += decoder.decode(b"", final=True)
+    except UnicodeDecodeError:
+        raise LeadImportFormatError("UTF-8 인코딩 파일만 가져올 수 있습니다.")
+
+    if carry:
+        yield carry
+
+
+async def _iter_csv_records(lines: AsyncIterator[str]) -> AsyncIterator[tuple[int, dict]]:
+    """
+    CSV 레코드 (줄 번호, 필드 dict)
+
+    따옴표 안의 줄바꿈은 따옴표 개수가 짝수가 될 때까지 다음 줄을 이어 붙여 처리.
+    """
+    columns: Optional[list[Optional[str]]] = None
+    record = ""
+    line_number = 0
+    start_line = 0
+
+    async for line in lines:
+        line_number += 1
+        if not record:
+            start_line = line_number
+        record += line
+        if record.count('"') % 2:
+            if len(record) > MAX_RECORD_LENGTH:
+                raise LeadImportFormatError(f"{start_line}번째 줄의 따옴표가 닫히지 않았습니다.")
+            continue
+
+        text, record = record, ""
+        if not text.strip():
+            continue
+
+        values = next(csv.reader([text]))
+        if columns is None:
+            columns = [CSV_COLUMN_ALIASES.get(value.strip().lower()) for value in values]
+            if "email" not in columns:
+                raise LeadImportFormatError("CSV 헤더에 email(이메일) 열이 없습니다.")
+            if "consent_privacy" not in columns:
+                raise LeadImportFormatError("CSV 헤더에 consent_privacy(개인정보 동의) 열이 없습니다.")
+            continue
+
+        yield start_line, {
+            column: value.strip()
+            for column, value in zip(columns, values)
+            if column is not None and value.strip()
+        }
+
+    if record:
+        raise LeadImportFormatError(f"{start_line}번째 줄의 따옴표가 닫히지 않았습니다.")
+
+
+def _parse_csv_fields(fields: dict) -> dict:
+    """CSV 문자열 값 → LeadImportRow 입력 (동의 O/X 등)"""
+    for key in ("consent_privacy", "consent_marketing"):
+        if key in fields:
+            value = fields[key].lower()
+            if value in TRUE_VALUES:
+                fields[key] = True
+            elif value in FALSE_VALUES:
+                fields[key] = False
+    return fields
+
+
+async def _iter_ndjson_records(lines: AsyncIterator[str]) -> AsyncIterator[tuple[int, object]]:
+    """NDJSON 레코드 (줄 번호, JSON 값 / 파싱 실패 시 예외 객체)"""
+    line_number = 0
+    async for line in lines:
+        line_number += 1
+        if not line.strip():
+            continue
+        try:
+            yield line_number, json.loads(line)
+        except json.JSONDecodeError as e:
+            yield line_number, e
+
+
+def _parse_ndjson_fields(value: dict) -> dict:
+    """NDJSON 객체 → LeadImportRow 입력 (utm_params 중첩 객체 허용)"""
+    utm_params = value.pop("utm_params", None)
+    if isinstance(utm_params, dict):
+        for key in UTM_FIELDS:
+            value.setdefault(key, utm_params.get(key))
+    return value
+
+
+def _validation_message(error: ValidationError) -> str:
+    first = error.errors()[0]
+    location = ".".join(str(part) for part in first["loc"])
+    return f"{location}: {first['msg']}" if location else first["msg"]
+
+
+class LeadImporter:
+    """
+    리드 일괄 가져오기
+
+    - 행을 검증해 chunk_size 개씩 모은 뒤 청크마다 중복 키 조회 1회 + 다중 행 INSERT 1회
+    - 청크는 단일 writer 를 통해 커밋 (집계 카운터/UTM 집계도 같은 트랜잭션)
+    - 오류 행은 건너뛰고 줄 번호와 함께 최대 max_errors 개까지 보고
+    - 가져온 리드는 Webhook 으로 전송하지 않음 (기존 구독자 이전 용도)
+    """
+
+    def __init__(self, project_id: str, chunk_size: int, max_errors: int):
+        self.project_id = project_id
+        self.chunk_size = max(1, min(chunk_size, MAX_CHUNK_SIZE))
+        self.max_errors = max_errors
+        self.total_rows = 0
+        self.imported = 0
+        self.duplicates = 0
+        self.failed = 0
+        self.errors: list[LeadImportError] = []
+        self._chunk: list[dict] = []
+
+    def _fail(self, line: int, message: str) -> None:
+        self.failed += 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append(LeadImportError(line=line, error=message))
+
+    async def add(self, line: int, fields: object) -> None:
+        """행 검증 후 청크에 추가 (가득 차면 저장)"""
+        self.total_rows += 1
+
+        if isinstance(fields, Exception):
+            self._fail(line, "JSON 형식이 올바르지 않습니다.")
+            return
+        if not isinstance(fields, dict):
+            self._fail(line, "행은 JSON 객체여야 합니다.")
+            return
+
+        try:
+            row = LeadImportRow.model_validate(fields)
+        except ValidationError as e:
+            self._fail(line, _validation_message(e))
+            return
+
+        self._chunk.append({
+            "lead_id": str(uuid4()),
+            "project_id": self.project_id,
+            "email": row.email,
+            "name": row.name,
+            "company": row.company,
+            "role": row.role,
+            "consent_privacy": row.consent_privacy,
+            "consent_marketing": row.consent_marketing,
+            "source_utm": {key: getattr(row, key) for key in UTM_FIELDS},
+            "form_location": row.form_location,
+            "dedupe_key": Lead.generate_dedupe_key(row.email, self.project_id),
+            "created_at": datetime.utcnow(),
+        })
+
+        if len(self._chunk) >= self.chunk_size:
+            await self.flush()
+
+    async def flush(self) -> None:
+        """모인 행 저장"""
+        if not self._chunk:
+            return
+
+        # 파일 안에서 중복된 이메일은 첫 행만 사용
+        rows_by_key: dict[str, dict] = {}
+        for row in self._chunk:
+            rows_by_key.setdefault(row["dedupe_key"], row)
+        self.duplicates += len(self._chunk) - len(rows_by_key)
+        self._chunk = []
+
+        project_id = self.project_id
+
+        async def write(session: AsyncSession) -> int:
+            # 이미 존재하는 리드 (청크당 1회 조회)
+            existing = set((await session.execute(
+                select(Lead.dedupe_key).where(Lead.dedupe_key.in_(list(rows_by_key)))
+            )).scalars())
+            new_rows = [row for key, row in rows_by_key.items() if key not in existing]
+            if not new_rows:
+                return 0
+
+            # 다중 행 INSERT (조회 이후 동시에 생성된 리드는 건너뜀)
+            # 행 목록을 파라미터로 넘기면 SQLAlchemy 가 캐시된 구문으로 다중 VALUES 를 만들어 실행 (insertmanyvalues)
+            stmt = (
+                dialect_insert(session.bind.dialect.name)(Lead.__table__)
+                .on_conflict_do_nothing(index_elements=[Lead.dedupe_key])
+                .returning(Lead.lead_id)
+            )
+            inserted_ids = set((await session.execute(stmt, new_rows)).scalars())
+            inserted_rows = [row for row in new_rows if row["lead_id"] in inserted_ids]
+            if not inserted_rows:
+                return 0
+
+            await record_lead(session, project_id, count=len(inserted_rows))
+            await rollup_leads(session, inserted_rows)
+            return len(inserted_rows)
+
+        inserted = await db_writer.run(write)
+        self.imported += inserted
+        self.duplicates += len(rows_by_key) - inserted
+
+    def result(self) -> LeadImportResponse:
+        return LeadImportResponse(
+            total_rows=self.total_rows,
+            imported=self.imported,
+            duplicates=self.duplicates,
+            failed=self.failed,
+            errors=self.errors,
+            errors_truncated=self.failed > len(self.errors),
+        )
+
+
+async def import_leads(project_id: str, chunks: AsyncIterator[bytes], file_format: str) -> LeadImportResponse:
+    """
+    리드 일괄 가져오기
+
+    Args:
+        project_id: 대상 프로젝트 (소유 확인은 호출자가 수행)
+        chunks: 업로드 본문 바이트 스트림
+        file_format: "csv" (헤더 행 필수) 또는 "ndjson" (줄마다 JSON 객체)
+
+    Raises:
+        LeadImportFormatError: 파일 형식 오류 (그 전까지 저장된 청크는 유지되며, 같은 파일을 다시 올려도 중복으로 건너뜀)
+    """
+    importer = LeadImporter(
+        project_id,
+        chunk_size=settings.LEAD_IMPORT_CHUNK_SIZE,
+        max_errors=settings.LEAD_IMPORT_MAX_ERRORS,
+    )
+    lines = _iter_lines(chunks)
+
+    if file_format == "ndjson":
+        async for line, value in _iter_ndjson_records(lines):
+            await importer.add(line, _parse_ndjson_fields(value) if isinstance(value, dict) else value)
+    else:
+        async for line, fields in _iter_csv_records(lines):
+            await importer.add(line, _parse_csv_fields(fields))
+
+    await importer.flush()
+    return importer.result()
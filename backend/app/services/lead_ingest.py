@@ -0,0 +1,44 @@
+"""
+리드 수집 서비스
+폼 제출 1건을 한 번의 INSERT ... ON CONFLICT ... RETURNING 으로 저장 (ORM unit of work 미사용)
+"""
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import dialect_insert
+from app.models.lead import Lead
+
+# dialect 이름 → 구문 (값은 실행 파라미터로 넘겨 컴파일 캐시를 그대로 사용)
+_upsert_statements: dict = {}
+
+
+def _upsert_statement(dialect_name: str):
+    stmt = _upsert_statements.get(dialect_name)
+    if stmt is None:
+        stmt = dialect_insert(dialect_name)(Lead.__table__)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Lead.dedupe_key],
+            set_={"dedupe_key": stmt.excluded.dedupe_key},
+        ).returning(Lead.lead_id)
+        _upsert_statements[dialect_name] = stmt
+    return stmt
+
+
+async def upsert_lead(session: AsyncSession, row: dict) -> tuple[str, bool]:
+    """
+    리드 저장 또는 기존 리드 조회 (1회 왕복)
+
+    dedupe_key 충돌 시 값이 바뀌지 않는 UPDATE 로 기존 행을 RETURNING 하므로
+    중복 제출도 추가 조회 없이 기존 lead_id 를 돌려받는다.
+    (ON CONFLICT DO NOTHING 은 충돌 시 아무 행도 반환하지 않음)
+    SQLite 3.35+ / PostgreSQL 에서 동작하며, 커밋하지 않는다.
+
+    Args:
+        row: lead_id 를 포함한 leads INSERT 값
+
+    Returns:
+        (lead_id, 새로 생성되었는지 여부)
+    """
+    stmt = _upsert_statement(session.bind.dialect.name)
+    lead_id = (await session.execute(stmt, row)).scalar_one()
+    return lead_id, lead_id == row["lead_id"]
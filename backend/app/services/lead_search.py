@@ -0,0 +1,251 @@
+"""
+리드 검색 서비스
+이메일/이름/회사명 부분 일치 검색을 인덱스로 처리
+
+- SQLite: FTS5 trigram 가상 테이블(leads_fts) + 트리거로 leads 와 동기화
+- PostgreSQL: pg_trgm GIN 인덱스
+- trigram 은 3글자 이상 검색어에만 인덱스가 쓰이므로 짧은 검색어(2글자 이름 등)는
+  단어 색인(SQLite leads_fts_words / PostgreSQL simple tsvector)에서 단어 시작 일치로 찾음
+- SQLite 는 MATCH 에 project_id 구문을 포함해 프로젝트 안에서만 색인을 탐색
+"""
+
+from sqlalchemy import Float, String, func, literal_column, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.sql import Select
+
+from app.models.lead import Lead
+
+# trigram 인덱스를 사용할 수 있는 최소 검색어 길이
+MIN_INDEXED_TERM_LENGTH = 3
+
+SPACE = literal_column("' '")
+EMPTY = literal_column("''")
+
+# PostgreSQL pg_trgm 확장 사용 가능 여부 (ensure_search_index 에서 갱신)
+pg_trgm_enabled = True
+
+SQLITE_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS leads_fts USING fts5(
+        lead_id UNINDEXED,
+        project_id,
+        email,
+        name,
+        company,
+        tokenize = 'trigram'
+    )
+    """,
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS leads_fts_words USING fts5(
+        lead_id UNINDEXED,
+        project_id,
+        email,
+        name,
+        company,
+        tokenize = 'unicode61',
+        prefix = '1 2'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS leads_fts_ai AFTER INSERT ON leads BEGIN
+        INSERT INTO leads_fts (rowid, lead_id, project_id, email, name, company)
+        VALUES (new.rowid, new.lead_id, new.project_id, new.email, COALESCE(new.name, ''), COALESCE(new.company, ''));
+        INSERT INTO leads_fts_words (rowid, lead_id, project_id, email, name, company)
+        VALUES (new.rowid, new.lead_id, new.project_id, new.email, COALESCE(new.name, ''), COALESCE(new.company, ''));
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS leads_fts_ad AFTER DELETE ON leads BEGIN
+        DELETE FROM leads_fts WHERE rowid = old.rowid;
+        DELETE FROM leads_fts_words WHERE rowid = old.rowid;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS leads_fts_au AFTER UPDATE OF email, name, company ON leads BEGIN
+        UPDATE leads_fts
+        SET email = new.email, name = COALESCE(new.name, ''), company = COALESCE(new.company, '')
+        WHERE rowid = old.rowid;
+        UPDATE leads_fts_words
+        SET email = new.email, name = COALESCE(new.name, ''), company = COALESCE(new.company, '')
+        WHERE rowid = old.rowid;
+    END
+    """,
+]
+
+SQLITE_BACKFILL = [
+    """
+    INSERT INTO leads_fts (rowid, lead_id, project_id, email, name, company)
+    SELECT rowid, lead_id, project_id, email, COALESCE(name, ''), COALESCE(company, '')
+    FROM leads
+    """,
+    """
+    INSERT INTO leads_fts_words (rowid, lead_id, project_id, email, name, company)
+    SELECT rowid, lead_id, project_id, email, COALESCE(name, ''), COALESCE(company, '')
+    FROM leads
+    """,
+]
+
+# 이전 스키마(project_id UNINDEXED, 단어 색인 없음)를 다시 만들 때 삭제
+SQLITE_DROP = [
+    "DROP TRIGGER IF EXISTS leads_fts_ai",
+    "DROP TRIGGER IF EXISTS leads_fts_ad",
+    "DROP TRIGGER IF EXISTS leads_fts_au",
+    "DROP TABLE IF EXISTS leads_fts",
+    "DROP TABLE IF EXISTS leads_fts_words",
+]
+
+POSTGRES_DDL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    """
+    CREATE INDEX IF NOT EXISTS ix_leads_search_trgm ON leads
+    USING gin ((lower(email || ' ' || coalesce(name, '') || ' ' || coalesce(company, ''))) gin_trgm_ops)
+    """,
+]
+
+# 짧은 검색어용 단어 색인 (확장 불필요, 이메일은 @ . 로 나눠 아이디/도메인 단어로 색인)
+POSTGRES_WORDS_DDL = """
+    CREATE INDEX IF NOT EXISTS ix_leads_search_words ON leads
+    USING gin (to_tsvector('simple', regexp_replace(email || ' ' || coalesce(name, '') || ' ' || coalesce(company, ''), '[@.]', ' ', 'g')))
+"""
+
+
+async def ensure_search_index(conn, force_recreate: bool = False) -> None:
+    """
+    검색 인덱스 생성 (init_db 에서 호출)
+
+    SQLite 는 가상 테이블을 새로 만든 경우 기존 리드로 채운다 (이전 스키마면 다시 만든다).
+    """
+    global pg_trgm_enabled
+
+    if conn.dialect.name == "postgresql":
+        try:
+            async with conn.begin_nested():
+                for statement in POSTGRES_DDL:
+                    await conn.execute(text(statement))
+        except DBAPIError as e:
+            # 관리형 DB 등에서 확장을 설치할 수 없는 경우 인덱스 없이 검색
+            print(f"⚠️  pg_trgm 검색 인덱스 생성 실패 (ILIKE 검색으로 동작): {str(e.orig)}")
+            pg_trgm_enabled = False
+        await conn.execute(text(POSTGRES_WORDS_DDL))
+        return
+
+    existing = await conn.execute(
+        text(
+            "SELECT name, sql FROM sqlite_master WHERE type = 'table' "
+            "AND name IN ('leads_fts', 'leads_fts_words')"
+        )
+    )
+    tables = dict(existing.all())
+    outdated = "leads_fts_words" not in tables or "project_id UNINDEXED" in (tables.get("leads_fts") or "")
+
+    created = force_recreate or outdated
+    if created:
+        for statement in SQLITE_DROP:
+            await conn.execute(text(statement))
+
+    for statement in SQLITE_DDL:
+        await conn.execute(text(statement))
+    if created:
+        for statement in SQLITE_BACKFILL:
+            await conn.execute(text(statement))
+
+
+def _search_text():
+    """PostgreSQL trigram 인덱스와 같은 표현식 (상수는 바인드 없이 그대로 써야 인덱스 표현식과 일치)"""
+    return func.lower(_joined_fields())
+
+
+def _search_words():
+    """PostgreSQL 단어 색인과 같은 표현식"""
+    return func.to_tsvector(
+        literal_column("'simple'"),
+        func.regexp_replace(_joined_fields(), literal_column("'[@.]'"), SPACE, literal_column("'g'")),
+    )
+
+
+def _joined_fields():
+    return Lead.email + SPACE + func.coalesce(Lead.name, EMPTY) + SPACE + func.coalesce(Lead.company, EMPTY)
+
+
+def _like_pattern(term: str) -> str:
+    """부분 일치 LIKE 패턴 (검색어의 % _ \\ 는 문자 그대로)"""
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def _fts_phrase(value: str) -> str:
+    """FTS5 구문 (큰따옴표 이스케이프)"""
+    return '"{}"'.format(value.replace('"', '""'))
+
+
+def _fts_hits(table: str, match: str, project_id: str, name: str):
+    """FTS5 검색 결과 (lead_id, bm25) 서브쿼리 - project_id 구문으로 프로젝트 안에서만 탐색"""
+    return (
+        text(
+            f"SELECT lead_id, bm25({table}) AS rank FROM {table} "
+            f"WHERE {table} MATCH :{name}"
+        )
+        .bindparams(**{name: f"project_id : {_fts_phrase(project_id)} AND {match}"})
+        .columns(lead_id=String, rank=Float)
+        .subquery(name)
+    )
+
+
+def _ts_lexeme(value: str) -> str:
+    """tsquery 따옴표 lexeme (작은따옴표/역슬래시 이스케이프)"""
+    return "'{}'".format(value.replace("\\", "\\\\").replace("'", "''"))
+
+
+def _has_word_chars(term: str) -> bool:
+    return any(ch.isalnum() for ch in term)
+
+
+def apply_lead_search(query: Select, dialect_name: str, project_id: str, search: str) -> tuple[Select, list]:
+    """
+    리드 조회 쿼리에 검색 조건 적용
+
+    공백으로 나눈 검색어를 모두 포함하는 리드를 찾는다 (대소문자 무시).
+    3글자 이상은 부분 일치, 짧은 검색어는 단어 시작 일치 (기호만 있는 짧은 검색어는 무시).
+
+    Returns:
+        (검색 조건이 적용된 쿼리, 관련도 순 정렬 기준)
+    """
+    terms = search.split()
+    indexed_terms = [term for term in terms if len(term) >= MIN_INDEXED_TERM_LENGTH]
+    short_terms = [
+        term for term in terms
+        if len(term) < MIN_INDEXED_TERM_LENGTH and _has_word_chars(term)
+    ]
+
+    if dialect_name == "postgresql":
+        search_text = _search_text()
+        for term in indexed_terms:
+            query = query.where(search_text.like(_like_pattern(term.lower()), escape="\\"))
+        for term in short_terms:
+            prefix = func.to_tsquery(literal_column("'simple'"), f"{_ts_lexeme(term)}:*")
+            query = query.where(_search_words().op("@@")(prefix))
+        if not pg_trgm_enabled or not indexed_terms:
+            return query, [Lead.created_at.desc()]
+        return query, [func.similarity(search_text, search.lower()).desc(), Lead.created_at.desc()]
+
+    order = [Lead.created_at.desc()]
+
+    # 단어 시작 일치 (unicode61 + prefix 색인)
+    if short_terms:
+        match = " AND ".join(
+            f"{{email name company}} : {_fts_phrase(term)} *" for term in short_terms
+        )
+        words = _fts_hits("leads_fts_words", match, project_id, "lead_search_words")
+        query = query.join(words, words.c.lead_id == Lead.lead_id)
+        order = [words.c.rank, Lead.created_at.desc()]
+
+    # FTS5 trigram: 각 검색어를 구문으로 감싸 AND 검색, bm25 는 낮을수록 관련도 높음
+    if indexed_terms:
+        match = " AND ".join(
+            f"{{email name company}} : {_fts_phrase(term)}" for term in indexed_terms
+        )
+        hits = _fts_hits("leads_fts", match, project_id, "lead_search_hits")
+        query = query.join(hits, hits.c.lead_id == Lead.lead_id)
+        order = [hits.c.rank, Lead.created_at.desc()]
+
+    return query, order
@@ -0,0 +1,262 @@
+"""
+Notion 페이지 캐시 서비스
+recordMap 응답을 gzip 으로 압축해 메모리 + 디스크에 보관 (stale-while-revalidate)
+"""
+
+import asyncio
+import gzip
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Optional, Tuple
+
+from app.core.config import settings
+
+Fetcher = Callable[[], Awaitable[bytes]]
+
+
+class NotionPageCache:
+    """
+    Notion 페이지 캐시
+
+    - soft TTL 이내: 캐시 즉시 반환 (hit)
+    - soft TTL ~ hard TTL: 캐시 즉시 반환 + 백그라운드 갱신 (stale)
+    - 그 외: 업스트림 조회 (miss)
+    - 같은 페이지의 동시 조회/갱신은 한 번의 업스트림 요청으로 합침 (single-flight)
+    - 디스크에 gzip 으로 저장하여 재시작 후에도 유지
+    - 디스크는 파일 수/크기 상한을 넘으면 hard TTL 이 지난 파일, 그다음 오래된(mtime) 파일 순으로 삭제
+    """
+
+    # 상한 초과 시 상한의 이 비율까지 줄임 (쓰기마다 정리가 반복되지 않도록)
+    PRUNE_TARGET_RATIO = 0.9
+
+    def __init__(
+        self,
+        cache_dir: str,
+        soft_ttl: int,
+        hard_ttl: int,
+        max_entries: int,
+        disk_max_bytes: int,
+        disk_max_files: int,
+    ):
+        self.cache_dir = cache_dir
+        self.soft_ttl = soft_ttl
+        self.hard_ttl = hard_ttl
+        self.max_entries = max_entries
+        self.disk_max_bytes = disk_max_bytes
+        self.disk_max_files = disk_max_files
+        self._memory: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._inflight: dict[str, asyncio.Task] = {}
+        # 디스크 파일별 크기 (첫 쓰기 때 디렉터리를 스캔해 채움, 정리 시 다시 스캔해 다른 워커 파일 반영)
+        self._disk_sizes: Optional[dict[str, int]] = None
+        self._disk_bytes = 0
+        self._disk_lock = threading.Lock()
+        self.stats = {
+            "hits": 0,
+            "stale": 0,
+            "misses": 0,
+            "disk_loads": 0,
+            "refreshes": 0,
+            "fetch_errors": 0,
+            "coalesced": 0,
+            "disk_expired": 0,
+            "disk_evictions": 0,
+        }
+
+    async def get(self, key: str, fetch: Fetcher) -> bytes:
+        """
+        캐시 조회 (gzip 압축된 본문 반환)
+
+        Args:
+            key: 캐시 키 (포맷된 페이지 ID)
+            fetch: 업스트림 조회 함수 (압축 전 본문 반환)
+        """
+        entry = self._memory_get(key)
+        if entry is None:
+            entry = await self._disk_get(key)
+
+        if entry is not None:
+            fetched_at, body = entry
+            age = time.time() - fetched_at
+
+            if age < self.soft_ttl:
+                self.stats["hits"] += 1
+                return body
+
+            if age < self.hard_ttl:
+                self.stats["stale"] += 1
+                self._refresh_in_background(key, fetch)
+                return body
+
+        self.stats["misses"] += 1
+        return await self._fetch_once(key, fetch)
+
+    def snapshot(self) -> dict:
+        """캐시 통계"""
+        return {
+            **self.stats,
+            "memory_entries": len(self._memory),
+            "inflight": len(self._inflight),
+            "disk_files": len(self._disk_sizes) if self._disk_sizes is not None else None,
+            "disk_bytes": self._disk_bytes if self._disk_sizes is not None else None,
+        }
+
+    # ---- single-flight ----
+
+    async def _fetch_once(self, key: str, fetch: Fetcher) -> bytes:
+        task = self._inflight.get(key)
+        if task is not None:
+            self.stats["coalesced"] += 1
+        else:
+            task = self._start_fetch(key, fetch)
+
+        # 요청이 취소되어도 다른 대기자를 위해 업스트림 조회는 계속 진행
+        return await asyncio.shield(task)
+
+    def _refresh_in_background(self, key: str, fetch: Fetcher) -> None:
+        if key in self._inflight:
+            return
+        self.stats["refreshes"] += 1
+        self._start_fetch(key, fetch)
+
+    def _start_fetch(self, key: str, fetch: Fetcher) -> asyncio.Task:
+        task = asyncio.create_task(self._fetch_and_store(key, fetch))
+        self._inflight[key] = task
+        task.add_done_callback(lambda t: self._on_fetch_done(key, t))
+        return task
+
+    def _on_fetch_done(self, key: str, task: asyncio.Task) -> None:
+        self._inflight.pop(key, None)
+        if not task.cancelled() and task.exception() is not None:
+            self.stats["fetch_errors"] += 1
+
+    async def _fetch_and_store(self, key: str, fetch: Fetcher) -> bytes:
+        body = gzip.compress(await fetch(), compresslevel=6)
+        self._memory_set(key, time.time(), body)
+        await asyncio.to_thread(self._disk_write, key, body)
+        return body
+
+    # ---- 메모리 ----
+
+    def _memory_get(self, key: str) -> Optional[Tuple[float, bytes]]:
+        entry = self._memory.get(key)
+        if entry is not None:
+            self._memory.move_to_end(key)
+        return entry
+
+    def _memory_set(self, key: str, fetched_at: float, body: bytes) -> None:
+        self._memory[key] = (fetched_at, body)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    # ---- 디스크 ----
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json.gz")
+
+    async def _disk_get(self, key: str) -> Optional[Tuple[float, bytes]]:
+        entry = await asyncio.to_thread(self._disk_read, key)
+        if entry is not None:
+            self.stats["disk_loads"] += 1
+            self._memory_set(key, *entry)
+        return entry
+
+    def _disk_read(self, key: str) -> Optional[Tuple[float, bytes]]:
+        path = self._path(key)
+        try:
+            fetched_at = os.path.getmtime(path)
+            if time.time() - fetched_at >= self.hard_ttl:
+                # 만료된 파일은 다시 쓸 일이 없으므로 바로 삭제
+                self._disk_remove(key, "disk_expired")
+                return None
+            with open(path, "rb") as f:
+                return fetched_at, f.read()
+        except OSError:
+            return None
+
+    def _disk_write(self, key: str, body: bytes) -> None:
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = f"{self._path(key)}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(body)
+            os.replace(tmp_path, self._path(key))
+        except OSError as e:
+            print(f"Notion 캐시 저장 실패: {str(e)}")
+            return
+
+        with self._disk_lock:
+            if self._disk_sizes is None:
+                self._disk_scan()
+            self._disk_bytes += len(body) - self._disk_sizes.get(key, 0)
+            self._disk_sizes[key] = len(body)
+            if len(self._disk_sizes) > self.disk_max_files or self._disk_bytes > self.disk_max_bytes:
+                self._disk_prune()
+
+    def _disk_remove(self, key: str, stat: str) -> None:
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            return
+        self.stats[stat] += 1
+        with self._disk_lock:
+            if self._disk_sizes is not None and key in self._disk_sizes:
+                self._disk_bytes -= self._disk_sizes.pop(key)
+
+    def _disk_scan(self) -> list[Tuple[float, int, str]]:
+        """디스크 캐시 파일 목록 (mtime, 크기, 키) 을 다시 읽어 집계 갱신 (_disk_lock 보유 상태로 호출)"""
+        files = []
+        try:
+            with os.scandir(self.cache_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(".json.gz"):
+                        continue
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    files.append((stat.st_mtime, stat.st_size, entry.name[: -len(".json.gz")]))
+        except OSError:
+            pass
+
+        self._disk_sizes = {key: size for _, size, key in files}
+        self._disk_bytes = sum(self._disk_sizes.values())
+        return files
+
+    def _disk_prune(self) -> None:
+        """
+        디스크 상한 정리 (_disk_lock 보유 상태로 호출)
+
+        hard TTL 이 지난 파일은 모두 삭제하고, 그래도 상한의 PRUNE_TARGET_RATIO 를 넘으면
+        mtime 이 오래된 파일부터 삭제
+        """
+        files = sorted(self._disk_scan())
+        target_files = int(self.disk_max_files * self.PRUNE_TARGET_RATIO)
+        target_bytes = int(self.disk_max_bytes * self.PRUNE_TARGET_RATIO)
+        expired_before = time.time() - self.hard_ttl
+
+        for mtime, size, key in files:
+            expired = mtime <= expired_before
+            if not expired and len(self._disk_sizes) <= target_files and self._disk_bytes <= target_bytes:
+                break
+            try:
+                os.remove(self._path(key))
+            except FileNotFoundError:
+                pass  # 다른 워커가 먼저 삭제
+            except OSError as e:
+                print(f"Notion 캐시 정리 실패: {str(e)}")
+                continue
+            self.stats["disk_expired" if expired else "disk_evictions"] += 1
+            self._disk_bytes -= self._disk_sizes.pop(key)
+
+
+notion_page_cache = NotionPageCache(
+    cache_dir=settings.NOTION_CACHE_DIR,
+    soft_ttl=settings.NOTION_CACHE_SOFT_TTL_SECONDS,
+    hard_ttl=settings.NOTION_CACHE_HARD_TTL_SECONDS,
+    max_entries=settings.NOTION_CACHE_MAX_ENTRIES,
+    disk_max_bytes=settings.NOTION_CACHE_DISK_MAX_BYTES,
+    disk_max_files=settings.NOTION_CACHE_DISK_MAX_FILES,
+)
@@ -0,0 +1,176 @@
+"""
+Notion API 미러 선택 서비스
+미러별 상태(EWMA 지연/오류율)를 추적하고 hedged request 로 조회
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Awaitable, Callable, Optional, Tuple
+
+from app.core.config import settings
+
+# 미러 1회 조회 결과: ("ok", 본문) / ("not_found", None) / ("error", 메시지)
+AttemptResult = Tuple[str, Optional[object]]
+Attempt = Callable[[str], Awaitable[AttemptResult]]
+
+# 오류율 1.0 일 때 점수에 더해지는 지연 페널티 (초)
+ERROR_PENALTY_SECONDS = 10.0
+
+
+class MirrorHealth:
+    """미러 상태 (EWMA 지연, EWMA 오류율, 최근 지연 표본)"""
+
+    def __init__(self, url: str, order: int, alpha: float, initial_latency: float):
+        self.url = url
+        self.order = order
+        self.alpha = alpha
+        self.latency = initial_latency
+        self.error_rate = 0.0
+        self.samples: deque[float] = deque(maxlen=50)
+        self.requests = 0
+        self.errors = 0
+
+    def record(self, latency: float, ok: bool) -> None:
+        self.requests += 1
+        self.error_rate = (1 - self.alpha) * self.error_rate + self.alpha * (0.0 if ok else 1.0)
+        if ok:
+            self.latency = (1 - self.alpha) * self.latency + self.alpha * latency
+            self.samples.append(latency)
+        else:
+            self.errors += 1
+
+    def record_cancelled(self, elapsed: float) -> None:
+        """hedge 에서 진 요청 (실제 지연은 최소 elapsed 이상)"""
+        if elapsed > self.latency:
+            self.latency = (1 - self.alpha) * self.latency + self.alpha * elapsed
+
+    @property
+    def score(self) -> float:
+        """낮을수록 우선"""
+        return self.latency + self.error_rate * ERROR_PENALTY_SECONDS
+
+    def p95(self) -> Optional[float]:
+        if len(self.samples) < 5:
+            return None
+        ordered = sorted(self.samples)
+        return ordered[int(0.95 * (len(ordered) - 1))]
+
+    def snapshot(self) -> dict:
+        return {
+            "url": self.url,
+            "score": round(self.score, 4),
+            "ewma_latency": round(self.latency, 4),
+            "error_rate": round(self.error_rate, 4),
+            "p95": self.p95(),
+            "requests": self.requests,
+            "errors": self.errors,
+        }
+
+
+class MirrorPool:
+    """
+    미러 풀
+
+    - 점수 순으로 미러 정렬 (빠르고 오류가 적은 미러 우선)
+    - 1순위 미러에 요청 후, p95 지연 기반 hedge delay 가 지나도 응답이 없으면 다음 미러에 동시 요청
+    - 실패 응답은 즉시 다음 미러로 넘어감
+    - 먼저 성공한 응답을 사용하고 나머지 요청은 취소
+    """
+
+    def __init__(self, urls: list[str]):
+        self.mirrors = [
+            MirrorHealth(
+                url,
+                order,
+                alpha=settings.NOTION_MIRROR_EWMA_ALPHA,
+                initial_latency=settings.NOTION_HEDGE_DEFAULT_DELAY_SECONDS,
+            )
+            for order, url in enumerate(urls)
+        ]
+
+    def ordered(self) -> list[MirrorHealth]:
+        return sorted(self.mirrors, key=lambda m: (m.score, m.order))
+
+    def hedge_delay(self, mirror: MirrorHealth) -> Optional[float]:
+        """다음 미러를 추가로 호출하기까지 대기 시간 (None 이면 실패 시에만 다음 미러 호출)"""
+        if not settings.NOTION_HEDGE_ENABLED:
+            return None
+        delay = mirror.p95() or settings.NOTION_HEDGE_DEFAULT_DELAY_SECONDS
+        return min(
+            max(delay, settings.NOTION_HEDGE_MIN_DELAY_SECONDS),
+            settings.NOTION_HEDGE_MAX_DELAY_SECONDS,
+        )
+
+    async def fetch(self, attempt: Attempt) -> Tuple[str, Optional[object], list[str]]:
+        """
+        미러 조회
+
+        Args:
+            attempt: 미러 URL 을 받아 1회 조회하는 함수
+
+        Returns:
+            (결과 종류, 값, 실패 메시지 목록)
+            결과 종류는 "ok" / "not_found" / "error"
+        """
+        pending_mirrors = self.ordered()
+        running: dict[asyncio.Task, Tuple[MirrorHealth, float]] = {}
+        errors: list[str] = []
+        not_found = False
+
+        def launch() -> Optional[MirrorHealth]:
+            if not pending_mirrors:
+                return None
+            mirror = pending_mirrors.pop(0)
+            task = asyncio.create_task(attempt(mirror.url))
+            running[task] = (mirror, time.monotonic())
+            return mirror
+
+        current = launch()
+
+        try:
+            while running:
+                timeout = self.hedge_delay(current) if pending_mirrors else None
+                done, _ = await asyncio.wait(
+                    running.keys(), timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+
+                if not done:
+                    # hedge delay 초과 → 다음 미러 동시 호출
+                    current = launch() or current
+                    continue
+
+                for task in done:
+                    mirror, started_at = running.pop(task)
+                    latency = time.monotonic() - started_at
+                    kind, value = task.result()
+
+                    if kind == "ok":
+                        mirror.record(latency, ok=True)
+                        return kind, value, errors
+
+                    if kind == "not_found":
+                        # 미러는 정상 응답 (페이지가 없음)
+                        mirror.record(latency, ok=True)
+                        not_found = True
+                    else:
+                        mirror.record(latency, ok=False)
+                        errors.append(str(value))
+
+                    # 실패한 만큼 다음 미러를 바로 호출
+                    current = launch() or current
+        finally:
+            now = time.monotonic()
+            for task, (mirror, started_at) in running.items():
+                task.cancel()
+                mirror.record_cancelled(now - started_at)
+
+        if not_found:
+            return "not_found", None, errors
+        return "error", None, errors
+
+    def snapshot(self) -> list[dict]:
+        return [mirror.snapshot() for mirror in self.ordered()]
+
+
+notion_mirror_pool = MirrorPool(settings.NOTION_API_MIRRORS)
@@ -0,0 +1,112 @@
+"""
+공개 프로젝트 캐시 서비스
+public_slug 별 공개 설정(ProjectPublicResponse) read-through 캐시
+
+- 조회 시작 후 무효화되면 조회 결과를 캐시에 저장하지 않음 (수정 직전 본문이 TTL 동안 남지 않도록)
+- 무효화 세대는 CACHE_REDIS_URL 설정 시 Redis 에 두어 다른 워커의 무효화도 반영
+- If-None-Match 는 약한 비교 (W/ 접두사, 쉼표로 나열된 여러 ETag, *)
+"""
+
+import hashlib
+import json
+from typing import Optional, Tuple
+
+from app.core.cache import create_cache, get_redis_client
+from app.core.config import settings
+from app.models.project import Project
+
+# 존재하지 않는 슬러그 (negative cache)
+NOT_FOUND = "__not_found__"
+
+public_project_cache = create_cache(
+    "public_project",
+    max_entries=settings.PUBLIC_PROJECT_CACHE_MAX_ENTRIES,
+)
+
+# 무효화 횟수 (조회 시작 이후 무효화 여부 확인용, 공유 캐시 사용 시 Redis 키)
+GENERATION_KEY = "formtion:public_project:generation"
+_invalidations = 0
+
+
+def build_etag(project: Project) -> str:
+    """프로젝트 수정 시각 기반 ETag"""
+    raw = f"{project.project_id}:{project.updated_at.isoformat()}"
+    return '"' + hashlib.sha1(raw.encode("utf-8")).hexdigest()[:16] + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더가 ETag 와 일치하는지 (약한 비교)"""
+    if not if_none_match:
+        return False
+
+    opaque = etag.removeprefix("W/")
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == opaque:
+            return True
+    return False
+
+
+async def current_generation() -> int:
+    """DB 조회 전에 받아 두고 store_* 에 전달 (그 사이 무효화되면 저장하지 않음)"""
+    redis_client = get_redis_client()
+    if redis_client is None:
+        return _invalidations
+    return int(await redis_client.get(GENERATION_KEY) or 0)
+
+
+async def _store(slug: str, value: str, ttl: int, generation: int) -> None:
+    """
+    세대가 그대로일 때만 저장
+
+    확인과 저장 사이에 다른 워커가 무효화할 수 있으므로 저장 후 한 번 더 확인하고,
+    바뀌었으면 방금 저장한 항목을 삭제한다. (무효화는 세대 증가 → 삭제 순서)
+    """
+    if await current_generation() != generation:
+        return
+    await public_project_cache.set(slug, value, ttl)
+    if await current_generation() != generation:
+        await public_project_cache.delete(slug)
+
+
+async def get_public_project(slug: str) -> Optional[Tuple[dict, str] | str]:
+    """
+    캐시된 공개 프로젝트 조회
+
+    Returns:
+        (응답 본문, ETag) / 존재하지 않는 슬러그면 NOT_FOUND / 캐시 미스면 None
+    """
+    cached = await public_project_cache.get(slug)
+    if cached is None:
+        return None
+    if cached == NOT_FOUND:
+        return NOT_FOUND
+
+    entry = json.loads(cached)
+    return entry["body"], entry["etag"]
+
+
+async def store_public_project(slug: str, body: dict, etag: str, generation: int) -> None:
+    """공개 프로젝트 응답 캐시 (조회 중 무효화되었으면 저장하지 않음)"""
+    await _store(
+        slug,
+        json.dumps({"body": body, "etag": etag}, ensure_ascii=False),
+        settings.PUBLIC_PROJECT_CACHE_TTL_SECONDS,
+        generation,
+    )
+
+
+async def store_public_project_not_found(slug: str, generation: int) -> None:
+    """존재하지 않는 슬러그 캐시 (짧은 TTL, 조회 중 무효화되었으면 저장하지 않음)"""
+    await _store(slug, NOT_FOUND, settings.PUBLIC_PROJECT_CACHE_NEGATIVE_TTL_SECONDS, generation)
+
+
+async def invalidate_public_project(slug: str) -> None:
+    """프로젝트 생성/수정/삭제 시 캐시 무효화 (다른 워커의 프로세스 내 캐시는 pub/sub 으로 삭제)"""
+    global _invalidations
+    redis_client = get_redis_client()
+    if redis_client is None:
+        _invalidations += 1
+    else:
+        await redis_client.incr(GENERATION_KEY)
+    await public_project_cache.delete(slug)
@@ -0,0 +1,242 @@
+"""
+프로젝트 집계 서비스
+project_stats 카운터 갱신 및 재계산 (drift 복구)
+"""
+
+from datetime import datetime
+from typing import Iterable, Optional
+
+from sqlalchemy import case, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import dialect_insert
+from app.models.lead import Lead
+from app.models.project import Project
+from app.models.project_stats import ProjectStats
+from app.services.event_partitions import event_source
+
+
+def _insert(db: AsyncSession):
+    """세션의 방언에 맞는 INSERT 구문"""
+    return dialect_insert(db.bind.dialect.name)(ProjectStats)
+
+
+async def record_lead(
+    db: AsyncSession,
+    project_id: str,
+    created_at: Optional[datetime] = None,
+    count: int = 1,
+) -> None:
+    """
+    리드 생성 카운터 반영
+
+    커밋하지 않으므로 리드 INSERT와 같은 트랜잭션에서 호출해야 한다.
+    일괄 가져오기는 count 로 한 번에 반영한다.
+    """
+    created_at = created_at or datetime.utcnow()
+    stmt = _insert(db).values(
+        project_id=project_id,
+        lead_count=count,
+        last_lead_at=created_at,
+        updated_at=datetime.utcnow(),
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[ProjectStats.project_id],
+        set_={
+            "lead_count": ProjectStats.lead_count + count,
+            "last_lead_at": stmt.excluded.last_lead_at,
+            "updated_at": stmt.excluded.updated_at,
+        },
+    )
+    await db.execute(stmt)
+
+
+async def record_events(
+    db: AsyncSession,
+    project_id: str,
+    event_types: Iterable[str],
+    occurred_at: Optional[datetime] = None,
+) -> None:
+    """
+    이벤트 카운터 반영
+
+    같은 프로젝트의 이벤트를 묶어서 한 번의 UPSERT로 반영한다.
+    커밋하지 않으므로 이벤트 INSERT와 같은 트랜잭션에서 호출해야 한다.
+    """
+    event_types = list(event_types)
+    if not event_types:
+        return
+
+    occurred_at = occurred_at or datetime.utcnow()
+    page_views = sum(1 for t in event_types if t == "page_view")
+    form_submits = sum(1 for t in event_types if t == "form_submit")
+
+    stmt = _insert(db).values(
+        project_id=project_id,
+        lead_count=0,
+        event_count=len(event_types),
+        page_view_count=page_views,
+        form_submit_count=form_submits,
+        last_event_at=occurred_at,
+        updated_at=datetime.utcnow(),
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[ProjectStats.project_id],
+        set_={
+            "event_count": ProjectStats.event_count + len(event_types),
+            "page_view_count": ProjectStats.page_view_count + page_views,
+            "form_submit_count": ProjectStats.form_submit_count + form_submits,
+            "last_event_at": stmt.excluded.last_event_at,
+            "updated_at": stmt.excluded.updated_at,
+        },
+    )
+    await db.execute(stmt)
+
+
+async def record_archived_events(db: AsyncSession, source) -> None:
+    """
+    삭제 직전 이벤트 테이블의 프로젝트별 수를 보관 누적 카운터에 반영
+
+    커밋하지 않으므로 테이블 DROP/TRUNCATE 와 같은 트랜잭션에서 호출해야 한다.
+    event_count 등 누적 카운터는 그대로 둔다 (이미 보관분을 포함).
+    """
+    rows = (await db.execute(
+        select(
+            source.c.project_id,
+            func.count(),
+            func.sum(case((source.c.event_type == "page_view", 1), else_=0)),
+            func.sum(case((source.c.event_type == "form_submit", 1), else_=0)),
+        ).group_by(source.c.project_id)
+    )).all()
+    if not rows:
+        return
+
+    now = datetime.utcnow()
+    stmt = _insert(db)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[ProjectStats.project_id],
+        set_={
+            "archived_event_count": ProjectStats.archived_event_count + stmt.excluded.archived_event_count,
+            "archived_page_view_count": ProjectStats.archived_page_view_count + stmt.excluded.archived_page_view_count,
+            "archived_form_submit_count": ProjectStats.archived_form_submit_count + stmt.excluded.archived_form_submit_count,
+            "updated_at": stmt.excluded.updated_at,
+        },
+    )
+    await db.execute(stmt, [
+        {
+            "project_id": pid,
+            "lead_count": 0,
+            "event_count": count,
+            "page_view_count": page_views or 0,
+            "form_submit_count": form_submits or 0,
+            "archived_event_count": count,
+            "archived_page_view_count": page_views or 0,
+            "archived_form_submit_count": form_submits or 0,
+            "updated_at": now,
+        }
+        for pid, count, page_views, form_submits in rows
+    ])
+
+
+async def get_lead_count(db: AsyncSession, project_id: str) -> int:
+    """집계 테이블의 프로젝트 리드 수 (집계 행이 없으면 0)"""
+    result = await db.execute(
+        select(ProjectStats.lead_count).where(ProjectStats.project_id == project_id)
+    )
+    return result.scalar() or 0
+
+
+async def reconcile_project_stats(
+    db: AsyncSession,
+    project_id: Optional[str] = None,
+) -> int:
+    """
+    leads / 이벤트 원본(월별 파티션 + event_logs)으로부터 카운터 재계산
+
+    카운터가 실제 데이터와 어긋난 경우(수동 삭제, 마이그레이션 등) 복구용.
+    이벤트 카운터는 남은 원본 수 + 보관(삭제)된 누적 수로 계산한다.
+
+    Args:
+        db: 데이터베이스 세션
+        project_id: 지정 시 해당 프로젝트만 재계산
+
+    Returns:
+        재계산한 프로젝트 수
+    """
+    projects_query = select(Project.project_id)
+    archived_query = select(
+        ProjectStats.project_id,
+        ProjectStats.archived_event_count,
+        ProjectStats.archived_page_view_count,
+        ProjectStats.archived_form_submit_count,
+        ProjectStats.last_event_at,
+    )
+    lead_query = select(
+        Lead.project_id,
+        func.count(Lead.lead_id),
+        func.max(Lead.created_at),
+    ).group_by(Lead.project_id)
+    # 이벤트 파티션 + 파티션 도입 전 event_logs (보관 기간이 지나 삭제된 파티션은 archived_* 누적으로 반영)
+    events = await event_source(db)
+    event_query = select(
+        events.c.project_id,
+        func.count(),
+        func.sum(case((events.c.event_type == "page_view", 1), else_=0)),
+        func.sum(case((events.c.event_type == "form_submit", 1), else_=0)),
+        func.max(events.c.timestamp),
+    ).group_by(events.c.project_id)
+
+    if project_id is not None:
+        projects_query = projects_query.where(Project.project_id == project_id)
+        lead_query = lead_query.where(Lead.project_id == project_id)
+        event_query = event_query.where(events.c.project_id == project_id)
+        archived_query = archived_query.where(ProjectStats.project_id == project_id)
+
+    project_ids = (await db.execute(projects_query)).scalars().all()
+    lead_rows = {row[0]: row for row in (await db.execute(lead_query)).all()}
+    event_rows = {row[0]: row for row in (await db.execute(event_query)).all()}
+    archived_rows = {row[0]: row for row in (await db.execute(archived_query)).all()}
+
+    now = datetime.utcnow()
+    values = []
+    for pid in project_ids:
+        lead_row = lead_rows.get(pid)
+        event_row = event_rows.get(pid)
+        archived_row = archived_rows.get(pid)
+        values.append({
+            "project_id": pid,
+            "lead_count": lead_row[1] if lead_row else 0,
+            "last_lead_at": lead_row[2] if lead_row else None,
+            "event_count": (event_row[1] if event_row else 0)
+            + (archived_row[1] if archived_row else 0),
+            "page_view_count": ((event_row[2] or 0) if event_row else 0)
+            + (archived_row[2] if archived_row else 0),
+            "form_submit_count": ((event_row[3] or 0) if event_row else 0)
+            + (archived_row[3] if archived_row else 0),
+            # 남은 원본이 모두 보관된 경우 기존 마지막 이벤트 시각 유지
+            "last_event_at": event_row[4] if event_row else (
+                archived_row[4] if archived_row and archived_row[1] else None
+            ),
+            "updated_at": now,
+        })
+
+    if not values:
+        return 0
+
+    stmt = _insert(db)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[ProjectStats.project_id],
+        set_={
+            "lead_count": stmt.excluded.lead_count,
+            "last_lead_at": stmt.excluded.last_lead_at,
+            "event_count": stmt.excluded.event_count,
+            "page_view_count": stmt.excluded.page_view_count,
+            "form_submit_count": stmt.excluded.form_submit_count,
+            "last_event_at": stmt.excluded.last_event_at,
+            "updated_at": stmt.excluded.updated_at,
+        },
+    )
+    await db.execute(stmt, values)
+    await db.commit()
+
+    return len(values)
@@ -0,0 +1,59 @@
+"""
+인증 사용자 캐시 서비스
+user_id(토큰 sub) 별 사용자 정보 read-through 캐시 (비밀번호 해시는 캐시하지 않음)
+"""
+
+import json
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import create_cache
+from app.core.config import settings
+from app.models.user import User
+
+user_cache = create_cache("user", max_entries=settings.USER_CACHE_MAX_ENTRIES)
+
+CACHED_FIELDS = ("user_id", "email", "name")
+CACHED_DATETIME_FIELDS = ("created_at", "updated_at", "last_login_at")
+
+
+def _serialize(user: User) -> str:
+    data = {field: getattr(user, field) for field in CACHED_FIELDS}
+    for field in CACHED_DATETIME_FIELDS:
+        value = getattr(user, field)
+        data[field] = value.isoformat() if value else None
+    return json.dumps(data, ensure_ascii=False)
+
+
+def _deserialize(cached: str) -> User:
+    """캐시 값으로 세션에 속하지 않은 User 구성 (조회 전용)"""
+    data = json.loads(cached)
+    for field in CACHED_DATETIME_FIELDS:
+        if data[field]:
+            data[field] = datetime.fromisoformat(data[field])
+    return User(**data)
+
+
+async def get_user(db: AsyncSession, user_id: str) -> Optional[User]:
+    """
+    사용자 조회 (캐시 → DB)
+
+    캐시에서 온 User 는 세션에 속하지 않으므로 수정/관계 조회에 사용하지 않는다.
+    """
+    cached = await user_cache.get(user_id)
+    if cached is not None:
+        return _deserialize(cached)
+
+    result = await db.execute(select(User).where(User.user_id == user_id))
+    user = result.scalar_one_or_none()
+    if user is not None:
+        await user_cache.set(user_id, _serialize(user), settings.USER_CACHE_TTL_SECONDS)
+    return user
+
+
+async def invalidate_user(user_id: str) -> None:
+    """사용자 정보 변경 시 캐시 무효화"""
+    await user_cache.delete(user_id)
@@ -8,6 +8,54 @@ from typing import Tuple, Union
 import httpx
 
 from app.core.config import settings
+from app.core.http import get_http_client
+
+
+async def _post_webhook(
+    client: httpx.AsyncClient,
+    webhook_url: str,
+    data: dict,
+) -> Tuple[bool, int, str]:
+    """
+    Webhook 1회 전송
+
+    Returns:
+        (success, status_code, message)
+    """
+    try:
+        response = await client.post(
+            webhook_url,
+            json=data,
+            headers={"Content-Type": "application/json"},
+            timeout=settings.WEBHOOK_TIMEOUT_SECONDS,
+            extensions={"metrics_target": "webhook"},
+        )
+
+        if response.is_success:
+            return True, response.status_code, "성공"
+
+        return False, response.status_code, f"HTTP {response.status_code}"
+
+    except httpx.TimeoutException:
+        return False, 0, "요청 시간 초과"
+
+    except httpx.RequestError as e:
+        return False, 0, f"요청 오류: {str(e)}"
+
+    except Exception as e:
+        return False, 0, f"알 수 없는 오류: {str(e)}"
+
+
+async def deliver_webhook(webhook_url: str, data: dict) -> Tuple[bool, int, str]:
+    """
+    Webhook 1회 전송 (재시도 없음)
+
+    재시도는 호출자(아웃박스 워커)가 백오프와 함께 관리한다.
+
+    Returns:
+        (success, status_code, message)
+    """
+    return await _post_webhook(get_http_client(), webhook_url, data)
 
 
 async def send_webhook(
@@ -27,42 +75,21 @@ async def send_webhook(
         success 또는 (success, status_code, message)
     """
     max_retries = settings.WEBHOOK_MAX_RETRIES
-    timeout = settings.WEBHOOK_TIMEOUT_SECONDS
-    retries = 0
     last_error = ""
     last_status = 0
 
-    async with httpx.AsyncClient() as client:
-        while retries < max_retries:
-            try:
-                response = await client.post(
-                    webhook_url,
-                    json=data,
-                    headers={"Content-Type": "application/json"},
-                    timeout=timeout,
-                )
-
-                last_status = response.status_code
+    client = get_http_client()
+    for _ in range(max_retries):
+        success, status_code, message = await _post_webhook(client, webhook_url, data)
 
-                if response.is_success:
-                    if return_details:
-                        return True, response.status_code, "성공"
-                    return True
+        if success:
+            if return_details:
+                return True, status_code, message
+            return True
 
-                last_error = f"HTTP {response.status_code}"
-                retries += 1
-
-            except httpx.TimeoutException:
-                last_error = "요청 시간 초과"
-                retries += 1
-
-            except httpx.RequestError as e:
-                last_error = f"요청 오류: {str(e)}"
-                retries += 1
-
-            except Exception as e:
-                last_error = f"알 수 없는 오류: {str(e)}"
-                retries += 1
+        if status_code:
+            last_status = status_code
+        last_error = message
 
     # 모든 재시도 실패
     if return_details:
@@ -70,26 +97,19 @@ async def send_webhook(
     return False
 
 
-async def send_discord_webhook(
-    webhook_url: str,
-    lead_data: dict,
-    project_name: str = "프로젝트",
-    return_details: bool = False,
-) -> Union[bool, Tuple[bool, int, str]]:
+def build_discord_payload(lead_data: dict, project_name: str = "프로젝트") -> dict:
     """
-    Discord Webhook 전송
+    Discord Webhook 페이로드 생성
 
     Discord Webhook은 Slack과 다른 형식을 사용합니다.
-    embeds를 사용하여 리치 메시지를 전송합니다.
+    embeds를 사용하여 리치 메시지를 구성합니다.
 
     Args:
-        webhook_url: Discord Webhook URL
         lead_data: 리드 데이터
         project_name: 프로젝트 이름
-        return_details: True면 (success, status_code, message) 반환
 
     Returns:
-        success 또는 (success, status_code, message)
+        Discord webhook 페이로드
     """
     # Discord embed 색상 (초록색: 성공)
     embed_color = 0x22C55E
@@ -126,7 +146,7 @@ async def send_discord_webhook(
 
 
     # Discord webhook 페이로드
-    discord_payload = {
+    return {
         "embeds": [
             {
                 "title": "🎉 새로운 리드가 수집되었습니다!",
@@ -141,6 +161,27 @@ async def send_discord_webhook(
         ],
     }
 
+
+async def send_discord_webhook(
+    webhook_url: str,
+    lead_data: dict,
+    project_name: str = "프로젝트",
+    return_details: bool = False,
+) -> Union[bool, Tuple[bool, int, str]]:
+    """
+    Discord Webhook 전송
+
+    Args:
+        webhook_url: Discord Webhook URL
+        lead_data: 리드 데이터
+        project_name: 프로젝트 이름
+        return_details: True면 (success, status_code, message) 반환
+
+    Returns:
+        success 또는 (success, status_code, message)
+    """
+    discord_payload = build_discord_payload(lead_data, project_name)
+
     return await send_webhook(webhook_url, discord_payload, return_details)
 
 
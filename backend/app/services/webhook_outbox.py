@@ -0,0 +1,394 @@
+"""
+Webhook 아웃박스 서비스
+리드 생성 트랜잭션에 Webhook 전송 건을 기록하고, 백그라운드 워커가 전송
+"""
+
+import asyncio
+import random
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Optional
+from urllib.parse import urlparse
+
+from sqlalchemy import and_, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.db_writer import db_writer
+from app.models.lead import Lead
+from app.models.webhook_delivery import WebhookDelivery
+from app.services.ingest_profile import IngestProfile
+from app.services.webhook import build_discord_payload, deliver_webhook
+
+
+def enqueue_lead_webhooks(db: AsyncSession, project: IngestProfile, lead: Lead) -> int:
+    """
+    리드 생성 Webhook 전송 건 기록
+
+    커밋하지 않으므로 리드 INSERT와 같은 트랜잭션에서 호출해야 한다.
+    lead.created_at 이 필요하므로 값을 채운 뒤 호출한다.
+    project 는 수집 프로필 (Webhook 대상/이름만 사용)
+
+    Returns:
+        기록한 전송 건 수
+    """
+    deliveries = []
+
+    if project.webhook_url:
+        deliveries.append(("general", project.webhook_url, {
+            "event": "lead_created",
+            "lead": {
+                "lead_id": lead.lead_id,
+                "email": lead.email,
+                "name": lead.name,
+                "company": lead.company,
+                "role": lead.role,
+                "consent_privacy": lead.consent_privacy,
+                "consent_marketing": lead.consent_marketing,
+                "source_utm": lead.source_utm,
+                "created_at": lead.created_at.isoformat(),
+            },
+            "project_id": project.project_id,
+        }))
+
+    if project.slack_webhook_url:
+        deliveries.append(("slack", project.slack_webhook_url, {
+            "text": f"🎉 새로운 리드가 수집되었습니다!\n\n*이메일*: {lead.email}\n*이름*: {lead.name or '-'}\n*회사*: {lead.company or '-'}\n*직무*: {lead.role or '-'}",
+        }))
+
+    if project.discord_webhook_url:
+        deliveries.append(("discord", project.discord_webhook_url, build_discord_payload(
+            {
+                "email": lead.email,
+                "name": lead.name,
+                "company": lead.company,
+                "role": lead.role,
+                "created_at": lead.created_at.isoformat(),
+            },
+            project_name=project.name,
+        )))
+
+    for kind, url, payload in deliveries:
+        db.add(WebhookDelivery(
+            project_id=project.project_id,
+            lead_id=lead.lead_id,
+            kind=kind,
+            url=url,
+            payload=payload,
+        ))
+
+    return len(deliveries)
+
+
+def backoff_seconds(attempts: int) -> float:
+    """지수 백오프 + full jitter"""
+    delay = min(
+        settings.WEBHOOK_BACKOFF_BASE_SECONDS * (2 ** (attempts - 1)),
+        settings.WEBHOOK_BACKOFF_MAX_SECONDS,
+    )
+    return random.uniform(delay / 2, delay)
+
+
+def _url_host_matches(host: str):
+    """url 의 호스트(netloc)가 host 인 조건"""
+    escaped = host.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return or_(
+        WebhookDelivery.url.like(f"%://{escaped}/%", escape="\\"),
+        WebhookDelivery.url.like(f"%://{escaped}?%", escape="\\"),
+        WebhookDelivery.url.like(f"%://{escaped}", escape="\\"),
+    )
+
+
+class WebhookDispatcher:
+    """
+    아웃박스 전송 워커 풀
+
+    - 폴러가 비어 있는 워커 수만큼만 전송 대상을 임대(processing + locked_until)
+    - 동시 전송 수가 가득 찬 호스트의 건은 임대하지 않고, 한 번에 호스트 한도를 넘겨 임대된 건은
+      바로 임대를 풀어 되돌림 (느린 호스트 때문에 다른 호스트 전송이 막히지 않음)
+    - 워커는 대상 호스트에 여유가 있는 건만 가져가 1회씩 전송
+    - 전송 직전에 임대를 확인/연장하고, 결과는 임대를 가진 경우에만 기록 (중복 전송 방지)
+    - 실패 시 백오프 후 재시도, 최대 시도 초과 시 dead 처리
+    - 프로세스가 종료되어도 임대가 만료되면 다음 기동 시 다시 전송
+    """
+
+    def __init__(self):
+        # 임대했지만 아직 전송을 시작하지 않은 건
+        self._ready: deque[dict] = deque()
+        self._ready_changed: Optional[asyncio.Condition] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._tasks: list[asyncio.Task] = []
+        # 호스트별 전송 중인 건 수
+        self._host_active: dict[str, int] = {}
+        self._in_flight = 0
+        # 마지막 임대가 요청 수를 가득 채움 (대기 건이 더 있을 수 있음)
+        self._backlog = False
+
+    @property
+    def running(self) -> bool:
+        return bool(self._tasks)
+
+    async def start(self) -> None:
+        """폴러와 워커 시작"""
+        if self.running:
+            return
+
+        self._ready_changed = asyncio.Condition()
+        self._wakeup = asyncio.Event()
+        self._tasks.append(asyncio.create_task(self._poll_loop()))
+        for _ in range(settings.WEBHOOK_WORKER_CONCURRENCY):
+            self._tasks.append(asyncio.create_task(self._worker_loop()))
+
+    async def stop(self) -> None:
+        """워커 종료 (전송 전 건은 임대 해제, 전송 중이던 건은 임대 만료 후 재전송)"""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+
+        if self._ready:
+            try:
+                await self._release(list(self._ready))
+            except Exception as e:
+                print(f"Webhook 아웃박스 임대 해제 에러: {str(e)}")
+        self._ready.clear()
+        self._host_active.clear()
+        self._in_flight = 0
+
+    def notify(self) -> None:
+        """새 전송 건이 커밋되었음을 알림 (폴링 대기 없이 즉시 처리)"""
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _poll_loop(self) -> None:
+        while True:
+            # 비어 있는 워커 수만큼만 임대 (대기열에서 임대가 만료되지 않도록)
+            limit = min(
+                settings.WEBHOOK_OUTBOX_BATCH_SIZE,
+                settings.WEBHOOK_WORKER_CONCURRENCY - self._in_flight - len(self._ready),
+            )
+            claimed = []
+            if limit > 0:
+                try:
+                    claimed = await self._claim_batch(limit, self._full_hosts())
+                    excess = await self._accept(claimed)
+                    if excess:
+                        await self._release(excess)
+                except Exception as e:
+                    print(f"Webhook 아웃박스 조회 에러: {str(e)}")
+            self._backlog = limit <= 0 or len(claimed) == limit
+
+            try:
+                await asyncio.wait_for(
+                    self._wakeup.wait(), timeout=settings.WEBHOOK_OUTBOX_POLL_SECONDS
+                )
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+    def _host_load(self) -> dict[str, int]:
+        """호스트별 전송 중 + 대기 중인 건 수"""
+        load = dict(self._host_active)
+        for delivery in self._ready:
+            load[delivery["host"]] = load.get(delivery["host"], 0) + 1
+        return load
+
+    def _full_hosts(self) -> set[str]:
+        return {
+            host for host, count in self._host_load().items()
+            if count >= settings.WEBHOOK_PER_HOST_CONCURRENCY
+        }
+
+    async def _accept(self, claimed: list[dict]) -> list[dict]:
+        """
+        임대한 건을 대기열에 넣음 (호스트 한도를 넘는 건은 제외)
+
+        Returns:
+            호스트 한도를 넘어 임대를 풀어야 하는 건
+        """
+        excess = []
+        async with self._ready_changed:
+            load = self._host_load()
+            for delivery in claimed:
+                host = delivery["host"]
+                if load.get(host, 0) >= settings.WEBHOOK_PER_HOST_CONCURRENCY:
+                    excess.append(delivery)
+                    continue
+                load[host] = load.get(host, 0) + 1
+                self._ready.append(delivery)
+            self._ready_changed.notify_all()
+        return excess
+
+    async def _claim_batch(self, limit: int, exclude_hosts: set[str]) -> list[dict]:
+        """
+        전송 대상 임대 (UPDATE ... RETURNING 한 번)
+
+        다른 프로세스와 경합해도 claimable 조건을 다시 확인하므로 한 곳만 획득한다.
+        PostgreSQL 은 후보 조회에 SKIP LOCKED 를 사용해 다른 프로세스가 임대 중인 행을 건너뛴다.
+
+        Args:
+            limit: 최대 임대 수
+            exclude_hosts: 동시 전송 수가 가득 찬 호스트 (후보에서 제외)
+        """
+        now = datetime.utcnow()
+        claimable = or_(
+            and_(WebhookDelivery.status == "pending", WebhookDelivery.next_attempt_at <= now),
+            and_(WebhookDelivery.status == "processing", WebhookDelivery.locked_until < now),
+        )
+        locked_until = now + timedelta(seconds=settings.WEBHOOK_OUTBOX_LEASE_SECONDS)
+
+        candidates = select(WebhookDelivery.delivery_id).where(claimable)
+        for host in exclude_hosts:
+            candidates = candidates.where(~_url_host_matches(host))
+        candidates = (
+            candidates
+            .order_by(WebhookDelivery.next_attempt_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        statement = (
+            update(WebhookDelivery)
+            .where(WebhookDelivery.delivery_id.in_(candidates))
+            .where(claimable)
+            .values(status="processing", locked_until=locked_until)
+            .returning(
+                WebhookDelivery.delivery_id,
+                WebhookDelivery.url,
+                WebhookDelivery.payload,
+                WebhookDelivery.attempts,
+            )
+        )
+
+        async def claim(session: AsyncSession) -> list[dict]:
+            result = await session.execute(statement)
+            return [
+                {
+                    "delivery_id": delivery_id,
+                    "url": url,
+                    "payload": payload,
+                    "attempts": attempts,
+                    "host": urlparse(url).netloc,
+                    "locked_until": locked_until,
+                }
+                for delivery_id, url, payload, attempts in result.all()
+            ]
+
+        return await db_writer.run(claim)
+
+    def _host_available(self, host: str) -> bool:
+        return self._host_active.get(host, 0) < settings.WEBHOOK_PER_HOST_CONCURRENCY
+
+    def _take_deliverable(self) -> Optional[dict]:
+        """대상 호스트에 여유가 있는 첫 대기 건을 꺼냄 (Condition 잠금 안에서 호출)"""
+        for delivery in self._ready:
+            if self._host_available(delivery["host"]):
+                self._ready.remove(delivery)
+                self._host_active[delivery["host"]] = self._host_active.get(delivery["host"], 0) + 1
+                self._in_flight += 1
+                return delivery
+        return None
+
+    async def _release(self, deliveries: list[dict]) -> None:
+        """전송하지 않은 건의 임대를 풀어 pending 으로 되돌림 (시도 횟수/순서는 그대로)"""
+        leases: dict[datetime, list[str]] = {}
+        for delivery in deliveries:
+            leases.setdefault(delivery["locked_until"], []).append(delivery["delivery_id"])
+
+        async def release(session: AsyncSession) -> None:
+            for locked_until, delivery_ids in leases.items():
+                await session.execute(
+                    update(WebhookDelivery)
+                    .where(WebhookDelivery.delivery_id.in_(delivery_ids))
+                    .where(WebhookDelivery.status == "processing")
+                    .where(WebhookDelivery.locked_until == locked_until)
+                    .values(status="pending", locked_until=None)
+                )
+
+        await db_writer.run(release)
+
+    async def _renew_lease(self, delivery: dict) -> bool:
+        """
+        전송 직전 임대 확인 (남은 시간이 절반 미만이면 연장)
+
+        Returns:
+            False 면 임대가 만료되어 다른 워커/프로세스가 가져간 건 (전송하지 않음)
+        """
+        now = datetime.utcnow()
+        lease = timedelta(seconds=settings.WEBHOOK_OUTBOX_LEASE_SECONDS)
+        if delivery["locked_until"] - now > lease / 2:
+            return True
+
+        locked_until = now + lease
+
+        async def renew(session: AsyncSession) -> int:
+            result = await session.execute(
+                update(WebhookDelivery)
+                .where(WebhookDelivery.delivery_id == delivery["delivery_id"])
+                .where(WebhookDelivery.status == "processing")
+                .where(WebhookDelivery.locked_until == delivery["locked_until"])
+                .values(locked_until=locked_until)
+            )
+            return result.rowcount
+
+        if await db_writer.run(renew) != 1:
+            return False
+        delivery["locked_until"] = locked_until
+        return True
+
+    async def _worker_loop(self) -> None:
+        while True:
+            async with self._ready_changed:
+                delivery = await self._ready_changed.wait_for(self._take_deliverable)
+            try:
+                await self._deliver(delivery)
+            except Exception as e:
+                print(f"Webhook 전송 처리 에러: {str(e)}")
+            finally:
+                async with self._ready_changed:
+                    self._host_active[delivery["host"]] -= 1
+                    self._in_flight -= 1
+                    self._ready_changed.notify_all()
+                if self._backlog:
+                    self._wakeup.set()
+
+    async def _deliver(self, delivery: dict) -> None:
+        if not await self._renew_lease(delivery):
+            print(f"Webhook 전송 건 임대 만료로 건너뜀: {delivery['delivery_id']}")
+            return
+
+        success, status_code, message = await deliver_webhook(
+            delivery["url"], delivery["payload"]
+        )
+
+        attempts = delivery["attempts"] + 1
+        now = datetime.utcnow()
+        values = {
+            "attempts": attempts,
+            "last_status_code": status_code or None,
+            "last_error": None if success else message[:500],
+            "locked_until": None,
+        }
+
+        if success:
+            values.update(status="delivered", delivered_at=now)
+        elif attempts >= settings.WEBHOOK_OUTBOX_MAX_ATTEMPTS:
+            values.update(status="dead")
+        else:
+            values.update(
+                status="pending",
+                next_attempt_at=now + timedelta(seconds=backoff_seconds(attempts)),
+            )
+
+        async def record_result(session: AsyncSession) -> None:
+            # 임대를 가진 경우에만 기록 (만료 후 다른 곳에서 다시 가져간 건은 덮어쓰지 않음)
+            await session.execute(
+                update(WebhookDelivery)
+                .where(WebhookDelivery.delivery_id == delivery["delivery_id"])
+                .where(WebhookDelivery.locked_until == delivery["locked_until"])
+                .values(**values)
+            )
+
+        await db_writer.run(record_result)
+
+
+webhook_dispatcher = WebhookDispatcher()
@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+"""
+이벤트 보관 기간 정리 스크립트
+EVENT_RETENTION_DAYS 가 지난 이벤트 파티션을 EVENT_ARCHIVE_DIR 에 NDJSON.gz 세그먼트로 내보낸 뒤 삭제합니다.
+(서버 실행 중에는 EVENT_RETENTION_INTERVAL_SECONDS 마다 자동 실행)
+
+사용법:
+    uv run python archive_events.py
+"""
+
+import asyncio
+
+from app.core.database import engine, init_db
+from app.services.event_partitions import event_partitions
+
+
+async def archive():
+    """보관 기간이 지난 파티션 정리"""
+    await init_db()
+
+    try:
+        segments = await event_partitions.archive_expired()
+        print(f"✅ {len(segments)}개 세그먼트를 보관했습니다.")
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(archive())
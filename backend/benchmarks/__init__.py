@@ -0,0 +1,4 @@
+"""
+성능 벤치마크 스크립트
+backend 디렉터리에서 `uv run python -m benchmarks.<이름>` 으로 실행합니다.
+"""
@@ -0,0 +1,147 @@
+"""
+벤치마크 공통 유틸
+
+- 임시 디렉터리의 SQLite DB 에 앱을 띄우고 ASGI 로 직접 요청 (서버 프로세스/네트워크 제외)
+- DATABASE_URL 을 지정하면 해당 DB 사용 (PostgreSQL 은 비어 있는 전용 DB 를 지정)
+- Rate limit / 외부 알림은 끄고 실행
+
+app 모듈보다 먼저 import 해야 환경 변수가 설정에 반영된다.
+"""
+
+import os
+import statistics
+import tempfile
+import time
+from contextlib import asynccontextmanager
+from itertools import islice
+from typing import Iterable
+from uuid import uuid4
+
+BENCHMARK_DIR = tempfile.mkdtemp(prefix="formtion-bench-")
+
+os.environ.setdefault("DATABASE_URL", f"sqlite+aiosqlite:///{BENCHMARK_DIR}/benchmark.db")
+os.environ.setdefault("EVENT_ARCHIVE_DIR", f"{BENCHMARK_DIR}/archive")
+os.environ.setdefault("NOTION_CACHE_DIR", f"{BENCHMARK_DIR}/notion")
+os.environ["RATE_LIMIT_ENABLED"] = "false"
+os.environ["DISCORD_SIGNUP_WEBHOOK_URL"] = ""
+
+import httpx  # noqa: E402
+
+
+@asynccontextmanager
+async def running_app():
+    """lifespan 을 실행한 앱과 ASGI 클라이언트 (종료 시 버퍼/writer 정리까지 완료)"""
+    from app.main import app
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+            yield client
+
+
+async def create_project(client: httpx.AsyncClient, **fields) -> tuple[str, dict]:
+    """
+    벤치마크용 사용자/프로젝트 생성
+
+    Returns:
+        (프로젝트 ID, 인증 헤더)
+    """
+    suffix = uuid4().hex[:12]
+    response = await client.post("/api/auth/register", json={
+        "email": f"bench-{suffix}@example.com",
+        "password": "benchmark-password",
+        "name": "benchmark",
+    })
+    response.raise_for_status()
+    headers = {"Authorization": f"Bearer {response.json()['token']}"}
+
+    response = await client.post("/api/projects", headers=headers, json={
+        "name": f"benchmark {suffix}",
+        "notion_url": f"https://www.notion.so/bench-{uuid4().hex}",
+        "public_slug": f"bench-{suffix}",
+        **fields,
+    })
+    response.raise_for_status()
+    return response.json()["project_id"], headers
+
+
+async def bulk_insert(table, rows: Iterable[dict], batch_size: int = 5000) -> int:
+    """
+    시드 데이터 대량 삽입 (API/writer 를 거치지 않고 배치마다 executemany + 커밋)
+
+    Returns:
+        삽입한 행 수
+    """
+    from app.core.database import engine
+
+    rows = iter(rows)
+    inserted = 0
+    while batch := list(islice(rows, batch_size)):
+        async with engine.begin() as conn:
+            await conn.execute(table.insert(), batch)
+        inserted += len(batch)
+    return inserted
+
+
+def lead_rows(project_id: str, count: int, start: int = 0):
+    """시드 리드 행 (UTM 포함, created_at 은 1초 간격)"""
+    from datetime import datetime, timedelta
+
+    from app.models.lead import Lead
+
+    base = datetime(2024, 1, 1)
+    for index in range(start, start + count):
+        email = f"lead-{index}@example.com"
+        yield {
+            "lead_id": str(uuid4()),
+            "project_id": project_id,
+            "email": email,
+            "name": f"리드 {index}",
+            "company": "Example Inc.",
+            "consent_privacy": True,
+            "consent_marketing": index % 2 == 0,
+            "source_utm": {"utm_source": "newsletter", "utm_medium": "email", "utm_campaign": f"c{index % 10}"},
+            "form_location": "bottom",
+            "dedupe_key": Lead.generate_dedupe_key(email, project_id),
+            "created_at": base + timedelta(seconds=index),
+        }
+
+
+class Timer:
+    """요청별 지연 시간 기록"""
+
+    def __init__(self):
+        self.samples: list[float] = []
+        self.started_at = time.perf_counter()
+
+    @asynccontextmanager
+    async def measure(self):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.samples.append(time.perf_counter() - start)
+
+    def report(self, label: str) -> dict:
+        """처리량/지연 백분위 출력"""
+        elapsed = time.perf_counter() - self.started_at
+        samples = sorted(self.samples)
+        if not samples:
+            print(f"{label}: 요청 없음")
+            return {}
+        result = {
+            "requests": len(samples),
+            "elapsed_s": round(elapsed, 3),
+            "rps": round(len(samples) / elapsed, 1),
+            "p50_ms": round(percentile(samples, 50) * 1000, 2),
+            "p99_ms": round(percentile(samples, 99) * 1000, 2),
+            "mean_ms": round(statistics.fmean(samples) * 1000, 2),
+        }
+        print(f"{label}: " + ", ".join(f"{key}={value}" for key, value in result.items()))
+        return result
+
+
+def percentile(sorted_samples: list[float], pct: float) -> float:
+    """정렬된 표본의 백분위 (nearest-rank)"""
+    index = max(0, min(len(sorted_samples) - 1, round(pct / 100 * len(sorted_samples)) - 1))
+    return sorted_samples[index]
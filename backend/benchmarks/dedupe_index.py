@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+리드 중복 검증 키 인덱스 크기/삽입 처리량 비교
+이전 방식(String(300) "{email}_{project_id}" + unique 제약 + 일반 인덱스)과
+현재 방식(16바이트 digest + unique 제약)을 같은 행으로 채워 인덱스 크기와 삽입 처리량을 비교합니다.
+
+사용법:
+    uv run python -m benchmarks.dedupe_index [--rows 200000] [--batch 1000]
+
+DATABASE_URL 이 PostgreSQL 이면 pg_relation_size 로, SQLite 면 dbstat 으로 크기를 잽니다.
+"""
+
+import argparse
+import asyncio
+import time
+from uuid import uuid4
+
+from benchmarks.common import BENCHMARK_DIR  # noqa: F401  (환경 변수 설정)
+
+
+def build_tables():
+    from sqlalchemy import Column, Index, Integer, LargeBinary, MetaData, String, Table
+
+    metadata = MetaData()
+    before = Table(
+        "bench_dedupe_before", metadata,
+        Column("id", Integer, primary_key=True),
+        Column("project_id", String(36), nullable=False),
+        Column("email", String(255), nullable=False),
+        Column("dedupe_key", String(300), nullable=False, unique=True),
+        Index("ix_bench_dedupe_before_key", "dedupe_key"),
+    )
+    after = Table(
+        "bench_dedupe_after", metadata,
+        Column("id", Integer, primary_key=True),
+        Column("project_id", String(36), nullable=False),
+        Column("email", String(255), nullable=False),
+        Column("dedupe_key", LargeBinary(16), nullable=False, unique=True),
+    )
+    return metadata, before, after
+
+
+def rows(count: int, digest: bool):
+    from app.models.lead import Lead
+
+    projects = [str(uuid4()) for _ in range(100)]
+    for index in range(count):
+        project_id = projects[index % len(projects)]
+        # 실제 이메일처럼 정렬 순서가 무작위인 키 (순차 키는 B-tree 끝에만 추가되어 유리함)
+        email = f"{uuid4().hex[:12]}-{index}@example.com"
+        key = Lead.generate_dedupe_key(email, project_id) if digest else f"{email}_{project_id}"
+        yield {"id": index + 1, "project_id": project_id, "email": email, "dedupe_key": key}
+
+
+async def index_sizes(conn, table: str) -> dict:
+    """테이블의 인덱스별 크기 (바이트)"""
+    from sqlalchemy import text
+
+    if conn.dialect.name == "postgresql":
+        result = await conn.execute(text(
+            "SELECT indexrelid::regclass::text, pg_relation_size(indexrelid) "
+            "FROM pg_index WHERE indrelid = CAST(:table AS regclass)"
+        ), {"table": table})
+    else:
+        result = await conn.execute(text(
+            "SELECT name, SUM(pgsize) FROM dbstat "
+            "WHERE name IN (SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = :table) "
+            "GROUP BY name"
+        ), {"table": table})
+    return {name: int(size) for name, size in result.all()}
+
+
+async def measure(engine, table, count: int, batch: int, digest: bool) -> None:
+    data = list(rows(count, digest))
+    start = time.perf_counter()
+    for offset in range(0, count, batch):
+        async with engine.begin() as conn:
+            await conn.execute(table.insert(), data[offset:offset + batch])
+    elapsed = time.perf_counter() - start
+
+    async with engine.connect() as conn:
+        sizes = await index_sizes(conn, table.name)
+    dedupe = {name: size for name, size in sizes.items() if "pkey" not in name}
+    print(
+        f"{'digest(16B)' if digest else 'String(300)'}: "
+        f"insert_rows_per_s={count / elapsed:,.0f}, "
+        f"dedupe_index_mb={sum(dedupe.values()) / 1024 / 1024:.1f} "
+        + ", ".join(f"{name}={size / 1024 / 1024:.1f}MB" for name, size in sorted(dedupe.items()))
+    )
+
+
+async def run(count: int, batch: int) -> None:
+    from app.core.database import engine
+
+    metadata, before, after = build_tables()
+    async with engine.begin() as conn:
+        await conn.run_sync(metadata.drop_all)
+        await conn.run_sync(metadata.create_all)
+
+    try:
+        print(f"행 {count:,}개 (배치 {batch})")
+        await measure(engine, before, count, batch, digest=False)
+        await measure(engine, after, count, batch, digest=True)
+    finally:
+        async with engine.begin() as conn:
+            await conn.run_sync(metadata.drop_all)
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--batch", type=int, default=1000)
+    args = parser.parse_args()
+    asyncio.run(run(args.rows, args.batch))
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+이벤트 수집 부하 벤치마크
+동시 클라이언트가 /api/events 에 이벤트를 보내는 동안 처리량/지연을 측정하고,
+종료 후 수락한 이벤트가 모두 저장되었는지(유실 없음) 확인합니다.
+
+사용법:
+    uv run python -m benchmarks.event_ingest [--clients 50] [--requests 200] [--batch 0]
+
+    --batch N 을 주면 /api/events/batch 로 요청당 N 개씩 보냅니다.
+"""
+
+import argparse
+import asyncio
+
+from benchmarks.common import Timer, create_project, running_app
+
+
+async def run(clients: int, requests: int, batch: int) -> None:
+    from sqlalchemy import func, select
+
+    from app.core.database import read_session_maker
+    from app.services.event_buffer import event_buffer
+    from app.services.event_partitions import event_source
+
+    async with running_app() as client:
+        project_id, _ = await create_project(client)
+        timer = Timer()
+        statuses: dict[int, int] = {}
+
+        async def visitor(index: int) -> None:
+            for seq in range(requests):
+                event = {
+                    "event_type": "page_view",
+                    "project_id": project_id,
+                    "data": {"visitor": index, "seq": seq},
+                }
+                async with timer.measure():
+                    if batch:
+                        response = await client.post(
+                            "/api/events/batch",
+                            json={"events": [event] * batch},
+                        )
+                    else:
+                        response = await client.post("/api/events", json=event)
+                statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+        await asyncio.gather(*(visitor(i) for i in range(clients)))
+        timer.report("이벤트 수집")
+        print(f"응답 코드: {statuses}")
+
+    # lifespan 종료 시 버퍼가 비워짐 → 저장된 이벤트 수 확인
+    stats = event_buffer.snapshot()
+    async with read_session_maker() as session:
+        events = await event_source(session)
+        stored = (await session.execute(
+            select(func.count()).select_from(events).where(events.c.project_id == project_id)
+        )).scalar()
+
+    print(f"버퍼 통계: {stats}")
+    lost = stats["accepted"] - stored
+    print(f"수락 {stats['accepted']}건 / 저장 {stored}건 / 누락 {lost}건")
+    if lost:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--batch", type=int, default=0)
+    args = parser.parse_args()
+    asyncio.run(run(args.clients, args.requests, args.batch))
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+리드 CSV 내보내기 메모리 벤치마크
+리드 N 건을 넣은 뒤 /api/projects/{id}/leads/export 응답을 끝까지 받아 버리면서
+첫 바이트 시간, 전체 시간, 전송 크기, 내보내는 동안의 Python 메모리 최대 증가량(tracemalloc)을 측정합니다.
+(서버 사이드 커서로 청크 단위 전송이므로 메모리 증가량은 리드 수와 무관해야 함)
+
+httpx.ASGITransport 는 응답 본문을 모아서 돌려주므로, 앱을 ASGI 로 직접 호출해 청크를 받는 즉시 버립니다.
+
+사용법:
+    uv run python -m benchmarks.lead_export [--leads 100000] [--gzip]
+"""
+
+import argparse
+import asyncio
+import time
+import tracemalloc
+
+from benchmarks.common import bulk_insert, create_project, lead_rows, running_app
+
+
+async def stream_export(app, path: str, headers: dict) -> dict:
+    """ASGI 앱에 GET 요청 후 본문을 받는 즉시 버림 (상태 코드, 첫 바이트/전체 시간, 크기)"""
+    start = time.perf_counter()
+    result = {"status": 0, "bytes": 0, "first_byte_s": None}
+
+    request_sent = False
+    finished = asyncio.Event()
+
+    async def receive():
+        # 요청 본문 한 번, 이후에는 응답이 끝날 때까지 대기 (연결 유지)
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await finished.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            result["status"] = message["status"]
+        elif message["type"] == "http.response.body" and message.get("body"):
+            if result["first_byte_s"] is None:
+                result["first_byte_s"] = time.perf_counter() - start
+            result["bytes"] += len(message["body"])
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode("ascii"),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(key.lower().encode("latin-1"), value.encode("latin-1")) for key, value in headers.items()],
+        "client": ("127.0.0.1", 0),
+        "server": ("benchmark", 80),
+    }
+    try:
+        await app(scope, receive, send)
+    finally:
+        finished.set()
+    result["total_s"] = time.perf_counter() - start
+    return result
+
+
+async def run(leads: int, use_gzip: bool) -> None:
+    from app.main import app
+    from app.models.lead import Lead
+
+    async with running_app() as client:
+        project_id, headers = await create_project(client)
+        await bulk_insert(Lead.__table__, lead_rows(project_id, leads))
+        if use_gzip:
+            headers = {**headers, "Accept-Encoding": "gzip"}
+
+        tracemalloc.start()
+        baseline = tracemalloc.get_traced_memory()[0]
+        result = await stream_export(app, f"/api/projects/{project_id}/leads/export", headers)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    print(
+        f"리드 {leads:,}건 내보내기: status={result['status']}, "
+        f"size_mb={result['bytes'] / 1024 / 1024:.1f}, "
+        f"first_byte_ms={(result['first_byte_s'] or 0) * 1000:.1f}, "
+        f"total_s={result['total_s']:.2f}, "
+        f"peak_alloc_mb={(peak - baseline) / 1024 / 1024:.2f}"
+    )
+    if result["status"] != 200:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--leads", type=int, default=100000)
+    parser.add_argument("--gzip", action="store_true")
+    args = parser.parse_args()
+    asyncio.run(run(args.leads, args.gzip))
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+리드 제출 동시성 벤치마크
+동시 제출자가 /api/leads 에 리드를 보내는 동안 지연 백분위를 측정하고,
+종료 후 저장된 리드 수가 고유 이메일 수와 같은지(중복 저장/유실 없음) 확인합니다.
+
+사용법:
+    uv run python -m benchmarks.lead_submit [--submitters 500] [--requests 4] [--duplicate-ratio 0.25]
+
+    # SQLite 운영 모드 전/후 비교 (SQLITE_WAL_ENABLED=false / true 를 각각 새 DB 에서 실행)
+    uv run python -m benchmarks.lead_submit --compare
+
+    --duplicate-ratio 만큼은 이미 제출한 이메일을 다시 보내 ON CONFLICT 경로를 함께 측정합니다.
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import subprocess
+import sys
+
+from benchmarks.common import Timer, create_project, running_app
+
+
+async def run(submitters: int, requests: int, duplicate_ratio: float) -> None:
+    from sqlalchemy import func, select
+
+    from app.core.database import read_session_maker
+    from app.models.lead import Lead
+
+    async with running_app() as client:
+        project_id, _ = await create_project(client)
+        timer = Timer()
+        statuses: dict[int, int] = {}
+        emails: set[str] = set()
+
+        async def submitter(index: int) -> None:
+            for seq in range(requests):
+                email = f"submitter-{index}-{seq}@example.com"
+                if seq and random.random() < duplicate_ratio:
+                    email = f"submitter-{index}-{random.randrange(seq)}@example.com"
+                async with timer.measure():
+                    response = await client.post("/api/leads", json={
+                        "project_id": project_id,
+                        "email": email,
+                        "name": f"제출자 {index}",
+                        "consent_privacy": True,
+                        "utm_params": {"utm_source": "benchmark"},
+                    })
+                statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+                if response.status_code == 201:
+                    emails.add(email)
+
+        await asyncio.gather(*(submitter(i) for i in range(submitters)))
+        timer.report(f"리드 제출 (동시 {submitters})")
+        print(f"응답 코드: {statuses}")
+
+        async with read_session_maker() as session:
+            stored = (await session.execute(
+                select(func.count()).select_from(Lead).where(Lead.project_id == project_id)
+            )).scalar()
+
+    print(f"고유 이메일 {len(emails)}건 / 저장 {stored}건")
+    if stored != len(emails) or set(statuses) != {201}:
+        raise SystemExit(1)
+
+
+def compare(argv: list[str]) -> None:
+    """
+    SQLite 운영 모드 전/후 비교
+
+    설정은 import 시점에 읽으므로 모드마다 별도 프로세스(새 임시 DB)에서 실행한다.
+    - 이전: 기본 저널, 요청마다 각자 커밋 (SQLITE_WAL_ENABLED=false)
+    - 이후: WAL + 읽기 전용 풀 + 단일 writer (SQLITE_WAL_ENABLED=true)
+    """
+    env = {key: value for key, value in os.environ.items() if key != "DATABASE_URL"}
+    exit_codes = {}
+    for label, wal in (("이전 (기본 저널, 요청별 커밋)", "false"), ("이후 (WAL + 단일 writer)", "true")):
+        print(f"=== {label}", flush=True)
+        exit_codes[label] = subprocess.call(
+            [sys.executable, "-m", "benchmarks.lead_submit", *argv],
+            env={**env, "SQLITE_WAL_ENABLED": wal},
+        )
+    print("종료 코드: " + ", ".join(f"{label}={code}" for label, code in exit_codes.items()))
+    # 이전 모드의 실패(database is locked 등)는 비교 결과로만 출력
+    if list(exit_codes.values())[-1] != 0:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--submitters", type=int, default=500)
+    parser.add_argument("--requests", type=int, default=4)
+    parser.add_argument("--duplicate-ratio", type=float, default=0.25)
+    parser.add_argument("--compare", action="store_true", help="SQLite 운영 모드 전/후를 각각 실행해 비교")
+    args = parser.parse_args()
+    if args.compare:
+        compare([arg for arg in sys.argv[1:] if arg != "--compare"])
+    else:
+        asyncio.run(run(args.submitters, args.requests, args.duplicate_ratio))
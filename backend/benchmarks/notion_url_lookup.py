@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Notion URL 점유 확인 벤치마크
+프로젝트 수를 늘려 가며 /api/public/projects/check-url 지연을 측정합니다.
+(notion_url_normalized / notion_page_id 인덱스 조회이므로 프로젝트 수와 무관하게 일정해야 함)
+
+사용법:
+    uv run python -m benchmarks.notion_url_lookup [--sizes 1000,10000,100000,1000000] [--requests 500]
+"""
+
+import argparse
+import asyncio
+import random
+from uuid import uuid4
+
+from benchmarks.common import Timer, bulk_insert, create_project, running_app
+
+
+def project_rows(owner_id: str, start: int, stop: int):
+    """시드 프로젝트 (페이지 ID 가 들어간 Notion URL)"""
+    from app.api.projects import notion_url_keys
+
+    for index in range(start, stop):
+        url = f"https://www.notion.so/seed-{index}-{index:032x}?pvs=4"
+        normalized, page_id = notion_url_keys(url)
+        yield {
+            "project_id": str(uuid4()),
+            "owner_id": owner_id,
+            "name": f"seed {index}",
+            "notion_url": url,
+            "notion_url_normalized": normalized,
+            "notion_page_id": page_id,
+            "public_slug": f"seed-{index}",
+        }
+
+
+async def run(sizes: list[int], requests: int) -> None:
+    from sqlalchemy import select
+
+    from app.core.database import read_session_maker
+    from app.models.project import Project
+
+    async with running_app() as client:
+        project_id, _ = await create_project(client)
+        async with read_session_maker() as session:
+            owner_id = (await session.execute(
+                select(Project.owner_id).where(Project.project_id == project_id)
+            )).scalar_one()
+
+        seeded = 0
+        for size in sorted(sizes):
+            seeded += await bulk_insert(Project.__table__, project_rows(owner_id, seeded, size))
+
+            timer = Timer()
+            for _ in range(requests):
+                # 절반은 점유된 URL(쿼리 파라미터만 다름), 절반은 없는 URL
+                index = random.randrange(size)
+                if random.random() < 0.5:
+                    url = f"https://www.notion.so/seed-{index}-{index:032x}?v=1"
+                else:
+                    url = f"https://www.notion.so/missing-{uuid4().hex}"
+                async with timer.measure():
+                    response = await client.get("/api/public/projects/check-url", params={"notion_url": url})
+                response.raise_for_status()
+            timer.report(f"프로젝트 {size:,}개")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="1000,10000,100000")
+    parser.add_argument("--requests", type=int, default=500)
+    args = parser.parse_args()
+    asyncio.run(run([int(size) for size in args.sizes.split(",")], args.requests))
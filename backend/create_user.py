@@ -5,7 +5,7 @@
 """
 
 import asyncio
-from app.core.database import async_session_maker, init_db
+from app.core.database import init_db, writer_session_maker
 from app.core.security import get_password_hash
 from app.models.user import User
 from sqlalchemy import select
@@ -17,7 +17,7 @@ async def create_default_user():
     # 데이터베이스 초기화
     await init_db()
 
-    async with async_session_maker() as session:
+    async with writer_session_maker() as session:
         # 기존 사용자 확인
         result = await session.execute(select(User).where(User.email == "admin@formtion.com"))
         existing_user = result.scalar_one_or_none()
@@ -51,10 +51,281 @@ def column_exists(conn, table: str, column: str) -> bool:
     return column in columns
 
 
+def table_exists(conn, table: str) -> bool:
+    """테이블이 존재하는지 확인"""
+    cursor = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+    )
+    return cursor.fetchone() is not None
+
+
+def event_tables(conn) -> list[str]:
+    """이벤트 원본 테이블 (파티션 도입 전 event_logs + 월별 파티션 event_logs_YYYYMM)"""
+    partitions = [
+        row[0]
+        for row in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' "
+            "AND name GLOB 'event_logs_[0-9][0-9][0-9][0-9][0-9][0-9]' ORDER BY name"
+        ).fetchall()
+    ]
+    return (["event_logs"] if table_exists(conn, "event_logs") else []) + partitions
+
+
+def events_union_sql(conn) -> str:
+    """이벤트 원본 전체 UNION ALL 서브쿼리 (project_id, event_type, timestamp)"""
+    selects = [
+        f"SELECT project_id, event_type, timestamp FROM {table}"
+        for table in event_tables(conn)
+    ] or ["SELECT NULL AS project_id, NULL AS event_type, NULL AS timestamp WHERE 0"]
+    return "(" + " UNION ALL ".join(selects) + ")"
+
+
+def backfill_project_stats(conn):
+    """
+    기존 리드/이벤트로 project_stats 백필
+
+    앱이 먼저 기동되어 이미 반영된 카운터가 있을 수 있으므로 큰 값을 유지한다 (덮어쓰지 않음).
+    """
+    conn.execute(f"""
+        INSERT INTO project_stats (
+            project_id, lead_count, last_lead_at,
+            event_count, page_view_count, form_submit_count, last_event_at,
+            updated_at
+        )
+        SELECT
+            p.project_id,
+            COALESCE(l.cnt, 0), l.last_at,
+            COALESCE(e.cnt, 0), COALESCE(e.page_views, 0), COALESCE(e.form_submits, 0), e.last_at,
+            CURRENT_TIMESTAMP
+        FROM projects p
+        LEFT JOIN (
+            SELECT project_id, COUNT(*) AS cnt, MAX(created_at) AS last_at
+            FROM leads GROUP BY project_id
+        ) l ON l.project_id = p.project_id
+        LEFT JOIN (
+            SELECT project_id, COUNT(*) AS cnt,
+                   SUM(CASE WHEN event_type = 'page_view' THEN 1 ELSE 0 END) AS page_views,
+                   SUM(CASE WHEN event_type = 'form_submit' THEN 1 ELSE 0 END) AS form_submits,
+                   MAX(timestamp) AS last_at
+            FROM {events_union_sql(conn)} GROUP BY project_id
+        ) e ON e.project_id = p.project_id
+        WHERE true
+        ON CONFLICT (project_id) DO UPDATE SET
+            lead_count = MAX(lead_count, excluded.lead_count),
+            last_lead_at = COALESCE(MAX(last_lead_at, excluded.last_lead_at), last_lead_at, excluded.last_lead_at),
+            event_count = MAX(event_count, excluded.event_count),
+            page_view_count = MAX(page_view_count, excluded.page_view_count),
+            form_submit_count = MAX(form_submit_count, excluded.form_submit_count),
+            last_event_at = COALESCE(MAX(last_event_at, excluded.last_event_at), last_event_at, excluded.last_event_at),
+            updated_at = excluded.updated_at
+    """)
+    conn.commit()
+
+
+def backfill_analytics_rollups(conn):
+    """
+    기존 이벤트/리드로 분석 집계 백필
+
+    앱이 먼저 기동되어 증분 반영된 버킷이 있을 수 있으므로 큰 값을 유지한다 (덮어쓰지 않음).
+    버킷 값은 SQLAlchemy DateTime 저장 형식(YYYY-MM-DD HH:MM:SS.ffffff)과 맞춘다.
+    """
+    events = events_union_sql(conn)
+    for granularity, bucket in (
+        ("hour", "strftime('%Y-%m-%d %H:00:00.000000', timestamp)"),
+        ("day", "strftime('%Y-%m-%d 00:00:00.000000', timestamp)"),
+    ):
+        conn.execute(f"""
+            INSERT INTO event_rollups (project_id, granularity, bucket_start, event_type, count)
+            SELECT project_id, '{granularity}', {bucket}, event_type, COUNT(*)
+            FROM {events}
+            GROUP BY project_id, {bucket}, event_type
+            ON CONFLICT (project_id, granularity, bucket_start, event_type)
+            DO UPDATE SET count = MAX(count, excluded.count)
+        """)
+    conn.execute("""
+        INSERT INTO lead_utm_rollups (
+            project_id, bucket_start, utm_source, utm_medium, utm_campaign, lead_count
+        )
+        SELECT project_id, day, utm_source, utm_medium, utm_campaign, COUNT(*)
+        FROM (
+            SELECT
+                project_id,
+                strftime('%Y-%m-%d 00:00:00.000000', created_at) AS day,
+                substr(COALESCE(json_extract(source_utm, '$.utm_source'), ''), 1, 100) AS utm_source,
+                substr(COALESCE(json_extract(source_utm, '$.utm_medium'), ''), 1, 100) AS utm_medium,
+                substr(COALESCE(json_extract(source_utm, '$.utm_campaign'), ''), 1, 100) AS utm_campaign
+            FROM leads
+        )
+        GROUP BY project_id, day, utm_source, utm_medium, utm_campaign
+        ON CONFLICT (project_id, bucket_start, utm_source, utm_medium, utm_campaign)
+        DO UPDATE SET lead_count = MAX(lead_count, excluded.lead_count)
+    """)
+    conn.commit()
+
+
+def backfill_notion_url_keys(conn):
+    """기존 프로젝트의 notion_url 조회 키 채우기 (배치 단위)"""
+    from app.api.projects import notion_url_keys
+
+    batch_size = 1000
+    last_id = ""
+    while True:
+        rows = conn.execute(
+            "SELECT project_id, notion_url FROM projects "
+            "WHERE project_id > ? ORDER BY project_id LIMIT ?",
+            (last_id, batch_size),
+        ).fetchall()
+        if not rows:
+            break
+        conn.executemany(
+            "UPDATE projects SET notion_url_normalized = ?, notion_page_id = ? "
+            "WHERE project_id = ?",
+            [(*notion_url_keys(url), project_id) for project_id, url in rows],
+        )
+        conn.commit()
+        last_id = rows[-1][0]
+
+
+def backfill_lead_dedupe_digests(conn):
+    """
+    리드 중복 검증 키를 문자열에서 16바이트 digest 로 변환 (배치 단위)
+
+    SQLite 는 컬럼 타입과 무관하게 BLOB 을 저장할 수 있으므로 테이블 재생성 없이
+    값만 바꾼다. 기존 키와 digest 가 1:1 이라 유니크 인덱스 충돌은 없다.
+    """
+    from app.models.lead import dedupe_digest
+
+    batch_size = 5000
+    last_rowid = 0
+    converted = 0
+    while True:
+        rows = conn.execute(
+            "SELECT rowid, dedupe_key FROM leads "
+            "WHERE rowid > ? ORDER BY rowid LIMIT ?",
+            (last_rowid, batch_size),
+        ).fetchall()
+        if not rows:
+            break
+        updates = [
+            (dedupe_digest(key), rowid)
+            for rowid, key in rows
+            if isinstance(key, str)
+        ]
+        conn.executemany("UPDATE leads SET dedupe_key = ? WHERE rowid = ?", updates)
+        conn.commit()
+        converted += len(updates)
+        last_rowid = rows[-1][0]
+
+    # dedupe_key 단일 컬럼 인덱스: 유니크 1개만 남기고 (이전 스키마의 중복 일반 인덱스 제거) 다시 생성
+    indexes = [
+        (name, unique)
+        for _, name, unique, *_ in conn.execute("PRAGMA index_list(leads)").fetchall()
+        if [row[2] for row in conn.execute(f"PRAGMA index_info({name})").fetchall()] == ["dedupe_key"]
+    ]
+    if any(unique for _, unique in indexes):
+        for name, unique in indexes:
+            if not unique:
+                conn.execute(f"DROP INDEX {name}")
+                print(f"[INFO] 중복 인덱스 제거: {name}")
+    for name, unique in indexes:
+        if unique:
+            conn.execute(f"REINDEX {name}")
+    conn.commit()
+    print(f"[INFO] 리드 {converted}건 변환")
+
+
+def lead_dedupe_digests_done(conn) -> bool:
+    """문자열 중복 검증 키가 남아있지 않은지 확인"""
+    return conn.execute(
+        "SELECT 1 FROM leads WHERE typeof(dedupe_key) = 'text' LIMIT 1"
+    ).fetchone() is None
+
+
 # ============================================
 # 마이그레이션 정의
 # ============================================
 
+# app/services/lead_search.py 의 SQLITE_DDL / SQLITE_BACKFILL 과 동일
+LEADS_FTS_SQL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS leads_fts USING fts5(
+        lead_id UNINDEXED,
+        project_id,
+        email,
+        name,
+        company,
+        tokenize = 'trigram'
+    )
+    """,
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS leads_fts_words USING fts5(
+        lead_id UNINDEXED,
+        project_id,
+        email,
+        name,
+        company,
+        tokenize = 'unicode61',
+        prefix = '1 2'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS leads_fts_ai AFTER INSERT ON leads BEGIN
+        INSERT INTO leads_fts (rowid, lead_id, project_id, email, name, company)
+        VALUES (new.rowid, new.lead_id, new.project_id, new.email, COALESCE(new.name, ''), COALESCE(new.company, ''));
+        INSERT INTO leads_fts_words (rowid, lead_id, project_id, email, name, company)
+        VALUES (new.rowid, new.lead_id, new.project_id, new.email, COALESCE(new.name, ''), COALESCE(new.company, ''));
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS leads_fts_ad AFTER DELETE ON leads BEGIN
+        DELETE FROM leads_fts WHERE rowid = old.rowid;
+        DELETE FROM leads_fts_words WHERE rowid = old.rowid;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS leads_fts_au AFTER UPDATE OF email, name, company ON leads BEGIN
+        UPDATE leads_fts
+        SET email = new.email, name = COALESCE(new.name, ''), company = COALESCE(new.company, '')
+        WHERE rowid = old.rowid;
+        UPDATE leads_fts_words
+        SET email = new.email, name = COALESCE(new.name, ''), company = COALESCE(new.company, '')
+        WHERE rowid = old.rowid;
+    END
+    """,
+    """
+    INSERT INTO leads_fts (rowid, lead_id, project_id, email, name, company)
+    SELECT rowid, lead_id, project_id, email, COALESCE(name, ''), COALESCE(company, '')
+    FROM leads
+    """,
+    """
+    INSERT INTO leads_fts_words (rowid, lead_id, project_id, email, name, company)
+    SELECT rowid, lead_id, project_id, email, COALESCE(name, ''), COALESCE(company, '')
+    FROM leads
+    """,
+]
+
+# 이전 검색 테이블(project_id UNINDEXED, 단어 색인 없음) 삭제 후 LEADS_FTS_SQL 로 다시 생성
+LEADS_FTS_REBUILD_SQL = [
+    "DROP TRIGGER IF EXISTS leads_fts_ai",
+    "DROP TRIGGER IF EXISTS leads_fts_ad",
+    "DROP TRIGGER IF EXISTS leads_fts_au",
+    "DROP TABLE IF EXISTS leads_fts",
+    "DROP TABLE IF EXISTS leads_fts_words",
+] + LEADS_FTS_SQL
+
+
+def leads_fts_rebuilt(conn) -> bool:
+    """검색 테이블이 프로젝트 색인 + 단어 색인 스키마인지 확인"""
+    row = conn.execute(
+        "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'leads_fts'"
+    ).fetchone()
+    return (
+        row is not None
+        and "project_id UNINDEXED" not in row[0]
+        and table_exists(conn, "leads_fts_words")
+    )
+
+
 MIGRATIONS = [
     {
         "name": "001_add_bookmarks_name_column",
@@ -80,6 +351,103 @@ MIGRATIONS = [
         "sql": "ALTER TABLE projects ADD COLUMN og_image VARCHAR(1000)",
         "check": lambda conn: column_exists(conn, "projects", "og_image"),
     },
+    {
+        "name": "005_create_project_stats",
+        "description": "프로젝트 집계 테이블 생성 및 기존 리드/이벤트로 백필",
+        # 앱이 먼저 기동되어 테이블이 생겼을 수 있으므로 check 없이 항상 백필 (월별 파티션 포함)
+        "sql": [
+            """
+            CREATE TABLE IF NOT EXISTS project_stats (
+                project_id VARCHAR(36) NOT NULL PRIMARY KEY,
+                lead_count INTEGER NOT NULL DEFAULT 0,
+                last_lead_at DATETIME,
+                event_count INTEGER NOT NULL DEFAULT 0,
+                page_view_count INTEGER NOT NULL DEFAULT 0,
+                form_submit_count INTEGER NOT NULL DEFAULT 0,
+                last_event_at DATETIME,
+                updated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
+            )
+            """,
+        ],
+        "run": backfill_project_stats,
+    },
+    {
+        "name": "006_add_notion_url_keys",
+        "description": "프로젝트에 정규화 URL/페이지 ID 컬럼 및 인덱스 추가, 기존 데이터 백필",
+        "sql": [
+            "ALTER TABLE projects ADD COLUMN notion_url_normalized VARCHAR(500)",
+            "ALTER TABLE projects ADD COLUMN notion_page_id VARCHAR(32)",
+            "CREATE INDEX IF NOT EXISTS ix_projects_notion_url_normalized ON projects (notion_url_normalized)",
+            "CREATE INDEX IF NOT EXISTS ix_projects_notion_page_id ON projects (notion_page_id)",
+        ],
+        "run": backfill_notion_url_keys,
+        "check": lambda conn: column_exists(conn, "projects", "notion_url_normalized"),
+    },
+    {
+        "name": "007_create_analytics_rollups",
+        "description": "분석 집계 테이블 생성 및 기존 이벤트/리드로 백필",
+        "sql": [
+            """
+            CREATE TABLE IF NOT EXISTS event_rollups (
+                project_id VARCHAR(36) NOT NULL,
+                granularity VARCHAR(10) NOT NULL,
+                bucket_start DATETIME NOT NULL,
+                event_type VARCHAR(50) NOT NULL,
+                count INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (project_id, granularity, bucket_start, event_type)
+            )
+            """,
+            """
+            CREATE TABLE IF NOT EXISTS lead_utm_rollups (
+                project_id VARCHAR(36) NOT NULL,
+                bucket_start DATETIME NOT NULL,
+                utm_source VARCHAR(100) NOT NULL DEFAULT '',
+                utm_medium VARCHAR(100) NOT NULL DEFAULT '',
+                utm_campaign VARCHAR(100) NOT NULL DEFAULT '',
+                lead_count INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (project_id, bucket_start, utm_source, utm_medium, utm_campaign)
+            )
+            """,
+        ],
+        "run": backfill_analytics_rollups,
+    },
+    {
+        "name": "008_add_leads_project_created_index",
+        "description": "리드 목록 키셋 페이지네이션용 복합 인덱스 추가",
+        "sql": "CREATE INDEX IF NOT EXISTS ix_leads_project_created ON leads (project_id, created_at DESC, lead_id)",
+        "check": lambda conn: conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'ix_leads_project_created'"
+        ).fetchone() is not None,
+    },
+    {
+        "name": "009_create_leads_fts",
+        "description": "리드 검색용 FTS5 trigram 테이블 및 동기화 트리거 생성, 기존 리드 색인",
+        "sql": LEADS_FTS_SQL,
+        "check": lambda conn: table_exists(conn, "leads_fts"),
+    },
+    {
+        "name": "010_hash_lead_dedupe_keys",
+        "description": "리드 중복 검증 키를 고정 길이 digest(16바이트)로 변환, 중복 일반 인덱스 제거",
+        "sql": [],
+        "run": backfill_lead_dedupe_digests,
+        "check": lead_dedupe_digests_done,
+    },
+    {
+        "name": "011_add_project_stats_archived_counts",
+        "description": "프로젝트 집계에 보관(삭제)된 이벤트 누적 컬럼 추가",
+        "sql": [
+            "ALTER TABLE project_stats ADD COLUMN archived_event_count INTEGER NOT NULL DEFAULT 0",
+            "ALTER TABLE project_stats ADD COLUMN archived_page_view_count INTEGER NOT NULL DEFAULT 0",
+            "ALTER TABLE project_stats ADD COLUMN archived_form_submit_count INTEGER NOT NULL DEFAULT 0",
+        ],
+        "check": lambda conn: column_exists(conn, "project_stats", "archived_event_count"),
+    },
+    {
+        "name": "012_rebuild_leads_fts",
+        "description": "리드 검색 테이블 재생성 (project_id 색인으로 프로젝트 범위 검색, 짧은 검색어용 단어 색인 추가)",
+        "sql": LEADS_FTS_REBUILD_SQL,
+        "check": leads_fts_rebuilt,
+    },
 ]
 
 
@@ -120,8 +488,14 @@ def run_migrations():
         # 마이그레이션 실행
         try:
             print(f"[RUN] {name} - {description}")
-            conn.execute(migration["sql"])
+            statements = migration["sql"]
+            if isinstance(statements, str):
+                statements = [statements]
+            for statement in statements:
+                conn.execute(statement)
             conn.commit()
+            if migration.get("run"):
+                migration["run"](conn)
             mark_migration_applied(conn, name)
             print(f"[OK] {name} - 완료")
             applied_count += 1
@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+프로젝트 집계 재계산 스크립트
+leads / 이벤트 원본(월별 파티션 + event_logs)과 보관된 이벤트 누적 수로 project_stats 카운터를 다시 계산합니다.
+
+사용법:
+    uv run python reconcile_stats.py              # 전체 프로젝트
+    uv run python reconcile_stats.py <project_id> # 특정 프로젝트
+"""
+
+import asyncio
+import sys
+
+from app.core.database import engine, init_db, writer_session_maker
+from app.services.project_stats import reconcile_project_stats
+
+
+async def reconcile(project_id: str = None):
+    """집계 카운터 재계산"""
+    await init_db()
+
+    try:
+        async with writer_session_maker() as session:
+            count = await reconcile_project_stats(session, project_id)
+        print(f"✅ {count}개 프로젝트의 집계를 재계산했습니다.")
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(reconcile(sys.argv[1] if len(sys.argv) > 1 else None))
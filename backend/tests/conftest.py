@@ -0,0 +1,42 @@
+"""
+테스트 공통 설정
+
+- app 모듈보다 먼저 환경 변수를 설정 (임시 SQLite DB, rate limit/외부 알림 끔)
+- 비동기 테스트는 anyio 플러그인(asyncio 백엔드)으로 실행
+"""
+
+import os
+import sys
+import tempfile
+
+import pytest
+
+TEST_DIR = tempfile.mkdtemp(prefix="formtion-test-")
+
+os.environ.setdefault("DATABASE_URL", f"sqlite+aiosqlite:///{TEST_DIR}/test.db")
+os.environ.setdefault("EVENT_ARCHIVE_DIR", f"{TEST_DIR}/archive")
+os.environ.setdefault("NOTION_CACHE_DIR", f"{TEST_DIR}/notion")
+os.environ["RATE_LIMIT_ENABLED"] = "false"
+os.environ["DISCORD_SIGNUP_WEBHOOK_URL"] = ""
+os.environ["CACHE_REDIS_URL"] = ""
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+def reload_app(database_url: str):
+    """
+    DATABASE_URL 을 바꿔 app 패키지를 새로 import (엔진/writer/캐시는 import 시점에 생성됨)
+
+    Returns:
+        FastAPI 앱
+    """
+    os.environ["DATABASE_URL"] = database_url
+    for name in [name for name in sys.modules if name == "app" or name.startswith("app.")]:
+        del sys.modules[name]
+
+    from app.main import app
+
+    return app
@@ -0,0 +1,194 @@
+"""
+테스트용 Redis fake
+
+redis.asyncio.Redis 중 앱이 사용하는 명령만 메모리에서 구현한다.
+(get/set/delete/incr/incrby/expire/ttl, pipeline(transaction=True), publish/pubsub)
+"""
+
+import asyncio
+import time
+from typing import Any, Optional
+
+
+class FakeRedis:
+    """메모리 Redis (여러 워커가 같은 인스턴스를 공유하면 공유 Redis 와 같음)"""
+
+    def __init__(self):
+        self._data: dict[str, tuple[bytes, Optional[float]]] = {}
+        self._subscribers: dict[str, list[asyncio.Queue]] = {}
+        self.offset = 0.0
+        self.commands: list[str] = []
+        self.transactions = 0
+        # 다음 EXEC 를 실패시킴 (EXEC 전에 연결이 끊긴 경우)
+        self.fail_next_exec = False
+
+    # ---- 시간 ----
+
+    def now(self) -> float:
+        return time.monotonic() + self.offset
+
+    def advance(self, seconds: float) -> None:
+        self.offset += seconds
+
+    def _live(self, key: str) -> Optional[tuple[bytes, Optional[float]]]:
+        item = self._data.get(key)
+        if item is not None and item[1] is not None and item[1] <= self.now():
+            del self._data[key]
+            return None
+        return item
+
+    # ---- 명령 ----
+
+    def _get(self, key: str) -> Optional[bytes]:
+        item = self._live(key)
+        return item[0] if item else None
+
+    def _set(self, key: str, value: Any, ex: Optional[int] = None, nx: bool = False) -> Optional[bool]:
+        if nx and self._live(key) is not None:
+            return None
+        if not isinstance(value, bytes):
+            value = str(value).encode("utf-8")
+        self._data[key] = (value, self.now() + ex if ex else None)
+        return True
+
+    def _delete(self, *keys: str) -> int:
+        return sum(1 for key in keys if self._data.pop(key, None) is not None)
+
+    def _incrby(self, key: str, amount: int) -> int:
+        item = self._live(key)
+        value = int(item[0]) + amount if item else amount
+        self._data[key] = (str(value).encode("utf-8"), item[1] if item else None)
+        return value
+
+    def _expire(self, key: str, seconds: int) -> bool:
+        item = self._live(key)
+        if item is None:
+            return False
+        self._data[key] = (item[0], self.now() + seconds)
+        return True
+
+    def _ttl(self, key: str) -> int:
+        item = self._live(key)
+        if item is None:
+            return -2
+        if item[1] is None:
+            return -1
+        return max(int(item[1] - self.now()), 0)
+
+    def _run(self, name: str, *args, **kwargs):
+        self.commands.append(name)
+        return getattr(self, f"_{name}")(*args, **kwargs)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return self._run("get", key)
+
+    async def set(self, key: str, value: Any, ex: Optional[int] = None, nx: bool = False):
+        return self._run("set", key, value, ex=ex, nx=nx)
+
+    async def delete(self, *keys: str) -> int:
+        return self._run("delete", *keys)
+
+    async def incrby(self, key: str, amount: int) -> int:
+        return self._run("incrby", key, amount)
+
+    async def incr(self, key: str) -> int:
+        return self._run("incrby", key, 1)
+
+    async def expire(self, key: str, seconds: int) -> bool:
+        return self._run("expire", key, seconds)
+
+    async def ttl(self, key: str) -> int:
+        return self._run("ttl", key)
+
+    def pipeline(self, transaction: bool = True) -> "FakePipeline":
+        return FakePipeline(self, transaction)
+
+    # ---- pub/sub ----
+
+    async def publish(self, channel: str, message: Any) -> int:
+        if not isinstance(message, bytes):
+            message = str(message).encode("utf-8")
+        queues = self._subscribers.get(channel, [])
+        for queue in queues:
+            queue.put_nowait({"type": "message", "channel": channel.encode("utf-8"), "data": message})
+        return len(queues)
+
+    def pubsub(self) -> "FakePubSub":
+        return FakePubSub(self)
+
+    async def aclose(self) -> None:
+        pass
+
+    # ---- 테스트 확인용 ----
+
+    def keys_without_ttl(self, prefix: str = "") -> list[str]:
+        return [key for key, (_, expires_at) in self._data.items() if key.startswith(prefix) and expires_at is None]
+
+
+class FakePipeline:
+    """명령을 모아 두었다가 execute 에서 한 번에 실행 (transaction=True 면 원자적)"""
+
+    def __init__(self, redis: FakeRedis, transaction: bool):
+        self.redis = redis
+        self.transaction = transaction
+        self._queued: list[tuple[str, tuple, dict]] = []
+
+    async def __aenter__(self) -> "FakePipeline":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        self._queued.clear()
+
+    def __getattr__(self, name: str):
+        if name not in ("get", "set", "delete", "incrby", "expire", "ttl"):
+            raise AttributeError(name)
+
+        def queue(*args, **kwargs) -> "FakePipeline":
+            self._queued.append((name, args, kwargs))
+            return self
+
+        return queue
+
+    async def execute(self) -> list:
+        queued, self._queued = self._queued, []
+        if self.transaction:
+            self.redis.transactions += 1
+            if self.redis.fail_next_exec:
+                self.redis.fail_next_exec = False
+                raise ConnectionError("fake: EXEC 전에 연결 끊김")
+        return [self.redis._run(name, *args, **kwargs) for name, args, kwargs in queued]
+
+
+class FakePubSub:
+    """채널 구독 (get_message / listen)"""
+
+    def __init__(self, redis: FakeRedis):
+        self.redis = redis
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.channels: list[str] = []
+
+    async def subscribe(self, *channels: str) -> None:
+        for channel in channels:
+            self.redis._subscribers.setdefault(channel, []).append(self.queue)
+            self.channels.append(channel)
+
+    async def unsubscribe(self, *channels: str) -> None:
+        for channel in channels or list(self.channels):
+            subscribers = self.redis._subscribers.get(channel, [])
+            if self.queue in subscribers:
+                subscribers.remove(self.queue)
+            if channel in self.channels:
+                self.channels.remove(channel)
+
+    async def get_message(self, ignore_subscribe_messages: bool = True, timeout: Optional[float] = 0.0):
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout) if timeout else self.queue.get_nowait()
+        except (asyncio.TimeoutError, asyncio.QueueEmpty):
+            return None
+
+    async def listen(self):
+        while True:
+            yield await self.queue.get()
+
+    async def aclose(self) -> None:
+        await self.unsubscribe()
@@ -0,0 +1,166 @@
+"""
+워커 간 캐시 무효화 테스트 (pub/sub 로 프로세스 내 캐시 삭제, Redis 무효화 세대)
+"""
+
+import asyncio
+
+import pytest
+
+from app.core.cache import InvalidationBus, MemoryCache, RedisCache, TieredCache
+from app.services import project_cache
+from tests.fakes import FakeRedis
+
+pytestmark = pytest.mark.anyio
+
+
+class Worker:
+    """같은 Redis 를 공유하는 워커 하나 (프로세스 내 캐시 + 무효화 버스)"""
+
+    def __init__(self, redis: FakeRedis, namespace: str = "public_project"):
+        self.bus = InvalidationBus(redis)
+        self.cache = TieredCache(
+            MemoryCache(),
+            RedisCache(redis, namespace),
+            local_ttl=60,
+            namespace=namespace,
+            bus=self.bus,
+        )
+
+    async def start(self) -> None:
+        await self.bus.start()
+        await asyncio.wait_for(self.bus.wait_subscribed(), 1)
+
+    async def stop(self) -> None:
+        await self.bus.stop()
+
+
+async def wait_until(predicate, timeout: float = 1.0) -> None:
+    async def poll():
+        while not predicate():
+            await asyncio.sleep(0.01)
+
+    await asyncio.wait_for(poll(), timeout)
+
+
+@pytest.fixture
+async def workers():
+    redis = FakeRedis()
+    a, b = Worker(redis), Worker(redis)
+    await a.start()
+    await b.start()
+    yield redis, a, b
+    await a.stop()
+    await b.stop()
+
+
+async def test_delete_clears_other_workers_local_tier(workers):
+    redis, a, b = workers
+    await a.cache.set("slug", "v1", 300)
+    assert await b.cache.get("slug") == "v1"  # b 의 프로세스 내 캐시에 적재
+
+    await a.cache.delete("slug")
+
+    await wait_until(lambda: len(b.cache.local) == 0)
+    assert await b.cache.get("slug") is None
+    assert b.bus.stats["received"] == 1
+
+
+async def test_other_namespaces_are_untouched(workers):
+    redis, a, b = workers
+    other = Worker(redis, namespace="user")
+    await other.start()
+    try:
+        await other.cache.set("slug", "user", 300)
+        await a.cache.delete("slug")
+        await wait_until(lambda: b.bus.stats["received"] == 1)
+        assert await other.cache.local.get("slug") == "user"
+    finally:
+        await other.stop()
+
+
+async def test_reconnect_clears_local_tier():
+    redis = FakeRedis()
+    worker = Worker(redis)
+    worker.bus.RECONNECT_DELAY_SECONDS = 0
+    await worker.start()
+    try:
+        await worker.cache.set("slug", "v1", 300)
+
+        # 구독 연결이 끊기면 그동안 놓친 무효화가 있을 수 있음
+        pubsub_queue = redis._subscribers[InvalidationBus.channel("public_project")][0]
+        pubsub_queue.put_nowait({"type": "message", "channel": b"x", "data": None})
+        original_apply = worker.bus._apply
+
+        async def broken_apply(message):
+            worker.bus._apply = original_apply
+            raise ConnectionError("fake: 연결 끊김")
+
+        worker.bus._apply = broken_apply
+
+        await wait_until(lambda: worker.bus.stats["reconnects"] == 1)
+        assert len(worker.cache.local) == 0
+        assert await worker.cache.get("slug") == "v1"  # 공유 캐시는 그대로
+    finally:
+        await worker.stop()
+
+
+@pytest.fixture
+def shared_project_cache(monkeypatch):
+    """project_cache 를 FakeRedis 공유 캐시로 교체 (워커 a/b 의 캐시)"""
+    redis = FakeRedis()
+    monkeypatch.setattr(project_cache, "get_redis_client", lambda: redis)
+    monkeypatch.setattr(project_cache, "_invalidations", 0)
+    return redis
+
+
+async def test_generation_is_shared_between_workers(shared_project_cache, monkeypatch):
+    redis = shared_project_cache
+    a, b = Worker(redis), Worker(redis)
+
+    # 워커 a 가 DB 조회 시작
+    monkeypatch.setattr(project_cache, "public_project_cache", a.cache)
+    generation = await project_cache.current_generation()
+
+    # 그 사이 워커 b 가 프로젝트 수정 → 무효화
+    monkeypatch.setattr(project_cache, "public_project_cache", b.cache)
+    await project_cache.invalidate_public_project("slug")
+    assert project_cache._invalidations == 0  # 프로세스 내 카운터가 아니라 Redis 에 기록
+
+    # 워커 a 의 조회 결과(수정 전 본문)는 저장되지 않아야 함
+    monkeypatch.setattr(project_cache, "public_project_cache", a.cache)
+    await project_cache.store_public_project("slug", {"name": "old"}, '"e1"', generation)
+    assert await project_cache.get_public_project("slug") is None
+    assert await redis.get("formtion:public_project:slug") is None
+
+
+async def test_invalidation_between_check_and_store_is_undone(shared_project_cache, monkeypatch):
+    redis = shared_project_cache
+    a = Worker(redis)
+    monkeypatch.setattr(project_cache, "public_project_cache", a.cache)
+    generation = await project_cache.current_generation()
+
+    # 세대 확인 직후, 저장 직전에 다른 워커가 무효화
+    original_set = a.cache.set
+
+    async def set_after_invalidation(key, value, ttl):
+        await redis.incr(project_cache.GENERATION_KEY)
+        await redis.delete("formtion:public_project:" + key)
+        await original_set(key, value, ttl)
+
+    monkeypatch.setattr(a.cache, "set", set_after_invalidation)
+
+    await project_cache.store_public_project_not_found("slug", generation)
+
+    assert await project_cache.get_public_project("slug") is None
+
+
+async def test_store_with_current_generation(shared_project_cache, monkeypatch):
+    a = Worker(shared_project_cache)
+    monkeypatch.setattr(project_cache, "public_project_cache", a.cache)
+
+    await project_cache.invalidate_public_project("slug")
+    generation = await project_cache.current_generation()
+    assert generation == 1
+
+    await project_cache.store_public_project("slug", {"name": "new"}, '"e2"', generation)
+    assert await project_cache.get_public_project("slug") == ({"name": "new"}, '"e2"')
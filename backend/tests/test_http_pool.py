@@ -0,0 +1,70 @@
+"""
+공유 HTTP transport 테스트 (로컬 keep-alive 서버)
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from app.core import metrics
+from app.core.http import PooledTransport
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def server_url():
+    """HTTP/1.1 keep-alive 로 'ok' 를 응답하는 로컬 서버"""
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while await reader.readuntil(b"\r\n\r\n"):
+                writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok")
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    host, port = server.sockets[0].getsockname()[:2]
+    yield f"http://{host}:{port}/"
+    server.close()
+    await server.wait_closed()
+
+
+async def test_stats_report_idle_and_active_connections(server_url):
+    transport = PooledTransport(max_connections_per_host=4)
+    async with httpx.AsyncClient(transport=transport) as client:
+        assert transport.stats()["connections"] == 0
+
+        # 본문을 읽으면 커넥션은 keep-alive 유휴 상태로 풀에 남음
+        response = await client.get(server_url)
+        assert response.text == "ok"
+        stats = transport.stats()
+        assert (stats["connections"], stats["idle_connections"], stats["active_connections"]) == (1, 1, 0)
+        assert stats["in_flight_requests"] == 0
+
+        # 본문을 다 읽고 닫기 전에는 사용 중
+        async with client.stream("GET", server_url) as streamed:
+            stats = transport.stats()
+            assert (stats["idle_connections"], stats["active_connections"]) == (0, 1)
+            assert stats["in_flight_requests"] == 1
+            await streamed.aread()
+
+        assert transport.stats()["idle_connections"] == 1
+
+
+async def test_pool_gauges_are_rendered(server_url, monkeypatch):
+    from app.core import http
+
+    transport = PooledTransport(max_connections_per_host=4)
+    monkeypatch.setattr(http, "_transport", transport)
+    async with httpx.AsyncClient(transport=transport) as client:
+        await client.get(server_url)
+        text = metrics.render_metrics()
+
+    assert 'formtion_outbound_http_pool{state="idle"} 1' in text
+    assert 'formtion_outbound_http_pool{state="active"} 0' in text
+    assert 'formtion_outbound_http_pool_waits_total{reason="host_limit"} 0' in text
@@ -0,0 +1,118 @@
+"""
+Notion 페이지 캐시 디스크 상한/만료 정리 테스트
+"""
+
+import gzip
+import os
+import time
+
+import pytest
+
+from app.services.notion_cache import NotionPageCache
+
+pytestmark = pytest.mark.anyio
+
+
+def make_cache(tmp_path, **overrides) -> NotionPageCache:
+    options = dict(
+        cache_dir=str(tmp_path),
+        soft_ttl=60,
+        hard_ttl=3600,
+        max_entries=100,
+        disk_max_bytes=10 * 1024 * 1024,
+        disk_max_files=100,
+    )
+    options.update(overrides)
+    return NotionPageCache(**options)
+
+
+def fetcher(body: bytes):
+    async def fetch() -> bytes:
+        return body
+
+    return fetch
+
+
+def disk_keys(tmp_path) -> set[str]:
+    return {name[: -len(".json.gz")] for name in os.listdir(tmp_path) if name.endswith(".json.gz")}
+
+
+def set_age(cache: NotionPageCache, key: str, seconds: float) -> None:
+    mtime = time.time() - seconds
+    os.utime(cache._path(key), (mtime, mtime))
+
+
+async def test_file_cap_evicts_oldest_mtime(tmp_path):
+    cache = make_cache(tmp_path, disk_max_files=10)
+    for index in range(10):
+        await cache.get(f"page-{index}", fetcher(b"{}"))
+        set_age(cache, f"page-{index}", 100 - index)  # page-0 이 가장 오래됨
+
+    await cache.get("page-new", fetcher(b"{}"))
+
+    # 11개 > 상한 10 → 상한의 90% (9개) 까지 오래된 파일부터 삭제
+    assert disk_keys(tmp_path) == {f"page-{index}" for index in range(2, 10)} | {"page-new"}
+    assert cache.stats["disk_evictions"] == 2
+    assert cache.snapshot()["disk_files"] == 9
+
+
+async def test_byte_cap_evicts_oldest_mtime(tmp_path):
+    body = os.urandom(1000)  # 압축되지 않는 본문
+    size = len(gzip.compress(body, compresslevel=6))
+    cache = make_cache(tmp_path, disk_max_bytes=size * 3)
+    for index in range(3):
+        await cache.get(f"page-{index}", fetcher(body))
+        set_age(cache, f"page-{index}", 100 - index)
+
+    await cache.get("page-new", fetcher(body))
+
+    assert disk_keys(tmp_path) == {"page-2", "page-new"}
+    assert cache.snapshot()["disk_bytes"] == size * 2
+
+
+async def test_prune_removes_expired_files_first(tmp_path):
+    cache = make_cache(tmp_path, disk_max_files=4)
+    for index in range(4):
+        await cache.get(f"page-{index}", fetcher(b"{}"))
+    # page-3 만 hard TTL 초과 (mtime 은 가장 최근이 아님에도 먼저 삭제되어야 함)
+    for index in range(3):
+        set_age(cache, f"page-{index}", 10 + index)
+    set_age(cache, "page-3", 7200)
+
+    await cache.get("page-new", fetcher(b"{}"))
+
+    assert "page-3" not in disk_keys(tmp_path)
+    assert cache.stats["disk_expired"] == 1
+    # 만료 파일 삭제 후 5 → 4개, 목표(3개)까지 가장 오래된 page-2 삭제
+    assert disk_keys(tmp_path) == {"page-0", "page-1", "page-new"}
+
+
+async def test_scan_picks_up_existing_files(tmp_path):
+    for index in range(5):
+        (tmp_path / f"old-{index}.json.gz").write_bytes(b"x")
+        mtime = time.time() - 1000 + index
+        os.utime(tmp_path / f"old-{index}.json.gz", (mtime, mtime))
+    (tmp_path / "unrelated.txt").write_bytes(b"x")
+
+    # 재시작 후 (이전 프로세스/다른 워커가 남긴 파일도 상한에 포함)
+    cache = make_cache(tmp_path, disk_max_files=5)
+    await cache.get("page-new", fetcher(b"{}"))
+
+    assert disk_keys(tmp_path) == {"old-2", "old-3", "old-4", "page-new"}
+    assert (tmp_path / "unrelated.txt").exists()
+
+
+async def test_expired_file_is_deleted_on_read(tmp_path):
+    cache = make_cache(tmp_path)
+    await cache.get("page", fetcher(b"old"))
+    set_age(cache, "page", 7200)
+
+    # 재시작 (메모리 캐시 없음) 후 조회
+    restarted = make_cache(tmp_path)
+    assert restarted._disk_read("page") is None
+    assert not os.path.exists(restarted._path("page"))
+    assert restarted.stats["disk_expired"] == 1
+
+    body = await restarted.get("page", fetcher(b"new"))
+    assert gzip.decompress(body) == b"new"
+    assert restarted.stats["misses"] == 1
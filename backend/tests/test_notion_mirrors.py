@@ -0,0 +1,167 @@
+"""
+Notion 미러 hedged request 테스트 (httpx.MockTransport 로 느린/실패하는 미러 재현)
+"""
+
+import asyncio
+import json
+import time
+
+import httpx
+import pytest
+from fastapi import HTTPException
+
+from app.api import notion
+from app.core.config import settings
+from app.services.notion_mirrors import MirrorPool
+
+pytestmark = pytest.mark.anyio
+
+PAGE_ID = "0123abcd-0123-4567-89ab-0123456789ab"
+RECORD_MAP = json.dumps({"block": {}}).encode("utf-8")
+
+
+class Mirrors:
+    """호스트별 동작을 정하는 MockTransport 핸들러 (지연, 상태 코드, 호출/취소 기록)"""
+
+    def __init__(self, **behaviours: tuple[float, int]):
+        self.behaviours = behaviours
+        self.started: dict[str, list[float]] = {host: [] for host in behaviours}
+        self.cancelled: list[str] = []
+        self.t0 = time.monotonic()
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.host.removesuffix(".test")
+        self.started[host].append(time.monotonic() - self.t0)
+        delay, status = self.behaviours[host]
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled.append(host)
+            raise
+        return httpx.Response(status, content=RECORD_MAP if status == 200 else b"error")
+
+
+@pytest.fixture
+def hedge_settings(monkeypatch):
+    monkeypatch.setattr(settings, "NOTION_HEDGE_ENABLED", True)
+    monkeypatch.setattr(settings, "NOTION_HEDGE_DEFAULT_DELAY_SECONDS", 1.0)
+    monkeypatch.setattr(settings, "NOTION_HEDGE_MIN_DELAY_SECONDS", 0.01)
+    monkeypatch.setattr(settings, "NOTION_HEDGE_MAX_DELAY_SECONDS", 3.0)
+    monkeypatch.setattr(settings, "NOTION_MIRROR_EWMA_ALPHA", 0.2)
+
+
+@pytest.fixture
+async def setup(monkeypatch, hedge_settings):
+    """미러 풀과 MockTransport 클라이언트를 notion API 모듈에 연결"""
+    clients = []
+
+    def install(mirrors: Mirrors) -> MirrorPool:
+        pool = MirrorPool([f"https://{host}.test/v1/page/{{page_id}}" for host in mirrors.behaviours])
+        client = httpx.AsyncClient(transport=httpx.MockTransport(mirrors))
+        clients.append(client)
+        monkeypatch.setattr(notion, "notion_mirror_pool", pool)
+        monkeypatch.setattr(notion, "get_http_client", lambda: client)
+        return pool
+
+    yield install
+    for client in clients:
+        await client.aclose()
+
+
+def prime(pool: MirrorPool, index: int, latency: float, count: int = 10) -> None:
+    """미러에 지연 표본을 쌓아 p95 를 정함"""
+    for _ in range(count):
+        pool.mirrors[index].record(latency, ok=True)
+
+
+async def fetch() -> bytes:
+    return await notion.fetch_record_map(PAGE_ID, "not found")
+
+
+async def test_hedge_fires_after_p95_delay_and_cancels_loser(setup):
+    mirrors = Mirrors(slow=(5.0, 200), fast=(0.0, 200))
+    pool = setup(mirrors)
+    prime(pool, 0, 0.1)  # 1순위 미러 p95 = 0.1초
+    assert pool.hedge_delay(pool.mirrors[0]) == pytest.approx(0.1)
+
+    started = time.monotonic()
+    assert await fetch() == RECORD_MAP
+    elapsed = time.monotonic() - started
+
+    # 1순위 미러를 먼저 호출하고, p95 가 지난 뒤에야 2순위 미러 호출
+    assert len(mirrors.started["slow"]) == 1
+    assert len(mirrors.started["fast"]) == 1
+    # (핸들러 시작 시각 기준이라 태스크 생성 시각과 약간 차이가 있음)
+    hedge_after = mirrors.started["fast"][0] - mirrors.started["slow"][0]
+    assert 0.09 <= hedge_after < 0.5
+    assert elapsed < 1.0  # 느린 미러(5초)를 기다리지 않음
+
+    # 진 요청은 취소되고, 취소 시점까지의 지연이 EWMA 에 반영됨
+    await asyncio.sleep(0)
+    assert mirrors.cancelled == ["slow"]
+    assert pool.mirrors[0].latency > 0.1
+
+
+async def test_no_hedge_when_primary_answers_within_p95(setup):
+    mirrors = Mirrors(primary=(0.02, 200), backup=(0.0, 200))
+    pool = setup(mirrors)
+    prime(pool, 0, 0.3)
+
+    assert await fetch() == RECORD_MAP
+
+    assert len(mirrors.started["primary"]) == 1
+    assert mirrors.started["backup"] == []
+    assert mirrors.cancelled == []
+
+
+async def test_failure_falls_through_without_waiting_for_hedge_delay(setup):
+    mirrors = Mirrors(broken=(0.0, 500), healthy=(0.0, 200))
+    pool = setup(mirrors)
+    prime(pool, 0, 2.0)  # hedge delay 2초 (실패 시에는 기다리지 않아야 함)
+    prime(pool, 1, 2.5)
+
+    started = time.monotonic()
+    assert await fetch() == RECORD_MAP
+    assert time.monotonic() - started < 0.5
+    assert pool.mirrors[0].errors == 1
+
+
+async def test_ewma_demotes_failing_mirror(setup):
+    mirrors = Mirrors(broken=(0.0, 500), healthy=(0.01, 200))
+    pool = setup(mirrors)
+    prime(pool, 0, 0.01)
+    prime(pool, 1, 0.2)  # p95 안에 응답하므로 hedge 없이 정상 미러만 호출되어야 함
+    assert [m.url for m in pool.ordered()][0].startswith("https://broken.test")
+
+    for _ in range(5):
+        assert await fetch() == RECORD_MAP
+
+    # 첫 실패로 오류율 EWMA 가 올라가 점수가 밀리고, 이후 요청은 정상 미러로만 감
+    assert len(mirrors.started["broken"]) == 1
+    assert len(mirrors.started["healthy"]) == 5
+    snapshot = notion.notion_mirror_pool.snapshot()
+    assert snapshot[0]["url"].startswith("https://healthy.test")
+    assert snapshot[1]["errors"] == 1
+    assert snapshot[1]["error_rate"] == pytest.approx(0.2)
+
+
+async def test_all_mirrors_failing_returns_502(setup):
+    mirrors = Mirrors(a=(0.0, 500), b=(0.0, 403))
+    setup(mirrors)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await fetch()
+
+    assert exc_info.value.status_code == 502
+    assert "403" in exc_info.value.detail
+
+
+async def test_not_found_is_not_an_error(setup):
+    mirrors = Mirrors(a=(0.0, 404), b=(0.0, 404))
+    pool = setup(mirrors)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await fetch()
+
+    assert exc_info.value.status_code == 404
+    assert all(mirror.errors == 0 for mirror in pool.mirrors)
@@ -0,0 +1,54 @@
+"""
+쿼리 프로파일러 테스트 (트랜잭션 제어 구문은 N+1 집계에서 제외)
+"""
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core import query_profiler
+from app.core.config import settings
+from app.core.database import configure_sqlite
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def profiled(tmp_path, monkeypatch):
+    """SQLite 운영 모드 설정 + 프로파일러를 연결한 엔진과 요청 프로파일"""
+    monkeypatch.setattr(settings, "QUERY_PROFILING_RAISE", True)
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/profile.db")
+    configure_sqlite(engine)
+    query_profiler.instrument_engine(engine)
+
+    profile = query_profiler.RequestQueryProfile({"method": "POST"})
+    token = query_profiler._profile.set(profile)
+    yield engine, profile
+    query_profiler._profile.reset(token)
+    await engine.dispose()
+
+
+async def test_transaction_control_statements_are_not_counted(profiled):
+    engine, profile = profiled
+    writer = engine.execution_options(sqlite_begin_immediate=True)
+
+    # BEGIN IMMEDIATE / SAVEPOINT / RELEASE / COMMIT 를 임계값보다 많이 실행
+    for _ in range(settings.QUERY_PROFILING_REPEAT_THRESHOLD + 2):
+        async with writer.begin() as conn:
+            async with conn.begin_nested():
+                pass
+
+    assert profile.total == 0
+    assert profile.counts == {}
+
+
+async def test_repeated_queries_are_still_detected(profiled):
+    engine, profile = profiled
+
+    with pytest.raises(query_profiler.QueryProfilingError):
+        async with engine.begin() as conn:
+            for index in range(settings.QUERY_PROFILING_REPEAT_THRESHOLD + 1):
+                await conn.execute(text(f"SELECT {index}"))
+
+    assert profile.total == settings.QUERY_PROFILING_REPEAT_THRESHOLD + 1
+    assert list(profile.counts) == ["SELECT ?"]
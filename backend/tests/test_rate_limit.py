@@ -0,0 +1,112 @@
+"""
+Rate limit 저장소 테스트 (프로세스 내 LRU / Redis fake)
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+import app.core.rate_limit as rate_limit_module
+from app.core.rate_limit import MemoryRateLimitStore, RateLimiter, RedisRateLimitStore
+from tests.fakes import FakeRedis
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """rate_limit 모듈의 시계 (monotonic/time 을 직접 지정)"""
+    now = SimpleNamespace(value=1000.0)
+    monkeypatch.setattr(
+        rate_limit_module,
+        "time",
+        SimpleNamespace(monotonic=lambda: now.value, time=lambda: now.value),
+    )
+    return now
+
+
+async def test_memory_store_keeps_active_counters_when_full():
+    store = MemoryRateLimitStore(max_keys=3)
+    await store.incr("active", 5, ttl=60)
+
+    # 다른 키를 계속 바꿔 보내도 사용 중인 카운터는 남아 있어야 함
+    for index in range(10):
+        await store.incr(f"cycling-{index}", 1, ttl=60)
+        await store.incr("active", 1, ttl=60)
+
+    assert len(store) == 3
+    assert await store.get("active") == 15
+    assert await store.get("cycling-0") == 0
+
+
+async def test_memory_store_evicts_least_recently_used():
+    store = MemoryRateLimitStore(max_keys=2)
+    await store.incr("a", 1, ttl=60)
+    await store.incr("b", 1, ttl=60)
+    await store.get("a")
+    await store.incr("c", 1, ttl=60)
+
+    assert await store.get("a") == 1
+    assert await store.get("b") == 0
+    assert await store.get("c") == 1
+
+
+async def test_memory_store_prunes_expired_keys_in_bounded_steps(clock):
+    store = MemoryRateLimitStore(max_keys=1000, prune_batch=2)
+    for index in range(10):
+        await store.incr(f"old-{index}", 1, ttl=60)
+
+    clock.value += 61
+    await store.incr("new", 1, ttl=60)
+
+    # 요청 하나당 만료 키는 최대 prune_batch 개만 정리
+    assert len(store) == 10 - 2 + 1
+    assert await store.get("old-9") == 0
+
+
+async def test_redis_store_sets_counter_and_expiry_in_one_transaction():
+    redis = FakeRedis()
+    store = RedisRateLimitStore(redis)
+
+    assert await store.incr("leads:ip:1.2.3.4:100", 1, ttl=120) == 1
+    assert await store.incr("leads:ip:1.2.3.4:100", 2, ttl=120) == 3
+
+    assert redis.transactions == 2
+    assert redis.keys_without_ttl() == []
+    assert 0 < await redis.ttl("formtion:ratelimit:leads:ip:1.2.3.4:100") <= 120
+
+
+async def test_redis_store_failed_exec_leaves_no_key_without_expiry():
+    redis = FakeRedis()
+    limiter = RateLimiter(RedisRateLimitStore(redis))
+    redis.fail_next_exec = True
+
+    # 저장소 장애 시 허용 (fail open), 만료 없는 키는 남지 않음
+    assert await limiter.hit("leads:ip:1.2.3.4", limit=1) is None
+    assert limiter.stats["errors"] == 1
+    assert redis.keys_without_ttl() == []
+
+
+async def test_limit_is_shared_across_workers():
+    redis = FakeRedis()
+    worker_a = RateLimiter(RedisRateLimitStore(redis))
+    worker_b = RateLimiter(RedisRateLimitStore(redis))
+
+    assert await worker_a.hit("leads:project:p1", limit=3) is None
+    assert await worker_b.hit("leads:project:p1", limit=3) is None
+    assert await worker_a.hit("leads:project:p1", limit=3) is None
+
+    retry_after = await worker_b.hit("leads:project:p1", limit=3)
+    assert retry_after is not None and retry_after >= 1
+
+
+async def test_sliding_window_counts_previous_window(clock):
+    redis = FakeRedis()
+    limiter = RateLimiter(RedisRateLimitStore(redis), window_seconds=60)
+    window = 1000
+    await redis.set(f"formtion:ratelimit:key:{window - 1}", 10, ex=120)
+
+    # 윈도우 절반 경과 → 직전 윈도우 10건 중 50% 포함
+    clock.value = window * 60 + 30
+    assert await limiter.hit("key", limit=6) is None  # 5 + 1
+    assert await limiter.hit("key", limit=6) is not None  # 5 + 2
@@ -172,33 +172,64 @@ export const cookie = {
   },
 }
 
-// Unlock 상태 관리
+// 언락 토큰 payload 확인 (서명은 서버가 리드 제출 시 확인)
+// 형식: base64url("project_id.lead_id.만료 unix 초.리드 태그") + "." + base64url(서명)
+const decodeUnlockToken = (token: string): { projectId: string; expiresAt: number } | undefined => {
+  try {
+    const [encodedPayload] = token.split('.')
+    const base64 = encodedPayload.replace(/-/g, '+').replace(/_/g, '/')
+    const [projectId, , expires] = atob(base64).split('.')
+    const expiresAt = Number(expires) * 1000
+    if (!projectId || !Number.isFinite(expiresAt)) return undefined
+    return { projectId, expiresAt }
+  } catch {
+    return undefined
+  }
+}
+
+// 토큰 도입 전 언락 기록 (unlocked_* 항목, 만료될 때까지 인정)
+const isLegacyUnlocked = (projectId: string): boolean => {
+  const unlocked = storage.get(`unlocked_${projectId}`)
+  if (unlocked === 'true' || unlocked === true) {
+    const expiresAt = storage.get<number>(`unlock_expires_${projectId}`)
+    if (expiresAt && Date.now() < expiresAt) {
+      return true
+    }
+  }
+  // Cookie 는 설정 시 만료 기간을 지정했으므로 존재 여부만 확인
+  return cookie.get(`unlocked_${projectId}`) === 'true'
+}
+
+// Unlock 상태 관리 (리드 제출 시 발급된 서명 토큰 또는 이전 언락 기록)
 export const unlockStorage = {
   isUnlocked: (projectId: string): boolean => {
-    // localStorage 확인
-    const unlocked = storage.get(`unlocked_${projectId}`)
-    if (unlocked === 'true' || unlocked === true) {
-      // 만료 확인
-      const expiresAt = storage.get<number>(`unlock_expires_${projectId}`)
-      if (expiresAt && Date.now() < expiresAt) {
-        return true
-      }
+    const token = unlockStorage.getToken(projectId)
+    const claims = token ? decodeUnlockToken(token) : undefined
+    if (claims && claims.projectId === projectId && Date.now() < claims.expiresAt) {
+      return true
     }
-    // Cookie 확인
-    return cookie.get(`unlocked_${projectId}`) === 'true'
+    return isLegacyUnlocked(projectId)
   },
-  setUnlocked: (projectId: string, durationDays: number = 30) => {
-    const expiresAt = Date.now() + durationDays * 24 * 60 * 60 * 1000
-    storage.set(`unlocked_${projectId}`, 'true')
+  setUnlocked: (projectId: string, unlockToken: string) => {
+    const claims = decodeUnlockToken(unlockToken)
+    const expiresAt = claims?.expiresAt ?? Date.now()
+    const durationDays = Math.max(1, Math.ceil((expiresAt - Date.now()) / (24 * 60 * 60 * 1000)))
     storage.set(`unlocked_at_${projectId}`, Date.now())
     storage.set(`unlock_expires_${projectId}`, expiresAt)
-    cookie.set(`unlocked_${projectId}`, 'true', durationDays)
+    storage.set(`unlock_token_${projectId}`, unlockToken)
+    // localStorage 를 쓸 수 없는 환경 (모바일 Safari 등) 폴백
+    cookie.set(`unlock_token_${projectId}`, unlockToken, durationDays)
+  },
+  getToken: (projectId: string): string | undefined => {
+    return storage.get<string>(`unlock_token_${projectId}`) || cookie.get(`unlock_token_${projectId}`)
   },
   clearUnlocked: (projectId: string) => {
     storage.remove(`unlocked_${projectId}`)
     storage.remove(`unlocked_at_${projectId}`)
     storage.remove(`unlock_expires_${projectId}`)
+    storage.remove(`unlock_token_${projectId}`)
     cookie.remove(`unlocked_${projectId}`)
+    cookie.remove(`unlock_token_${projectId}`)
   },
 }
 
@@ -120,7 +120,7 @@ export default function ViewerPage() {
         window.history.replaceState({}, '', window.location.pathname)
       }
 
-      // Unlock 상태 확인 - 로그인 사용자는 자동 언락
+      // Unlock 상태 확인 - 로그인 사용자는 자동 언락, 방문자는 서명 토큰의 프로젝트/만료를 로컬에서 확인
       const unlocked = isAuthenticated || unlockStorage.isUnlocked(response.data.project_id)
       setIsUnlocked(unlocked)
 
@@ -159,11 +159,12 @@ export default function ViewerPage() {
         consent_marketing: formData.consent_marketing,
         utm_params: extractUTMParams(searchParams),
         form_location: formLocation,
+        // 이미 언락한 방문자는 서버가 토큰만 확인하고 저장 없이 응답
+        unlock_token: unlockStorage.getToken(project.project_id),
       })
 
       // 성공 시 Unlock
-      const unlockDuration = project.form_config?.unlock_duration || 30
-      unlockStorage.setUnlocked(project.project_id, unlockDuration)
+      unlockStorage.setUnlocked(project.project_id, response.data.unlock_token)
       setIsUnlocked(true)
       setShowModal(false)
       // 옵션 선택 화면 표시